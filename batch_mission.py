@@ -4,23 +4,284 @@ Reads flight areas from config file and executes missions automatically
 """
 import yaml
 import json
+import os
+import pickle
+import asyncio
+import functools
+import itertools
 import sys
 import time
+import logging
+import queue
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from threading import Thread, local
 from mission_control.orchestrator import MissionOrchestrator
 from scouter_drone.executor import ScouterDroneSimulator
 from firefighter_drone.executor import FirefighterDroneSimulator
 from utils.logger import get_logger, setup_logging
 
+# libyaml-backed loader is much faster; fall back to pure Python if missing
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode an object to JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        # orjson would write dates as strings; refuse them like json does so
+        # a cached config never comes back with different types
+        return orjson.dumps(obj, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _cache_codec(cache_format: str):
+    """Return (suffix, loads, dumps) for a config cache format"""
+    if cache_format == 'pickle':
+        return '.cache.pkl', pickle.loads, lambda obj: pickle.dumps(obj, protocol=5)
+    if cache_format == 'msgpack' and MSGPACK_AVAILABLE:
+        return ('.cache.msgpack',
+                lambda data: msgpack.unpackb(data, raw=False),
+                lambda obj: msgpack.packb(obj, use_bin_type=True))
+    return '.cache.json', _json_loads, _json_dumps
+
+
 logger = get_logger()
 
+
+class _LineQueueWriter:
+    """
+    stdout stand-in for parallel runs: each thread's output is cut into whole
+    lines and handed to the output writer, so print() calls from orchestrator
+    threads can't interleave mid-line
+    """
+    def __init__(self, out_q, stream):
+        self._out_q = out_q
+        self._stream = stream
+        self._local = local()
+    
+    def write(self, text):
+        pending = getattr(self._local, 'pending', '') + text
+        lines, newline, rest = pending.rpartition('\n')
+        if newline:
+            self._out_q.put_nowait(lines + newline)
+        self._local.pending = rest
+        return len(text)
+    
+    def flush(self):
+        pending = getattr(self._local, 'pending', '')
+        if pending:
+            self._out_q.put_nowait(pending)
+            self._local.pending = ''
+    
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno() ... come from the real stream
+        return getattr(self._stream, name)
+
+
+def _init_simulator_worker(log_level):
+    """ProcessPoolExecutor initializer - child processes start with default logging"""
+    # Forked children inherit the parent's queue handler but not its listener thread
+    get_logger().stop_queue_listener()
+    setup_logging(level=log_level)
+    # ...and the logging context of whichever mission spawned them
+    get_logger().clear_context()
+
+
+def _run_scout_simulation(task_config, drone_id, task_id):
+    """Run an SD mission simulation; top-level so it can run in a worker process"""
+    token = logger.set_context(task_id=task_id, drone_id=drone_id, module='batch_mission')
+    sd_simulator = ScouterDroneSimulator(task_config, drone_id)
+    try:
+        return sd_simulator.execute_mission()
+    finally:
+        sd_simulator.cleanup()
+        logger.reset_context(token)
+
+
+def _run_suppression_simulation(task_config, drone_id, task_id, target_lat, target_lon):
+    """Run an FD suppression simulation; top-level so it can run in a worker process"""
+    token = logger.set_context(task_id=task_id, drone_id=drone_id, module='FD_suppression')
+    fd_simulator = FirefighterDroneSimulator(task_config, drone_id)
+    try:
+        return fd_simulator.execute_suppression_mission(target_lat, target_lon)
+    finally:
+        fd_simulator.cleanup()
+        logger.reset_context(token)
+
+
+# Only these top-level sections of a mission areas file are used
+_CONFIG_SECTIONS = ('mission_areas', 'execution')
+
+
+def _load_yaml_sections(stream, sections=_CONFIG_SECTIONS):
+    """
+    Parse YAML from a stream, constructing Python objects only for the
+    wanted top-level sections
+
+    libyaml reads the file incrementally into a node tree; unused sections
+    are never turned into dicts/lists. Falls back to a full construct when
+    the document root isn't a plain mapping.
+    """
+    loader = _Loader(stream)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return {}
+        if not isinstance(root, yaml.MappingNode) or any(
+                key_node.tag == 'tag:yaml.org,2002:merge' for key_node, _ in root.value):
+            return loader.construct_document(root)
+        
+        config = {}
+        for key_node, value_node in root.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value in sections:
+                config[key_node.value] = loader.construct_object(value_node, deep=True)
+        return config
+    finally:
+        loader.dispose()
+
+
+class _SchemaMismatch(Exception):
+    """Document doesn't fit the mission-areas shape the fast parser handles"""
+
+
+# Shared resolver/constructor for plain scalars. Safe across threads: resolve()
+# only reads the class-level implicit resolver table, and the scalar constructors
+# reached from _plain_scalar (null/bool/int/float/timestamp/str) read the node
+# they're given and never touch the loader's parse state. Results are immutable,
+# so the lru_cache can hand the same object to every caller.
+_SCALAR_LOADER = yaml.SafeLoader('')
+
+
+@functools.lru_cache(maxsize=4096)
+def _plain_scalar(value):
+    """Resolve an untagged plain scalar exactly like SafeLoader would"""
+    node = yaml.ScalarNode(_SCALAR_LOADER.resolve(yaml.ScalarNode, value, (True, False)), value)
+    constructor = _SCALAR_LOADER.yaml_constructors.get(node.tag)
+    if constructor is None:  # e.g. merge keys
+        raise _SchemaMismatch(value)
+    return constructor(_SCALAR_LOADER, node)
+
+
+def _scalar_value(event):
+    if not isinstance(event, yaml.ScalarEvent) or event.anchor or not (event.implicit[0] or event.implicit[1]):
+        raise _SchemaMismatch(event)
+    if event.style:  # Quoted/block scalars are always strings
+        return event.value
+    return _plain_scalar(event.value)
+
+
+def _expect(events, event_type):
+    event = next(events)
+    if not isinstance(event, event_type) or getattr(event, 'anchor', None):
+        raise _SchemaMismatch(event)
+    return event
+
+
+def _scalar_mapping(events, nested_key=None):
+    """Parse a mapping of scalars; values under nested_key are themselves such mappings"""
+    _expect(events, yaml.MappingStartEvent)
+    result = {}
+    for event in events:
+        if isinstance(event, yaml.MappingEndEvent):
+            return result
+        key = _scalar_value(event)
+        if key == nested_key:
+            result[key] = _corner_mapping(events)
+        else:
+            result[key] = _scalar_value(next(events))
+    raise _SchemaMismatch('unterminated mapping')
+
+
+def _corner_mapping(events):
+    """corners: {corner_x: {latitude: .., longitude: ..}, ...}"""
+    _expect(events, yaml.MappingStartEvent)
+    result = {}
+    for event in events:
+        if isinstance(event, yaml.MappingEndEvent):
+            return result
+        result[_scalar_value(event)] = _scalar_mapping(events)
+    raise _SchemaMismatch('unterminated mapping')
+
+
+def _parse_mission_areas(stream):
+    """
+    Schema-specialized parse of a mission areas file
+
+    Walks the libyaml event stream and builds only the mission_areas and
+    execution sections, with no generic node tree. Anything outside the known
+    shape (anchors, tags, nested values in areas, extra documents) raises
+    _SchemaMismatch so the caller can fall back to the generic loader.
+    """
+    events = yaml.parse(stream, Loader=_Loader)
+    _expect(events, yaml.StreamStartEvent)
+    _expect(events, yaml.DocumentStartEvent)
+    _expect(events, yaml.MappingStartEvent)
+    
+    config = {}
+    for event in events:
+        if isinstance(event, yaml.MappingEndEvent):
+            break
+        key = _scalar_value(event)
+        if key == 'mission_areas':
+            _expect(events, yaml.SequenceStartEvent)
+            areas = []
+            for item in events:
+                if isinstance(item, yaml.SequenceEndEvent):
+                    break
+                if not isinstance(item, yaml.MappingStartEvent) or item.anchor:
+                    raise _SchemaMismatch(item)
+                areas.append(_scalar_mapping(itertools.chain((item,), events), nested_key='corners'))
+            config[key] = areas
+        elif key == 'execution':
+            config[key] = _scalar_mapping(events)
+        else:
+            raise _SchemaMismatch(key)  # Unknown section - let the generic loader decide
+    
+    _expect(events, yaml.DocumentEndEvent)
+    _expect(events, yaml.StreamEndEvent)
+    return config
+
+
+def _load_mission_areas_yaml(stream):
+    """Load a mission areas YAML stream, preferring the schema-specialized parser"""
+    try:
+        return _parse_mission_areas(stream)
+    except (_SchemaMismatch, StopIteration):
+        stream.seek(0)
+        return _load_yaml_sections(stream)
+
+
+_REQUIRED_FIELDS = ('name', 'priority', 'corners')
+_REQUIRED_CORNERS = ('corner_a', 'corner_b', 'corner_c', 'corner_d')
+
 class BatchMissionPlanner:
     """
     Batch mission execution with parallel processing
     
-    Handles multiple missions simultaneously using ThreadPoolExecutor.
+    Handles multiple missions concurrently on an asyncio event loop.
     Added this after realizing sequential execution was too slow for
     testing large mission sets.
     
@@ -31,8 +292,13 @@ class BatchMissionPlanner:
     def __init__(self, config_file='config/mission_areas.yaml', simulate_fires=False):
         self.config_file = config_file
         self.orchestrator = MissionOrchestrator()
-        self.print_lock = Lock()
+        # Share the orchestrator's engine/pool rather than building a new one per call
+        self._db_manager = self.orchestrator.db_manager
+        self._out_q = None  # Set while the parallel output writer is running
+        self._out_thread = None
+        self._real_stdout = None
         self.simulate_fires = simulate_fires
+        self._sim_pool = None  # Set while a parallel batch is running
         self.load_mission_areas()
     
     def load_mission_areas(self):
@@ -43,15 +309,16 @@ class BatchMissionPlanner:
             raise FileNotFoundError(f"Mission areas file not found: {self.config_file}")
         
         if config_path.suffix in ['.yaml', '.yml']:
-            with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = self._load_yaml_cached(config_path)
         elif config_path.suffix == '.json':
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = _json_loads(config_path.read_bytes())
         else:
             raise ValueError(f"Unsupported file format: {config_path.suffix}. Use .yaml, .yml, or .json")
         
         self.mission_areas = self.config.get('mission_areas', [])
+        for area in self.mission_areas:
+            self._prepare_area(area)
+        self._compute_area_centers()
         
         default_settings = {
             'mode': 'sequential',
@@ -71,18 +338,94 @@ class BatchMissionPlanner:
             self.execution_settings['delay_between_missions_sec'] = execution_config.get('delay_between_missions_sec', self.execution_settings['delay_between_missions_sec'])
         
         print(f"[OK] Loaded {len(self.mission_areas)} mission area(s) from {self.config_file}")
+
+    def _load_yaml_cached(self, config_path):
+        """
+        Load YAML config, reusing a parsed sidecar cache when it is up to date
+        
+        The cache format comes from mission_planning.execution.cache_format in
+        the main config: json (default), pickle or msgpack.
+        """
+        cache_format = (self.orchestrator.config.get('mission_planning', {})
+                        .get('execution', {}).get('cache_format', 'json'))
+        suffix, cache_loads, cache_dumps = _cache_codec(cache_format)
+        cache_path = config_path.with_suffix(config_path.suffix + suffix)
+
+        if cache_path.exists() and cache_path.stat().st_mtime >= config_path.stat().st_mtime:
+            # Never unpickle a file someone else could have planted
+            trusted = (suffix != '.cache.pkl' or not hasattr(os, 'getuid')
+                       or cache_path.stat().st_uid == os.getuid())
+            if trusted:
+                try:
+                    return cache_loads(cache_path.read_bytes())
+                except Exception:
+                    pass  # Corrupt or unreadable cache - fall through and re-parse
+
+        with open(config_path, 'r') as f:
+            config = _load_mission_areas_yaml(f)
+
+        # Cache is best effort - skip it for read-only dirs or values the
+        # format can't represent (e.g. YAML dates in JSON)
+        try:
+            cache_path.write_bytes(cache_dumps(config))
+        except Exception:
+            pass
+
+        return config
+
+    def _prepare_area(self, area):
+        """Validate an area once and precompute the dicts each mission run needs"""
+        valid, msg = self.validate_area(area)
+        area['_validation'] = (valid, msg)
+        if not valid:
+            return
+        
+        # Corners as ((lat, lon),) * 4 in A-B-C-D order; everything else derives from this
+        corners = area['corners']
+        area['_corners'] = tuple(
+            (corners[name]['latitude'], corners[name]['longitude']) for name in _REQUIRED_CORNERS
+        )
+        (a_lat, a_lon), (b_lat, b_lon), (c_lat, c_lon), (d_lat, d_lon) = area['_corners']
+        
+        area['_prepared_flight_area'] = {
+            name: {'latitude': lat, 'longitude': lon}
+            for name, (lat, lon) in zip(_REQUIRED_CORNERS, area['_corners'])
+        }
+        area['_prepared_task_config'] = {
+            'corner_a_lat': a_lat,
+            'corner_a_lon': a_lon,
+            'corner_b_lat': b_lat,
+            'corner_b_lon': b_lon,
+            'corner_c_lat': c_lat,
+            'corner_c_lon': c_lon,
+            'corner_d_lat': d_lat,
+            'corner_d_lon': d_lon,
+            'cruise_altitude_m': area.get('altitude_m', 15.24),
+            'cruise_speed_ms': area.get('speed_ms', 5.0),
+            'overlap_percent': area.get('overlap_percent', 20)
+        }
+    
+    def _compute_area_centers(self):
+        """Compute every valid area's center (midpoint of A-C) in one vectorized pass"""
+        prepared = [area for area in self.mission_areas if '_corners' in area]
+        if not prepared:
+            self._corners_arr = np.empty((0, 4, 2))
+            self._centers = np.empty((0, 2))
+            return
+        
+        self._corners_arr = np.array([area['_corners'] for area in prepared], dtype=np.float64)
+        self._centers = 0.5 * (self._corners_arr[:, 0] + self._corners_arr[:, 2])
+        for area, (center_lat, center_lon) in zip(prepared, self._centers.tolist()):
+            area['_center'] = (center_lat, center_lon)
     
     def validate_area(self, area):
         """Validate flight area coordinates"""
-        required_fields = ['name', 'priority', 'corners']
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in area:
                 return False, f"Missing field: {field}"
         
         corners = area['corners']
-        required_corners = ['corner_a', 'corner_b', 'corner_c', 'corner_d']
-        
-        for corner in required_corners:
+        for corner in _REQUIRED_CORNERS:
             if corner not in corners:
                 return False, f"Missing {corner}"
             if 'latitude' not in corners[corner] or 'longitude' not in corners[corner]:
@@ -123,7 +466,7 @@ class BatchMissionPlanner:
             print(f"[MISSION {i+1}/{len(self.mission_areas)}] {area.get('name', 'Unnamed')}")
             print(f"{'='*70}")
             
-            valid, msg = self.validate_area(area)
+            valid, msg = area['_validation']
             if not valid:
                 print(f"[FAIL] Invalid area: {msg}")
                 results.append({'name': area.get('name'), 'success': False, 'error': msg})
@@ -148,149 +491,224 @@ class BatchMissionPlanner:
         return results
     
     def _execute_parallel(self):
-        """Execute missions in parallel using thread pool"""
+        """
+        Execute missions concurrently on an asyncio event loop
+        
+        At most parallel_max_workers missions are in flight at once. Blocking
+        orchestrator/DB calls run in threads and simulators in a process pool,
+        so concurrent missions overlap their I/O instead of queueing behind
+        each other.
+        """
         results = []
-        max_workers = self.execution_settings['parallel_max_workers']
+        max_workers = max(1, self.execution_settings['parallel_max_workers'])
         dispatch_delay = self.execution_settings['task_dispatch_delay_sec']
         
-        print(f"\n[PARALLEL] Dispatching tasks with {dispatch_delay}s delay between dispatches...")
+        print(f"\n[PARALLEL] Dispatching {max_workers} task(s) at once, {dispatch_delay}s delay when all workers are busy...")
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
-            
-            for i, area in enumerate(self.mission_areas):
-                valid, msg = self.validate_area(area)
-                if not valid:
-                    with self.print_lock:
-                        print(f"[FAIL] Invalid area {area.get('name')}: {msg}")
-                    results.append({'name': area.get('name'), 'success': False, 'error': msg})
-                    continue
-                
-                future = executor.submit(self._execute_mission_wrapper, area, i+1)
-                futures[future] = area
-                
-                with self.print_lock:
-                    print(f"[DISPATCH] Task {i+1}/{len(self.mission_areas)}: {area.get('name', 'Unnamed')}")
-                
-                if i < len(self.mission_areas) - 1:
-                    time.sleep(dispatch_delay)
-            
-            print(f"\n[PARALLEL] All tasks dispatched. Waiting for completion...\n")
+        pending = []
+        for i, area in enumerate(self.mission_areas):
+            valid, msg = area['_validation']
+            if not valid:
+                print(f"[FAIL] Invalid area {area.get('name')}: {msg}")
+                results.append({'name': area.get('name'), 'success': False, 'error': msg})
+                continue
             
-            for future in as_completed(futures):
-                area = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    with self.print_lock:
-                        status = "[OK]" if result.get('success') else "[FAIL]"
-                        print(f"{status} Mission '{result.get('name')}' completed")
-                        if result.get('success'):
-                            print(f"      Task: {result.get('task_id')}, Drone: {result.get('drone_id')}, Hotspots: {result.get('hotspots')}")
-                        else:
-                            print(f"      Error: {result.get('error')}")
-                
-                except Exception as e:
-                    with self.print_lock:
-                        print(f"[FAIL] Mission '{area.get('name')}' failed: {e}")
-                    results.append({'name': area.get('name'), 'success': False, 'error': str(e)})
+            pending.append((area, i + 1))
+            print(f"[DISPATCH] Task {i+1}/{len(self.mission_areas)}: {area.get('name', 'Unnamed')}")
+        
+        # Workers only enqueue output; background threads do the actual writes
+        self._start_output_writer()
+        logger.start_queue_listener()
+        
+        # Simulators are CPU-bound Python; run them in processes so the GIL
+        # doesn't serialize workers. DB/orchestrator work stays in this process.
+        log_level = logging.getLevelName(logger.logger.level)
+        self._sim_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                             initializer=_init_simulator_worker,
+                                             initargs=(log_level,))
+        try:
+            results.extend(asyncio.run(self._gather_missions(pending, max_workers, dispatch_delay)))
+        finally:
+            self._sim_pool.shutdown()
+            self._sim_pool = None
+            logger.stop_queue_listener()
+            self._stop_output_writer()
+        
+        return results
+    
+    async def _gather_missions(self, pending, max_workers, dispatch_delay):
+        """
+        Run all pending missions, bounded by a semaphore of max_workers slots
+        
+        The first wave starts immediately; the dispatch delay only applies to
+        missions that had to wait for a free slot, so total dispatch time is
+        O(N / workers * delay). Results are reported from a done callback as
+        each mission finishes.
+        """
+        slots = asyncio.Semaphore(max_workers)
+        results = []
         
+        async def run(area, mission_num):
+            waited = slots.locked()
+            async with slots:
+                if waited and dispatch_delay > 0:
+                    await asyncio.sleep(dispatch_delay)
+                return await self._execute_mission_wrapper(area, mission_num)
+        
+        tasks = []
+        for area, mission_num in pending:
+            task = asyncio.create_task(run(area, mission_num))
+            task.add_done_callback(functools.partial(self._on_mission_done, area, results))
+            tasks.append(task)
+        
+        self._emit(f"\n[PARALLEL] All tasks dispatched. Waiting for completion...\n")
+        await asyncio.wait(tasks)
         return results
     
-    def _execute_mission_wrapper(self, area, mission_num):
-        """Wrapper for parallel execution with thread-safe printing"""
+    def _on_mission_done(self, area, results, task):
+        """Record and report a finished mission task"""
+        if task.cancelled():
+            result = {'name': area.get('name'), 'success': False, 'error': 'cancelled'}
+        elif task.exception() is not None:
+            result = {'name': area.get('name'), 'success': False, 'error': str(task.exception())}
+        else:
+            result = task.result()
+        results.append(result)
+        
+        status = "[OK]" if result.get('success') else "[FAIL]"
+        lines = [f"{status} Mission '{result.get('name')}' completed"]
+        if result.get('success'):
+            lines.append(f"      Task: {result.get('task_id')}, Drone: {result.get('drone_id')}, Hotspots: {result.get('hotspots')}")
+        else:
+            lines.append(f"      Error: {result.get('error')}")
+        self._emit("\n".join(lines))
+    
+    def _start_output_writer(self):
+        """Start a background thread that owns stdout for status lines"""
+        self._out_q = queue.SimpleQueue()
+        self._real_stdout = sys.stdout
+        self._out_thread = Thread(target=self._write_output, args=(self._out_q, self._real_stdout),
+                                  name="batch-output", daemon=True)
+        self._out_thread.start()
+        # Plain print() calls (orchestrator, simulators) go through the writer too
+        sys.stdout = _LineQueueWriter(self._out_q, self._real_stdout)
+    
+    def _stop_output_writer(self):
+        """Flush pending status lines and stop the writer thread"""
+        if self._out_q is None:
+            return
+        sys.stdout.flush()
+        sys.stdout = self._real_stdout
+        self._out_q.put(None)
+        self._out_thread.join()
+        self._out_q = None
+    
+    @staticmethod
+    def _write_output(out_q, stream):
+        while True:
+            msg = out_q.get()
+            if msg is None:
+                break
+            stream.write(msg)
+            stream.flush()
+    
+    def _emit(self, msg):
+        """Print a status line without blocking on stdout when the writer is running"""
+        out_q = self._out_q
+        if out_q is None:
+            print(msg)
+        else:
+            out_q.put_nowait(msg + "\n")
+    
+    async def _execute_mission_wrapper(self, area, mission_num):
+        """Wrapper for parallel execution that turns failures into results"""
         try:
-            with self.print_lock:
-                print(f"\n[START] Mission {mission_num}: {area.get('name', 'Unnamed')}")
+            self._emit(f"\n[START] Mission {mission_num}: {area.get('name', 'Unnamed')}")
             
-            result = self.execute_single_mission(area, mission_num)
+            result = await self.execute_single_mission_async(area, mission_num)
             return result
         except Exception as e:
             return {'name': area.get('name'), 'success': False, 'error': str(e)}
     
-    def execute_single_mission(self, area, mission_num=1, simulate_fire=False):
-        """Execute a single mission"""
-        corners = area['corners']
-        flight_area = {
-            'corner_a': {'latitude': corners['corner_a']['latitude'], 'longitude': corners['corner_a']['longitude']},
-            'corner_b': {'latitude': corners['corner_b']['latitude'], 'longitude': corners['corner_b']['longitude']},
-            'corner_c': {'latitude': corners['corner_c']['latitude'], 'longitude': corners['corner_c']['longitude']},
-            'corner_d': {'latitude': corners['corner_d']['latitude'], 'longitude': corners['corner_d']['longitude']}
-        }
-        
-        task = self.orchestrator.create_scout_task(
+    def _run_simulation(self, func, *args):
+        """Run a simulator function in the process pool if one is active, else inline"""
+        if self._sim_pool is None:
+            return func(*args)
+        return self._sim_pool.submit(func, *args).result()
+    
+    async def _run_simulation_async(self, func, *args):
+        """Await a simulator function without blocking the event loop"""
+        if self._sim_pool is None:
+            return await asyncio.to_thread(func, *args)
+        return await asyncio.get_running_loop().run_in_executor(self._sim_pool, func, *args)
+    
+    def execute_single_mission(self, area, mission_num=1):
+        """Execute a single mission (blocking)"""
+        return asyncio.run(self.execute_single_mission_async(area, mission_num))
+    
+    async def execute_single_mission_async(self, area, mission_num=1):
+        """Execute a single mission; blocking orchestrator calls run in threads"""
+        orchestrator = self.orchestrator
+        flight_area = area['_prepared_flight_area']
+        task_config = area['_prepared_task_config']
+        
+        task = await asyncio.to_thread(
+            orchestrator.create_scout_task,
             flight_area=flight_area,
             priority=area.get('priority', 'medium')
         )
         
         task_id = task['task_id']
-        drone = self.orchestrator.assign_task_to_drone(task_id)
+        drone = await asyncio.to_thread(orchestrator.assign_task_to_drone, task_id)
         if not drone:
             raise Exception("No available drones")
         
         drone_id = drone['drone_id']
         
         # Set logging context for this mission
-        logger.set_context(task_id=task_id, drone_id=drone_id, module='batch_mission')
+        token = logger.set_context(task_id=task_id, drone_id=drone_id, module='batch_mission')
         
-        with self.print_lock:
+        try:
             logger.info(f"[OK] Created and assigned task")
-        
-        self.orchestrator.start_task_execution(task_id)
-        
-        task_config = {
-            'corner_a_lat': flight_area['corner_a']['latitude'],
-            'corner_a_lon': flight_area['corner_a']['longitude'],
-            'corner_b_lat': flight_area['corner_b']['latitude'],
-            'corner_b_lon': flight_area['corner_b']['longitude'],
-            'corner_c_lat': flight_area['corner_c']['latitude'],
-            'corner_c_lon': flight_area['corner_c']['longitude'],
-            'corner_d_lat': flight_area['corner_d']['latitude'],
-            'corner_d_lon': flight_area['corner_d']['longitude'],
-            'cruise_altitude_m': area.get('altitude_m', 15.24),
-            'cruise_speed_ms': area.get('speed_ms', 5.0),
-            'overlap_percent': area.get('overlap_percent', 20)
-        }
-        
-        sd_simulator = ScouterDroneSimulator(task_config, drone_id)
-        hotspots, data_path = sd_simulator.execute_mission()
-        sd_simulator.cleanup()
-        
-        # Simulate fire detection if flag is set
-        if self.simulate_fires and hotspots == 0:
-            with self.print_lock:
-                logger.info(f"[FIRE] Simulating fire detection")
             
-            # Inject a simulated fire detection
-            center_lat = (flight_area['corner_a']['latitude'] + flight_area['corner_c']['latitude']) / 2
-            center_lon = (flight_area['corner_a']['longitude'] + flight_area['corner_c']['longitude']) / 2
+            await asyncio.to_thread(orchestrator.start_task_execution, task_id)
             
-            detection = self.orchestrator.register_fire_detection(
-                task_id=task_id,
-                drone_id=drone_id,
-                latitude=center_lat,
-                longitude=center_lon,
-                temperature_c=65.5,
-                confidence=0.92,
-                detection_method='thermal_simulated'
+            hotspots, data_path = await self._run_simulation_async(
+                _run_scout_simulation, task_config, drone_id, task_id
             )
             
-            with self.print_lock:
+            # Simulate fire detection if flag is set
+            if self.simulate_fires and hotspots == 0:
+                logger.info(f"[FIRE] Simulating fire detection")
+                
+                # Inject a simulated fire detection
+                center_lat, center_lon = area['_center']
+                
+                await asyncio.to_thread(
+                    orchestrator.register_fire_detection,
+                    task_id=task_id,
+                    drone_id=drone_id,
+                    latitude=center_lat,
+                    longitude=center_lon,
+                    temperature_c=65.5,
+                    confidence=0.92,
+                    detection_method='thermal_simulated'
+                )
+                
                 logger.info(f"[FIRE] Fire registered at ({center_lat:.6f}, {center_lon:.6f})")
-            
-            hotspots = 1
-            
-            # Wait a bit for FD dispatch and then execute FD mission
-            import time
-            time.sleep(1)
-            
-            # Execute FD suppression mission if one was dispatched
-            self._execute_fd_suppression_missions()
+                
+                hotspots = 1
+                
+                # Wait for FD dispatch to settle and then execute FD mission
+                await asyncio.to_thread(orchestrator.wait_for_fd_dispatch, task_id, 5)
+                
+                # Execute FD suppression mission if one was dispatched
+                await asyncio.to_thread(self._execute_fd_suppression_missions)
+        finally:
+            # Restore the caller's context before completing
+            logger.reset_context(token)
         
-        # Clear context before completing
-        logger.clear_context()
-        self.orchestrator.complete_task(task_id, hotspots, data_path)
+        await asyncio.to_thread(orchestrator.complete_task, task_id, hotspots, data_path)
         
         return {
             'name': area.get('name'),
@@ -302,63 +720,79 @@ class BatchMissionPlanner:
         }
     
     def _execute_fd_suppression_missions(self):
-        """Execute any pending FD suppression missions"""
-        from database import DatabaseManager, Task, Drone, TaskState, DroneState
+        """Execute any pending FD suppression missions concurrently"""
+        from sqlalchemy.orm import joinedload
+        from database import Task, TaskState
         
-        db_manager = DatabaseManager()
+        db_manager = self._db_manager
         session = db_manager.get_session()
         
         try:
-            # Find all assigned suppression tasks
-            fd_tasks = session.query(Task).filter(
+            # Find all assigned suppression tasks, loading their drones in the same query
+            fd_tasks = session.query(Task).options(joinedload(Task.drone)).filter(
                 Task.task_type == 'suppress',
                 Task.state == TaskState.ASSIGNED
             ).all()
             
-            for task in fd_tasks:
-                drone = session.query(Drone).get(task.drone_id)
-                if not drone:
-                    continue
-                
-                # Set logging context for FD mission
-                logger.set_context(task_id=task.task_id, drone_id=drone.drone_id, module='FD_suppression')
-                
-                with self.print_lock:
-                    logger.info(f"[FD] Starting suppression mission")
-                
-                # Start task execution
-                self.orchestrator.start_task_execution(task.task_id)
-                
-                # Execute FD mission simulation
-                target_lat = (task.corner_a_lat + task.corner_c_lat) / 2
-                target_lon = (task.corner_a_lon + task.corner_c_lon) / 2
-                
-                task_config = {
-                    'suppression_duration_sec': 30,
-                    'approach_altitude_m': task.cruise_altitude_m or 12.0
-                }
-                
-                fd_simulator = FirefighterDroneSimulator(task_config, drone.drone_id)
-                success, data_path = fd_simulator.execute_suppression_mission(target_lat, target_lon)
-                fd_simulator.cleanup()
-                
-                # Complete the suppression task
-                if success:
-                    self.orchestrator.complete_suppression_task(task.task_id, data_path)
-                    with self.print_lock:
-                        logger.info(f"[OK] Suppression completed")
-                else:
-                    with self.print_lock:
-                        logger.error(f"[FAIL] Suppression failed")
-                
-                # Clear context
-                logger.clear_context()
-        
+            # Copy out plain values so workers never touch this session
+            missions = [
+                (task.task_id, task.drone.drone_id,
+                 (task.corner_a_lat + task.corner_c_lat) / 2,
+                 (task.corner_a_lon + task.corner_c_lon) / 2,
+                 task.cruise_altitude_m or 12.0)
+                for task in fd_tasks if task.drone
+            ]
+            session.expunge_all()
         except Exception as e:
-            with self.print_lock:
-                logger.error(f"[FAIL] Error executing FD missions: {e}")
+            logger.error(f"[FAIL] Error executing FD missions: {e}")
+            return
         finally:
             db_manager.close_session(session)
+        
+        if not missions:
+            return
+        
+        try:
+            # Start all of them with a single bulk state update
+            self.orchestrator.start_tasks_execution([mission[0] for mission in missions])
+        except Exception as e:
+            logger.error(f"[FAIL] Error executing FD missions: {e}")
+            return
+        
+        max_workers = max(1, min(len(missions), self.execution_settings['parallel_max_workers']))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._run_single_fd, missions))
+    
+    def _run_single_fd(self, mission):
+        """Run one FD suppression mission and record its outcome"""
+        task_id, drone_id, target_lat, target_lon, approach_altitude_m = mission
+        
+        # Set logging context for FD mission
+        token = logger.set_context(task_id=task_id, drone_id=drone_id, module='FD_suppression')
+        
+        try:
+            logger.info(f"[FD] Starting suppression mission")
+            
+            task_config = {
+                'suppression_duration_sec': 30,
+                'approach_altitude_m': approach_altitude_m
+            }
+            
+            success, data_path = self._run_simulation(
+                _run_suppression_simulation, task_config, drone_id, task_id, target_lat, target_lon
+            )
+            
+            # Complete the suppression task
+            if success:
+                self.orchestrator.complete_suppression_task(task_id, data_path)
+                logger.info(f"[OK] Suppression completed")
+            else:
+                logger.error(f"[FAIL] Suppression failed")
+        
+        except Exception as e:
+            logger.error(f"[FAIL] Error executing FD mission: {e}")
+        finally:
+            logger.reset_context(token)
     
     def print_summary(self, results):
         """Print execution summary"""
@@ -396,7 +830,7 @@ def main():
     parser.add_argument('--workers', type=int,
                         help='Max parallel workers (parallel mode only)')
     parser.add_argument('--dispatch-delay', type=float,
-                        help='Delay between task dispatches in seconds (parallel mode)')
+                        help='Delay before a busy worker takes its next task, in seconds (parallel mode)')
     parser.add_argument('--mission-delay', type=float,
                         help='Delay between missions in seconds (sequential mode)')
     parser.add_argument('--log-level', default='INFO',
@@ -425,7 +859,7 @@ def main():
         if args.validate_only:
             print("\n[OK] Configuration validated OK")
             for i, area in enumerate(planner.mission_areas):
-                valid, msg = planner.validate_area(area)
+                valid, msg = area['_validation']
                 status = "[OK]" if valid else "[FAIL]"
                 print(f"   {status} Area {i+1}: {area.get('name', 'Unnamed')} - {msg}")
             return 0
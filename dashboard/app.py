@@ -2,22 +2,206 @@
 DFS Dashboard - Real-time monitoring and visualization
 """
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, dash_table, Input, Output, State, Patch, ClientsideFunction
+from dash.exceptions import PreventUpdate
+from flask import Response
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
 import plotly.express as px
 import pandas as pd
-import yaml
-from datetime import datetime
-import pytz
+import numpy as np
 from tzlocal import get_localzone
+from sqlalchemy import func
+from sqlalchemy.orm import load_only
+import os
+import glob
 import sys
+import time
+import json
+import threading
+from collections import OrderedDict
 sys.path.append('..')
-from database import DatabaseManager, Drone, Task, FireDetection, DroneState, TaskState
+from database import DatabaseManager, Drone, Task, FireDetection, TaskState
 from utils.logger import get_logger
+from utils.config import load_config
+
+# Optional production extras - the dashboard runs without them
+try:
+    import flask_compress  # noqa: F401 - used by Dash's compress option
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+try:
+    import waitress
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
 
 logger = get_logger()
 
+GPS_CACHE_SIZE = 32
+SNAPSHOT_INTERVAL_SEC = 0.5  # Background DB poll, matches the refresh interval
+REFRESH_IDLE_SEC = 5  # Background poll pauses when no browser has polled for this long
+EVENTS_KEEPALIVE_SEC = 2.5  # SSE keepalive; also how soon a dropped stream is noticed
+MAP_REFRESH_TICKS = 10  # Full map rebuild every 10 interval ticks (5s)
+MAX_PATH_POINTS = 2000  # Upper bound on flight-path points sent to the browser
+
+# Only the columns the map actually draws are loaded for task areas
+TASK_CORNER_COLUMNS = (
+    Task.corner_a_lat, Task.corner_a_lon, Task.corner_b_lat, Task.corner_b_lon,
+    Task.corner_c_lat, Task.corner_c_lon, Task.corner_d_lat, Task.corner_d_lon
+)
+
+# Map outline colors for task areas
+TASK_AREA_COLORS = {
+    'executing': 'yellow',
+    'assigned': 'orange',
+    'completed': 'green',
+    'cancelled': 'gray'
+}
+
+# Status cell colors (Darkly palette, matching the old badge colors)
+TASK_STATE_COLORS = {
+    'created': '#444444',
+    'assigned': '#3498DB',
+    'executing': '#F39C12',
+    'completed': '#00bc8c',
+    'failed': '#E74C3C',
+    'cancelled': '#303030'
+}
+TASK_TABLE_STYLES = [
+    {
+        'if': {'filter_query': f'{{state}} = "{state}"', 'column_id': 'state'},
+        'backgroundColor': color
+    }
+    for state, color in TASK_STATE_COLORS.items()
+]
+
+
+def _drone_trace_updates(rows):
+    """Drone marker data from (drone_id, lat, lon, state) rows"""
+    ids, lats, lons, states = [], [], [], []
+    for drone_id, lat, lon, state in rows:
+        if lat:
+            ids.append(drone_id)
+            lats.append(lat)
+            lons.append(lon)
+            states.append(state)
+    return [{'lat': lats, 'lon': lons, 'text': ids, 'customdata': states, 'showlegend': bool(lats)}]
+
+
+def _fire_trace_updates(rows):
+    """Fire marker data from (lat, lon, temperature, status) rows"""
+    lats, lons, info = [], [], []
+    for lat, lon, temperature, status in rows:
+        lats.append(lat)
+        lons.append(lon)
+        info.append([f"{temperature:.1f}°C", status])
+    return [{'lat': lats, 'lon': lons, 'customdata': info, 'showlegend': bool(lats)}]
+
+
+def _task_area_trace_updates(rows):
+    """Per-state outline data plus corner markers from task rows"""
+    groups = {state: {'lat': [], 'lon': [], 'customdata': []} for state in TASK_AREA_STATES}
+    corner_lats, corner_lons, corner_colors, corner_text = [], [], [], []
+    
+    for task_id, state, task_type, *corners in rows:
+        lats = corners[0::2]
+        lons = corners[1::2]
+        info = [task_id, state, task_type]
+        
+        # Closed polygon plus a None gap before the next task
+        group = groups[state]
+        group['lat'].extend(lats + [lats[0], None])
+        group['lon'].extend(lons + [lons[0], None])
+        group['customdata'].extend([info] * 5 + [None])
+        
+        corner_lats.extend(lats)
+        corner_lons.extend(lons)
+        corner_colors.extend([TASK_AREA_COLORS.get(state, 'white')] * 4)
+        corner_text.extend(f'{task_id} corner {c}' for c in 'ABCD')
+    
+    updates = [dict(group, showlegend=bool(group['lat'])) for group in groups.values()]
+    updates.append({
+        'lat': corner_lats,
+        'lon': corner_lons,
+        'text': corner_text,
+        'marker': dict(size=8, color=corner_colors, symbol='circle')
+    })
+    return updates
+
+
+# Fixed trace slots of the mission map; the selection overlay, flight path
+# and start/end markers always follow as the last three traces
+TASK_AREA_STATES = [state.value for state in TaskState]
+MAP_LAYER_SLOTS = {
+    'drones': [0],
+    'fires': [1],
+    'tasks': list(range(2, 3 + len(TASK_AREA_STATES)))
+}
+MAP_LAYER_BUILDERS = {
+    'drones': _drone_trace_updates,
+    'fires': _fire_trace_updates,
+    'tasks': _task_area_trace_updates
+}
+
+
+def _simplify_path(points, epsilon):
+    """Ramer-Douglas-Peucker: indices of the points kept within epsilon"""
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a = points[start]
+        d = points[end] - a
+        inner = points[start + 1:end] - a
+        norm = np.hypot(d[0], d[1])
+        if norm == 0:
+            dist = np.hypot(inner[:, 0], inner[:, 1])
+        else:
+            dist = np.abs(d[0] * inner[:, 1] - d[1] * inner[:, 0]) / norm
+        i = int(np.argmax(dist))
+        if dist[i] > epsilon:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    
+    return np.flatnonzero(keep)
+
+
+def _alert(message, color):
+    """Dismissable status alert for the control panel callbacks"""
+    return dbc.Alert(message, color=color, dismissable=True)
+
+
+class _LRUCache(OrderedDict):
+    """Dict that drops the least recently used entry past maxsize"""
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return self[key]
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
 
 class DFSDashboard:
     """
@@ -35,19 +219,36 @@ class DFSDashboard:
     the marker rendering or switch to clustering.
     """
     def __init__(self, config_path='../config/dfs_config.yaml'):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
         
         self.db_manager = DatabaseManager(config_path)
-        self.gps_cache = {}  # Cache GPS data to avoid reloading
-        self.click_counts = {}  # Track click counts for double-click detection
+        self.gps_cache = _LRUCache(GPS_CACHE_SIZE)  # Cache GPS data to avoid reloading
+        self.local_tz = get_localzone()  # Resolved once - tzdb lookup is not free
+        self._orchestrator = None  # Created on the first control action
+        self._orchestrator_lock = threading.Lock()
         
         # Initialize Dash app
         self.app = dash.Dash(
             __name__,
             external_stylesheets=[dbc.themes.DARKLY],
-            suppress_callback_exceptions=True
+            suppress_callback_exceptions=True,
+            compress=COMPRESS_AVAILABLE  # gzip the JSON of every poll tick
         )
+        # Asset URLs carry an mtime query string, so browsers may cache
+        # them for good and still pick up edits
+        self.app.server.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+        
+        # One background thread polls the DB; interval callbacks only read
+        # the latest snapshot, however many browsers are connected
+        self._snapshot = self._load_snapshot()
+        self._snapshot_at = self._last_poll = time.monotonic()
+        # Bumped whenever the snapshot content changes; pushed to browsers
+        # over /events so they only fetch when there is something new
+        self._snapshot_version = 0
+        self._snapshot_changed = threading.Condition()
+        self._stop_refresh = threading.Event()
+        self._refresh_thread = threading.Thread(target=self._refresher, daemon=True)
+        self._refresh_thread.start()
         
         # Add custom CSS for hover effects
         self.app.index_string = '''
@@ -59,7 +260,7 @@ class DFSDashboard:
                 {%favicon%}
                 {%css%}
                 <style>
-                    .task-row:hover {
+                    #task-table tr:hover td.dash-cell {
                         background-color: rgba(0, 255, 255, 0.2) !important;
                     }
                 </style>
@@ -75,9 +276,301 @@ class DFSDashboard:
         </html>
         '''
         
+        # Callback threads reuse their scoped session within a request and
+        # hand it back to the registry once the request is done
+        @self.app.server.teardown_request
+        def remove_session(exc=None):
+            self.db_manager.Session.remove()
+        
+        @self.app.server.route('/events')
+        def snapshot_events():
+            return Response(self._snapshot_events(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache'})
+        
         self.setup_layout()
         self.setup_callbacks()
     
+    def _load_snapshot(self):
+        """Read fleet counts, task-table rows and map layers into plain dicts"""
+        # The refresher thread keeps its scoped session across polls
+        session = self.db_manager.Session()
+        
+        try:
+            drones = [
+                {
+                    'drone_id': drone_id,
+                    'state': state.value,
+                    'battery_percent': battery,
+                    'lat': lat,
+                    'lon': lon
+                }
+                for drone_id, state, battery, lat, lon in session.query(
+                    Drone.drone_id, Drone.state, Drone.battery_percent,
+                    Drone.current_latitude, Drone.current_longitude
+                ).order_by(Drone.id).all()
+            ]
+            task_counts = session.query(Task.state, func.count()).group_by(Task.state).all()
+            detection_counts = session.query(
+                FireDetection.status, func.count()
+            ).group_by(FireDetection.status).all()
+            
+            drone_counts = {}
+            for drone in drones:
+                drone_counts[drone['state']] = drone_counts.get(drone['state'], 0) + 1
+            
+            fleet = {
+                'drones': drones,
+                'drone_counts': drone_counts,
+                'task_counts': {state.value: count for state, count in task_counts},
+                'detection_counts': dict(detection_counts)
+            }
+            return {
+                'fleet': fleet,
+                'task_rows': self._load_task_rows(session),
+                'map': self._load_map_layers(session, drones)
+            }
+        finally:
+            # End the read transaction so SQLite writers are not blocked
+            session.rollback()
+    
+    def _load_map_layers(self, session, drones):
+        """Per-layer map rows plus a hash of each, for change detection"""
+        detections = session.query(
+            FireDetection.latitude, FireDetection.longitude,
+            FireDetection.temperature_c, FireDetection.status
+        ).all()
+        # Get all tasks (not just executing/assigned) to show on map
+        all_tasks = session.query(
+            Task.task_id, Task.state, Task.task_type, *TASK_CORNER_COLUMNS
+        ).filter(
+            Task.corner_a_lat.isnot(None)
+        ).order_by(Task.created_at.desc()).limit(10).all()
+        
+        layer_rows = {
+            'drones': tuple((d['drone_id'], d['lat'], d['lon'], d['state']) for d in drones),
+            'fires': tuple(tuple(row) for row in detections),
+            'tasks': tuple(
+                (task_id, state.value, task_type, *corners)
+                for task_id, state, task_type, *corners in all_tasks
+            )
+        }
+        # Hashed to strings - a 64-bit int would lose precision in JSON/JS
+        layer_hash = {layer: str(hash(rows)) for layer, rows in layer_rows.items()}
+        return {'rows': layer_rows, 'hash': layer_hash}
+    
+    def _load_task_rows(self, session):
+        """Latest tasks as flat row dicts for the task DataTable"""
+        # Show last 50 tasks instead of 10 (scrollable container handles display)
+        # Plain column tuples - no ORM instances or attribute descriptors
+        tasks = session.query(
+            Task.task_id, Task.task_type, Task.drone_id, Task.state, Task.created_at
+        ).order_by(Task.created_at.desc()).limit(50).all()
+        
+        if not tasks:
+            return []
+        
+        # Resolve drone names for all rows in one query
+        ids = {drone_id for _, _, drone_id, _, _ in tasks if drone_id}
+        name_by_id = dict(
+            session.query(Drone.id, Drone.drone_id).filter(Drone.id.in_(ids)).all()
+        ) if ids else {}
+        
+        # Convert UTC timestamps to local time in one vectorized step
+        created_strs = pd.DatetimeIndex(
+            [created_at for *_, created_at in tasks], tz='UTC'
+        ).tz_convert(self.local_tz).strftime("%Y-%m-%d %H:%M:%S %Z").fillna("")
+        
+        # 'id' becomes active_cell['row_id'] when a cell is clicked
+        return [
+            {
+                'id': task_id,
+                'task_id': task_id,
+                'task_type': task_type,
+                'drone': name_by_id.get(drone_id, "Unassigned"),
+                'state': state.value,
+                'created': created_str
+            }
+            for (task_id, task_type, drone_id, state, _), created_str in zip(tasks, created_strs)
+        ]
+    
+    def _refresher(self):
+        """Background loop that swaps in a fresh snapshot every interval"""
+        while not self._stop_refresh.wait(SNAPSHOT_INTERVAL_SEC):
+            # Every tab paused or closed - leave the database alone
+            if time.monotonic() - self._last_poll > REFRESH_IDLE_SEC:
+                continue
+            try:
+                self._publish_snapshot(self._load_snapshot())
+            except Exception as e:
+                logger.error(f"[FAIL] Dashboard snapshot refresh failed: {e}")
+    
+    def _publish_snapshot(self, snapshot):
+        """Swap in a snapshot, waking /events streams if its content changed"""
+        with self._snapshot_changed:
+            if snapshot != self._snapshot:
+                self._snapshot_version += 1
+                self._snapshot_changed.notify_all()
+            self._snapshot = snapshot
+            self._snapshot_at = time.monotonic()
+    
+    def _snapshot_events(self):
+        """Server-sent events stream of the snapshot version"""
+        sent = None
+        while not self._stop_refresh.is_set():
+            # An open stream keeps the refresher awake like a poll would
+            self._last_poll = time.monotonic()
+            with self._snapshot_changed:
+                self._snapshot_changed.wait_for(
+                    lambda: self._snapshot_version != sent, timeout=EVENTS_KEEPALIVE_SEC
+                )
+                version = self._snapshot_version
+            if version != sent:
+                sent = version
+                yield f"data: {json.dumps({'v': version})}\n\n"
+            else:
+                yield ": keepalive\n\n"
+    
+    def current_snapshot(self):
+        """Latest snapshot, reloaded inline if the refresher had gone idle"""
+        now = time.monotonic()
+        self._last_poll = now
+        if now - self._snapshot_at > 2 * SNAPSHOT_INTERVAL_SEC:
+            self._publish_snapshot(self._load_snapshot())
+        return self._snapshot
+    
+    def fleet_snapshot(self):
+        """Latest drone rows and per-state counts"""
+        return self.current_snapshot()['fleet']
+    
+    @property
+    def orchestrator(self):
+        """Shared MissionOrchestrator for the task/drone control callbacks"""
+        with self._orchestrator_lock:
+            if self._orchestrator is None:
+                from mission_control.orchestrator import MissionOrchestrator
+                self._orchestrator = MissionOrchestrator()
+            return self._orchestrator
+    
+    def _load_waypoints(self, task):
+        """Load (and cache) the GPS track recorded for a task"""
+        # Entries are stamped with the task's updated_at, so a task that has
+        # changed since (e.g. finished writing its GPS file) is reloaded
+        entry = self.gps_cache.get(task.task_id)
+        if entry and entry['updated_at'] == task.updated_at:
+            return entry['data']
+        
+        # Try to find and load GPS data
+        gps_file = None
+        if task.data_path and os.path.exists(task.data_path):
+            # Try the expected path
+            gps_file = os.path.join(task.data_path, 'gps', f"{os.path.basename(task.data_path)}_gps.csv")
+            if not os.path.exists(gps_file):
+                # Try to find any GPS file in the data directory
+                gps_pattern = os.path.join(task.data_path, 'gps', '*_gps.csv')
+                gps_files = glob.glob(gps_pattern)
+                if gps_files:
+                    gps_file = gps_files[0]
+        
+        cached_data = None
+        if gps_file and os.path.exists(gps_file):
+            try:
+                track = self._read_gps_track(gps_file)
+                if not len(track):
+                    raise ValueError("GPS file has no rows")
+                # Simplified variants are built lazily per zoom level
+                cached_data = {'track': track, 'count': len(track), 'levels': {}}
+                logger.info(f"[OK] Loaded {len(track)} waypoints for {task.task_id} from {gps_file}")
+            except Exception as e:
+                logger.error(f"[FAIL] Error loading GPS data for {task.task_id}: {e}")
+        else:
+            logger.warning(f"[WARN] No GPS file found for {task.task_id} (data_path: {task.data_path})")
+        
+        self.gps_cache[task.task_id] = {'updated_at': task.updated_at, 'data': cached_data}
+        return cached_data
+    
+    @staticmethod
+    def _read_gps_track(gps_file):
+        """Read float32 (latitude, longitude) rows, preferring a binary .npy sidecar"""
+        # float32 keeps ~0.4 m at these coordinates - below GPS accuracy -
+        # and halves the memory of every cached track
+        npy_file = os.path.splitext(gps_file)[0] + '.npy'
+        try:
+            if os.path.getmtime(npy_file) >= os.path.getmtime(gps_file):
+                return np.load(npy_file).astype(np.float32, copy=False)
+        except (OSError, ValueError):
+            pass
+        
+        track = pd.read_csv(
+            gps_file, usecols=['latitude', 'longitude'], dtype=np.float64
+        )[['latitude', 'longitude']].to_numpy(dtype=np.float32)
+        try:
+            np.save(npy_file, track)
+        except OSError:
+            pass  # Read-only data dir - just parse the CSV next time
+        return track
+    
+    @staticmethod
+    def _path_at_zoom(cached_data, zoom):
+        """Flight path simplified to about one screen pixel at a map zoom"""
+        level = int(min(max(zoom, 0), 22))
+        track = cached_data['track']
+        index = cached_data['levels'].get(level)
+        if index is None:
+            # Web-mercator degrees per 512px-tile pixel; longitudes are scaled
+            # by cos(lat) so the tolerance is isotropic on the ground
+            epsilon = 360.0 / (512 * 2 ** level)
+            points = track * [1.0, np.cos(np.radians(track[0, 0]))]
+            index = _simplify_path(points, epsilon)
+            
+            # Very dense tracks can still exceed the point budget
+            if len(index) > MAX_PATH_POINTS:
+                stride = len(index) // MAX_PATH_POINTS + 1
+                index = np.append(index[:-1:stride], index[-1])
+            cached_data['levels'][level] = index
+        
+        # Rounded float64 keeps the JSON short whichever encoder plotly uses
+        # (float32 values print with spurious digits through stdlib json)
+        points = track[index].astype(np.float64).round(6)
+        return {'lat': points[:, 0], 'lon': points[:, 1], 'customdata': index}
+    
+    def _selection_trace_updates(self, session, highlighted_task_id, waypoint_task_id, zoom):
+        """Data for the selection overlay, flight path and start/end traces"""
+        selected = {'lat': [], 'lon': [], 'name': 'Selected task', 'showlegend': False}
+        path = {'lat': [], 'lon': [], 'customdata': [], 'name': 'Flight path', 'showlegend': False}
+        endpoints = {'lat': [], 'lon': [], 'name': 'Start/end', 'showlegend': False}
+        
+        task_ids = {t for t in (highlighted_task_id, waypoint_task_id) if t}
+        if not task_ids:
+            return selected, path, endpoints
+        
+        tasks = session.query(Task).options(
+            load_only(Task.task_id, Task.data_path, Task.updated_at, *TASK_CORNER_COLUMNS)
+        ).filter(
+            Task.task_id.in_(task_ids),
+            Task.corner_a_lat.isnot(None)
+        ).all()
+        for task in tasks:
+            task_id = task.task_id
+            corners = [getattr(task, column.key) for column in TASK_CORNER_COLUMNS]
+            lats = corners[0::2]
+            lons = corners[1::2]
+            selected['lat'].extend(lats + [lats[0], None])
+            selected['lon'].extend(lons + [lons[0], None])
+            selected['showlegend'] = True
+            
+            # If task is double-clicked, show full waypoint path
+            if task_id == waypoint_task_id:
+                cached_data = self._load_waypoints(task)
+                if cached_data:
+                    start, end = cached_data['track'][[0, -1]].astype(np.float64).round(6)
+                    path.update(self._path_at_zoom(cached_data, zoom),
+                                name=f'{task_id} flight path', showlegend=True)
+                    endpoints.update(lat=[start[0], end[0]],
+                                     lon=[start[1], end[1]],
+                                     name=f'{task_id} start/end')
+        
+        return selected, path, endpoints
+    
     def setup_layout(self):
         """Setup dashboard layout"""
         self.app.layout = dbc.Container([
@@ -205,7 +698,7 @@ class DFSDashboard:
                         dbc.CardHeader([
                             html.Div([
                                 html.Span("Recent Tasks", className="me-3"),
-                                html.Small("(Click  to highlight, Double-click  for waypoints)", className="text-muted me-3"),
+                                html.Small("(Click a row to highlight, Double-click for waypoints)", className="text-muted me-3"),
                                 dbc.Button(
                                     "⏸ Pause",
                                     id="refresh-toggle-btn",
@@ -216,13 +709,26 @@ class DFSDashboard:
                             ], className="d-flex align-items-center justify-content-between")
                         ]),
                         dbc.CardBody([
-                            html.Div(
+                            html.P("No tasks yet", id="task-table-empty", className="text-muted"),
+                            dash_table.DataTable(
                                 id="task-table",
-                                style={
+                                columns=[
+                                    {'name': 'Task ID', 'id': 'task_id'},
+                                    {'name': 'Type', 'id': 'task_type'},
+                                    {'name': 'Drone', 'id': 'drone'},
+                                    {'name': 'Status', 'id': 'state'},
+                                    {'name': 'Created', 'id': 'created'}
+                                ],
+                                data=[],
+                                page_action='none',
+                                style_table={
                                     'maxHeight': '400px',
                                     'overflowY': 'auto',
                                     'overflowX': 'auto'
-                                }
+                                },
+                                style_header={'backgroundColor': '#303030', 'fontWeight': 'bold', 'border': '1px solid #444'},
+                                style_cell={'backgroundColor': '#222', 'color': 'white', 'border': '1px solid #444', 'textAlign': 'left', 'cursor': 'pointer'},
+                                style_data_conditional=TASK_TABLE_STYLES
                             )
                         ])
                     ])
@@ -233,6 +739,11 @@ class DFSDashboard:
             dcc.Store(id='highlighted-task-id', data=''),  # Single click - highlight only
             dcc.Store(id='waypoint-task-id', data=''),     # Double click - show waypoints
             dcc.Store(id='refresh-paused', data=False),    # Pause/resume refresh
+            dcc.Store(id='fleet-snapshot'),                # Drone/task/detection counts per tick
+            dcc.Store(id='map-tick', data={'every': MAP_REFRESH_TICKS}),  # Throttled map refresh
+            dcc.Store(id='map-hash'),                      # Content hash of the drawn map
+            
+            dcc.Store(id='snapshot-tick'),                 # Interval ticks that saw a new snapshot
             
             # Auto-refresh (5 seconds)
             dcc.Interval(
@@ -246,425 +757,273 @@ class DFSDashboard:
     def setup_callbacks(self):
         """Setup dashboard callbacks"""
         
+        # The interval only ticks in the browser; a tick reaches the server
+        # when /events has announced a new snapshot (or the stream is down)
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='snapshotTick'),
+            Output('snapshot-tick', 'data'),
+            [Input('interval-component', 'n_intervals')]
+        )
+        
         @self.app.callback(
+            Output('fleet-snapshot', 'data'),
+            [Input('snapshot-tick', 'data')]
+        )
+        def update_fleet_snapshot(n):
+            return self.fleet_snapshot()
+        
+        # Status cards and drone list render in the browser (assets/dfs.js)
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='renderCards'),
             [Output('drone-count', 'children'),
              Output('drone-status', 'children'),
              Output('task-count', 'children'),
              Output('task-status', 'children'),
              Output('detection-count', 'children'),
              Output('detection-status', 'children'),
-             Output('system-status', 'children'),
-             Output('system-uptime', 'children')],
+             Output('system-status', 'children')],
+            [Input('fleet-snapshot', 'data')]
+        )
+        
+        # The clock ticks with the interval, not with snapshot changes, so it
+        # keeps running while the fleet is idle
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='renderClock'),
+            Output('system-uptime', 'children'),
             [Input('interval-component', 'n_intervals')]
         )
-        def update_status_cards(n):
-            session = self.db_manager.get_session()
-            
-            try:
-                # Drone stats
-                drones = session.query(Drone).all()
-                idle_drones = len([d for d in drones if d.state == DroneState.IDLE])
-                flying_drones = len([d for d in drones if d.state == DroneState.FLYING])
-                
-                # Task stats
-                tasks = session.query(Task).all()
-                active_tasks = len([t for t in tasks if t.state in [TaskState.ASSIGNED, TaskState.EXECUTING]])
-                completed_tasks = len([t for t in tasks if t.state == TaskState.COMPLETED])
-                
-                # Detection stats
-                detections = session.query(FireDetection).all()
-                active_fires = len([d for d in detections if d.status == 'detected'])
-                suppressed_fires = len([d for d in detections if d.status == 'suppressed'])
-                
-                return (
-                    f"{len(drones)}",
-                    f"{idle_drones} idle, {flying_drones} flying",
-                    f"{active_tasks}",
-                    f"{completed_tasks} completed",
-                    f"{len(detections)}",
-                    f"{active_fires} active, {suppressed_fires} suppressed",
-                    "OPERATIONAL",
-                    datetime.now().strftime("%H:%M:%S")
-                )
-            finally:
-                self.db_manager.close_session(session)
+        
+        # Map geometry changes slowly - only every MAP_REFRESH_TICKS-th tick
+        # reaches the server, and only if the snapshot changed since the last
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='mapTick'),
+            Output('map-tick', 'data'),
+            [Input('interval-component', 'n_intervals')],
+            [State('map-tick', 'data')]
+        )
         
         @self.app.callback(
-            Output('mission-map', 'figure'),
-            [Input('interval-component', 'n_intervals'),
+            [Output('mission-map', 'figure'),
+             Output('map-hash', 'data')],
+            [Input('map-tick', 'data'),
              Input('highlighted-task-id', 'data'),
-             Input('waypoint-task-id', 'data')]
+             Input('waypoint-task-id', 'data'),
+             Input('mission-map', 'relayoutData')],
+            [State('map-hash', 'data')]
         )
-        def update_map(n, highlighted_task_id, waypoint_task_id):
-            session = self.db_manager.get_session()
+        def update_map(tick, highlighted_task_id, waypoint_task_id, relayout_data, last_map_hash):
+            trigger = dash.callback_context.triggered_id
+            if not isinstance(last_map_hash, dict):
+                last_map_hash = {}
             
-            try:
-                # Get all drones and detections
-                drones = session.query(Drone).all()
-                detections = session.query(FireDetection).all()
-                # Get all tasks (not just executing/assigned) to show on map
-                all_tasks = session.query(Task).filter(
-                    Task.corner_a_lat.isnot(None)
-                ).order_by(Task.created_at.desc()).limit(10).all()
+            # The flight path is simplified per integer zoom level
+            map_zoom = (relayout_data or {}).get('mapbox.zoom')
+            if map_zoom is not None:
+                path_zoom = int(map_zoom)
+            else:
+                path_zoom = last_map_hash.get('path_zoom', int(self.config['dashboard']['map']['default_zoom']))
+            
+            if trigger == 'mission-map':
+                # Pans and sub-level zooms keep the current path detail
+                if map_zoom is None or path_zoom == last_map_hash.get('path_zoom'):
+                    raise PreventUpdate
+                map_hash = dict(last_map_hash, path_zoom=path_zoom)
+                if not waypoint_task_id:
+                    return dash.no_update, map_hash
                 
-                fig = go.Figure()
+                patched_fig = Patch()
+                _, path, _ = self._selection_trace_updates(
+                    self.db_manager.Session(), None, waypoint_task_id, path_zoom
+                )
+                patched_fig['data'][-2].update(path)
+                return patched_fig, map_hash
+            
+            # Thread-scoped session, released in teardown_request
+            session = self.db_manager.Session()
+            
+            if trigger in ('highlighted-task-id', 'waypoint-task-id'):
+                # Selection change - patch the last three traces only
+                patched_fig = Patch()
+                updates = self._selection_trace_updates(session, highlighted_task_id, waypoint_task_id, path_zoom)
+                for index, update in zip((-3, -2, -1), updates):
+                    patched_fig['data'][index].update(update)
+                return patched_fig, dash.no_update
+            
+            # Layer rows and hashes come from the background snapshot; the
+            # hashes tell which layers changed since this browser's last
+            # update (selection is patched separately)
+            map_layers = self.current_snapshot()['map']
+            layer_rows = map_layers['rows']
+            map_hash = dict(map_layers['hash'])
+            
+            if trigger == 'map-tick' and last_map_hash:
+                changed = [layer for layer in map_hash if map_hash[layer] != last_map_hash.get(layer)]
+                if not changed:
+                    raise PreventUpdate
+                map_hash['path_zoom'] = path_zoom
                 
+                # Trace slots are fixed, so only the changed layers' data
+                # is sent and plotly.js restyles instead of re-plotting
+                patched_fig = Patch()
+                for layer in changed:
+                    updates = MAP_LAYER_BUILDERS[layer](layer_rows[layer])
+                    for index, update in zip(MAP_LAYER_SLOTS[layer], updates):
+                        patched_fig['data'][index].update(update)
+                return patched_fig, map_hash
+            
+            area_hover = '<b>%{customdata[0]}</b><br>State: %{customdata[1]}<br>Type: %{customdata[2]}<br><i>Double-click row to show path</i><extra></extra>'
+            traces = [
                 # Plot drones
-                drone_lats = [d.current_latitude for d in drones if d.current_latitude]
-                drone_lons = [d.current_longitude for d in drones if d.current_longitude]
-                drone_ids = [d.drone_id for d in drones if d.current_latitude]
-                drone_states = [d.state.value for d in drones if d.current_latitude]
-                
-                if drone_lats:
-                    fig.add_trace(go.Scattermapbox(
-                        lat=drone_lats,
-                        lon=drone_lons,
-                        mode='markers+text',
-                        marker=dict(size=15, color='blue'),
-                        text=drone_ids,
-                        textposition='top center',
-                        name='Drones',
-                        hovertemplate='<b>%{text}</b><br>State: %{customdata}<extra></extra>',
-                        customdata=drone_states
-                    ))
-                
+                go.Scattermapbox(
+                    mode='markers+text',
+                    marker=dict(size=15, color='blue'),
+                    textposition='top center',
+                    name='Drones',
+                    hovertemplate='<b>%{text}</b><br>State: %{customdata}<extra></extra>'
+                ),
                 # Plot fire detections
-                fire_lats = [d.latitude for d in detections]
-                fire_lons = [d.longitude for d in detections]
-                fire_temps = [f"{d.temperature_c:.1f}°C" for d in detections]
-                fire_status = [d.status for d in detections]
-                
-                if fire_lats:
-                    fig.add_trace(go.Scattermapbox(
-                        lat=fire_lats,
-                        lon=fire_lons,
-                        mode='markers',
-                        marker=dict(size=20, color='red', symbol='fire-station'),
-                        name='Fire Detections',
-                        hovertemplate='<b>Fire</b><br>Temp: %{customdata[0]}<br>Status: %{customdata[1]}<extra></extra>',
-                        customdata=list(zip(fire_temps, fire_status))
-                    ))
-                
-                # Plot task areas with different colors based on state
-                for task in all_tasks:
-                    if task.corner_a_lat:
-                        # Color based on task state
-                        color_map = {
-                            'executing': 'yellow',
-                            'assigned': 'orange',
-                            'completed': 'green',
-                            'cancelled': 'gray'
-                        }
-                        task_color = color_map.get(task.state.value, 'white')
-                        
-                        # Highlight if clicked or showing waypoints
-                        line_width = 3
-                        opacity = 1.0
-                        if highlighted_task_id and task.task_id == highlighted_task_id:
-                            line_width = 6
-                            task_color = 'cyan'
-                            opacity = 1.0
-                        elif waypoint_task_id and task.task_id == waypoint_task_id:
-                            line_width = 6
-                            task_color = 'cyan'
-                            opacity = 1.0
-                        
-                        # Draw flight area polygon
-                        fig.add_trace(go.Scattermapbox(
-                            lat=[task.corner_a_lat, task.corner_b_lat, task.corner_c_lat, task.corner_d_lat, task.corner_a_lat],
-                            lon=[task.corner_a_lon, task.corner_b_lon, task.corner_c_lon, task.corner_d_lon, task.corner_a_lon],
-                            mode='lines',
-                            line=dict(width=line_width, color=task_color),
-                            name=f'{task.task_id} ({task.state.value})',
-                            hovertemplate=f'<b>{task.task_id}</b><br>State: {task.state.value}<br>Type: {task.task_type}<br><i>Double-click row to show path</i><extra></extra>',
-                            showlegend=True,
-                            opacity=opacity
-                        ))
-                        
-                        # Add corner markers
-                        fig.add_trace(go.Scattermapbox(
-                            lat=[task.corner_a_lat, task.corner_b_lat, task.corner_c_lat, task.corner_d_lat],
-                            lon=[task.corner_a_lon, task.corner_b_lon, task.corner_c_lon, task.corner_d_lon],
-                            mode='markers',
-                            marker=dict(size=8, color=task_color, symbol='circle'),
-                            text=['A', 'B', 'C', 'D'],
-                            name=f'{task.task_id} corners',
-                            hovertemplate='Corner %{text}<extra></extra>',
-                            showlegend=False
-                        ))
-                        
-                        # If task is double-clicked, show full waypoint path
-                        if waypoint_task_id and task.task_id == waypoint_task_id:
-                            # Check cache first
-                            if task.task_id not in self.gps_cache:
-                                # Try to find and load GPS data
-                                import os
-                                import glob
-                                
-                                gps_file = None
-                                if task.data_path and os.path.exists(task.data_path):
-                                    # Try the expected path
-                                    gps_file = os.path.join(task.data_path, 'gps', f"{os.path.basename(task.data_path)}_gps.csv")
-                                    if not os.path.exists(gps_file):
-                                        # Try to find any GPS file in the data directory
-                                        gps_pattern = os.path.join(task.data_path, 'gps', '*_gps.csv')
-                                        gps_files = glob.glob(gps_pattern)
-                                        if gps_files:
-                                            gps_file = gps_files[0]
-                                
-                                if gps_file and os.path.exists(gps_file):
-                                    try:
-                                        import pandas as pd
-                                        gps_data = pd.read_csv(gps_file)
-                                        # Cache the GPS data
-                                        self.gps_cache[task.task_id] = {
-                                            'lats': gps_data['latitude'].tolist(),
-                                            'lons': gps_data['longitude'].tolist()
-                                        }
-                                        logger.info(f"[OK] Loaded {len(gps_data)} waypoints for {task.task_id} from {gps_file}")
-                                    except Exception as e:
-                                        logger.error(f"[FAIL] Error loading GPS data for {task.task_id}: {e}")
-                                        self.gps_cache[task.task_id] = None
-                                else:
-                                    logger.warning(f"[WARN] No GPS file found for {task.task_id} (data_path: {task.data_path})")
-                                    self.gps_cache[task.task_id] = None
-                            
-                            # Use cached data if available
-                            if task.task_id in self.gps_cache and self.gps_cache[task.task_id]:
-                                cached_data = self.gps_cache[task.task_id]
-                                # Show full flight path with line
-                                fig.add_trace(go.Scattermapbox(
-                                    lat=cached_data['lats'],
-                                    lon=cached_data['lons'],
-                                    mode='lines+markers',
-                                    line=dict(width=2, color='magenta'),
-                                    marker=dict(size=3, color='magenta', opacity=0.7),
-                                    name=f'{task.task_id} flight path',
-                                    hovertemplate='Waypoint %{pointNumber}<br>Lat: %{lat:.6f}<br>Lon: %{lon:.6f}<extra></extra>',
-                                    showlegend=True
-                                ))
-                                # Add start and end markers
-                                fig.add_trace(go.Scattermapbox(
-                                    lat=[cached_data['lats'][0], cached_data['lats'][-1]],
-                                    lon=[cached_data['lons'][0], cached_data['lons'][-1]],
-                                    mode='markers+text',
-                                    marker=dict(size=12, color=['green', 'red'], symbol=['circle', 'square']),
-                                    text=['START', 'END'],
-                                    textposition='top center',
-                                    name=f'{task.task_id} start/end',
-                                    showlegend=False
-                                ))
-                
-                # Set map center
-                center_lat = self.config['dashboard']['map']['default_center'][0]
-                center_lon = self.config['dashboard']['map']['default_center'][1]
-                
-                fig.update_layout(
-                    mapbox=dict(
-                        style='open-street-map',
-                        center=dict(lat=center_lat, lon=center_lon),
-                        zoom=self.config['dashboard']['map']['default_zoom']
-                    ),
-                    showlegend=True,
-                    margin=dict(l=0, r=0, t=0, b=0),
-                    paper_bgcolor='#222',
-                    plot_bgcolor='#222',
-                    height=600,
-                    uirevision='constant'  # Preserve map state between updates
+                go.Scattermapbox(
+                    mode='markers',
+                    marker=dict(size=20, color='red', symbol='fire-station'),
+                    name='Fire Detections',
+                    hovertemplate='<b>Fire</b><br>Temp: %{customdata[0]}<br>Status: %{customdata[1]}<extra></extra>'
                 )
-                
-                return fig
-            finally:
-                self.db_manager.close_session(session)
+            ]
+            # Plot task areas - one line trace per state rather than per
+            # task, since plotly cost scales with trace count
+            traces.extend(
+                go.Scattermapbox(
+                    mode='lines',
+                    line=dict(width=3, color=TASK_AREA_COLORS.get(state, 'white')),
+                    name=f'Tasks ({state})',
+                    hovertemplate=area_hover
+                )
+                for state in TASK_AREA_STATES
+            )
+            # Add corner markers
+            traces.append(go.Scattermapbox(
+                mode='markers',
+                name='Task corners',
+                hovertemplate='%{text}<extra></extra>',
+                showlegend=False
+            ))
+            
+            for layer, slots in MAP_LAYER_SLOTS.items():
+                for index, update in zip(slots, MAP_LAYER_BUILDERS[layer](layer_rows[layer])):
+                    traces[index].update(update)
+            
+            fig = go.Figure(data=traces)
+            
+            # Selection overlay, flight path and start/end markers always
+            # occupy the last three traces so selection changes can patch them
+            selected, path, endpoints = self._selection_trace_updates(
+                session, highlighted_task_id, waypoint_task_id, path_zoom
+            )
+            fig.add_trace(go.Scattermapbox(
+                mode='lines',
+                line=dict(width=6, color='cyan'),
+                hoverinfo='skip',
+                **selected
+            ))
+            fig.add_trace(go.Scattermapbox(
+                mode='lines+markers',
+                line=dict(width=2, color='magenta'),
+                marker=dict(size=3, color='magenta', opacity=0.7),
+                hovertemplate='Waypoint %{customdata}<br>Lat: %{lat:.6f}<br>Lon: %{lon:.6f}<extra></extra>',
+                **path
+            ))
+            fig.add_trace(go.Scattermapbox(
+                mode='markers+text',
+                marker=dict(size=12, color=['green', 'red'], symbol=['circle', 'square']),
+                text=['START', 'END'],
+                textposition='top center',
+                **endpoints
+            ))
+            
+            # Set map center
+            center_lat = self.config['dashboard']['map']['default_center'][0]
+            center_lon = self.config['dashboard']['map']['default_center'][1]
+            
+            fig.update_layout(
+                mapbox=dict(
+                    style='open-street-map',
+                    center=dict(lat=center_lat, lon=center_lon),
+                    zoom=self.config['dashboard']['map']['default_zoom']
+                ),
+                showlegend=True,
+                margin=dict(l=0, r=0, t=0, b=0),
+                paper_bgcolor='#222',
+                plot_bgcolor='#222',
+                height=600,
+                uirevision='constant'  # Preserve map state between updates
+            )
+            
+            map_hash['path_zoom'] = path_zoom
+            return fig, map_hash
         
-        @self.app.callback(
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='renderDroneChart'),
             Output('drone-status-chart', 'figure'),
-            [Input('interval-component', 'n_intervals')]
+            [Input('fleet-snapshot', 'data')]
         )
-        def update_drone_chart(n):
-            session = self.db_manager.get_session()
-            
-            try:
-                drones = session.query(Drone).all()
-                
-                # Count by state
-                state_counts = {}
-                for drone in drones:
-                    state = drone.state.value
-                    state_counts[state] = state_counts.get(state, 0) + 1
-                
-                fig = go.Figure(data=[
-                    go.Pie(
-                        labels=list(state_counts.keys()),
-                        values=list(state_counts.values()),
-                        hole=0.3
-                    )
-                ])
-                
-                fig.update_layout(
-                    showlegend=True,
-                    margin=dict(l=0, r=0, t=0, b=0),
-                    paper_bgcolor='#222',
-                    plot_bgcolor='#222'
-                )
-                
-                return fig
-            finally:
-                self.db_manager.close_session(session)
         
-        @self.app.callback(
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='renderDroneList'),
             Output('drone-list', 'children'),
-            [Input('interval-component', 'n_intervals')]
+            [Input('fleet-snapshot', 'data')]
         )
-        def update_drone_list(n):
-            session = self.db_manager.get_session()
-            
-            try:
-                drones = session.query(Drone).all()
-                
-                drone_items = []
-                for drone in drones:
-                    color = 'success' if drone.state == DroneState.IDLE else 'warning' if drone.state == DroneState.FLYING else 'secondary'
-                    
-                    drone_items.append(
-                        html.Div([
-                            dbc.Badge(drone.drone_id, color=color, className="me-2"),
-                            html.Small(f"{drone.battery_percent:.0f}%", className="text-muted")
-                        ], className="mb-2")
-                    )
-                
-                return drone_items
-            finally:
-                self.db_manager.close_session(session)
         
         @self.app.callback(
-            Output('task-table', 'children'),
-            [Input('interval-component', 'n_intervals')]
+            [Output('task-table', 'data'),
+             Output('task-table-empty', 'style')],
+            [Input('snapshot-tick', 'data')]
         )
         def update_task_table(n):
-            session = self.db_manager.get_session()
-            
-            try:
-                # Show last 50 tasks instead of 10 (scrollable container handles display)
-                tasks = session.query(Task).order_by(Task.created_at.desc()).limit(50).all()
-                
-                if not tasks:
-                    return html.P("No tasks yet", className="text-muted")
-                
-                table_rows = []
-                for task in tasks:
-                    drone_id = session.query(Drone).get(task.drone_id).drone_id if task.drone_id else "Unassigned"
-                    
-                    color = {
-                        'created': 'secondary',
-                        'assigned': 'info',
-                        'executing': 'warning',
-                        'completed': 'success',
-                        'failed': 'danger',
-                        'cancelled': 'dark'
-                    }.get(task.state.value, 'secondary')
-                    
-                    # Format timestamp in local time with date and time
-                    if task.created_at:
-                        # Convert UTC to local timezone
-                        local_tz = get_localzone()
-                        utc_time = task.created_at.replace(tzinfo=pytz.UTC)
-                        local_time = utc_time.astimezone(local_tz)
-                        created_str = local_time.strftime("%Y-%m-%d %H:%M:%S %Z")
-                    else:
-                        created_str = ""
-                    
-                    # Make row clickable with proper ID
-                    row_id = f"task-row-{task.task_id}"
-                    table_rows.append(
-                        html.Tr([
-                            html.Td(task.task_id),
-                            html.Td(task.task_type),
-                            html.Td(drone_id),
-                            html.Td(dbc.Badge(task.state.value, color=color)),
-                            html.Td(created_str),
-                            html.Td(
-                                dbc.Button(
-                                    "👁",
-                                    id={'type': 'task-view-btn', 'task_id': task.task_id},
-                                    color="link",
-                                    size="sm",
-                                    className="p-0",
-                                    title="Click to highlight area, Double-click to show waypoints"
-                                )
-                            )
-                        ], 
-                        id=row_id,
-                        className='task-row')
-                    )
-                
-                return dbc.Table([
-                    html.Thead(html.Tr([
-                        html.Th("Task ID"),
-                        html.Th("Type"),
-                        html.Th("Drone"),
-                        html.Th("Status"),
-                        html.Th("Created"),
-                        html.Th("View")
-                    ])),
-                    html.Tbody(table_rows)
-                ], bordered=True, dark=True, hover=True, size='sm')
-            finally:
-                self.db_manager.close_session(session)
+            rows = self.current_snapshot()['task_rows']
+            return rows, {'display': 'none' if rows else 'block'}
         
         # Operational control callbacks
         @self.app.callback(
             Output('task-control-output', 'children'),
             [Input('cancel-task-btn', 'n_clicks'),
              Input('reset-stale-btn', 'n_clicks')],
-            [State('task-id-input', 'value')]
+            [State('task-id-input', 'value')],
+            prevent_initial_call=True
         )
         def handle_task_controls(cancel_clicks, reset_clicks, task_id):
-            from mission_control.orchestrator import MissionOrchestrator
-            orchestrator = MissionOrchestrator()
+            button_id = dash.callback_context.triggered_id
             
-            ctx = dash.callback_context
-            if not ctx.triggered:
-                return ""
-            
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            
-            if button_id == 'cancel-task-btn' and cancel_clicks > 0:
+            if button_id == 'cancel-task-btn':
                 if not task_id:
-                    return dbc.Alert("Please enter a Task ID", color="warning", dismissable=True)
+                    return _alert("Please enter a Task ID", "warning")
                 
-                success = orchestrator.cancel_task(task_id)
+                success = self.orchestrator.cancel_task(task_id)
                 if success:
-                    return dbc.Alert(f"[OK] Task {task_id} cancelled OK", color="success", dismissable=True)
+                    return _alert(f"[OK] Task {task_id} cancelled OK", "success")
                 else:
-                    return dbc.Alert(f"[FAIL] Failed to cancel task {task_id}", color="danger", dismissable=True)
+                    return _alert(f"[FAIL] Failed to cancel task {task_id}", "danger")
             
-            elif button_id == 'reset-stale-btn' and reset_clicks > 0:
-                count = orchestrator.reset_stale_tasks(max_age_hours=1)
-                return dbc.Alert(f"[OK] Reset {count} stale task(s)", color="success", dismissable=True)
+            elif button_id == 'reset-stale-btn':
+                count = self.orchestrator.reset_stale_tasks(max_age_hours=1)
+                return _alert(f"[OK] Reset {count} stale task(s)", "success")
             
             return ""
         
         @self.app.callback(
             Output('drone-control-output', 'children'),
             [Input('rts-btn', 'n_clicks')],
-            [State('drone-id-input', 'value')]
+            [State('drone-id-input', 'value')],
+            prevent_initial_call=True
         )
         def handle_drone_rts(n_clicks, drone_id):
-            if n_clicks == 0:
-                return ""
-            
             if not drone_id:
-                return dbc.Alert("Please enter a Drone ID", color="warning", dismissable=True)
-            
-            from mission_control.orchestrator import MissionOrchestrator
-            orchestrator = MissionOrchestrator()
+                return _alert("Please enter a Drone ID", "warning")
             
-            success = orchestrator.return_drone_to_station(drone_id)
+            success = self.orchestrator.return_drone_to_station(drone_id)
             if success:
-                return dbc.Alert(f"[OK] RTS command sent to {drone_id}", color="success", dismissable=True)
+                return _alert(f"[OK] RTS command sent to {drone_id}", "success")
             else:
-                return dbc.Alert(f"[FAIL] Failed to send RTS to {drone_id}", color="danger", dismissable=True)
+                return _alert(f"[FAIL] Failed to send RTS to {drone_id}", "danger")
         
         # Callback to handle pause/resume refresh button
         @self.app.callback(
@@ -681,59 +1040,19 @@ class DFSDashboard:
                 return new_state, button_text
             return is_paused, "⏸ Pause" if not is_paused else " Resume"
         
-        # Callback to handle task view button clicks
-        @self.app.callback(
+        # Single/double-click resolution runs in the browser (assets/dfs.js);
+        # only the resulting selection reaches the server, via update_map.
+        # DataTable ignores clicks on the already-active cell, so active_cell
+        # is cleared after each click to let a second click register
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='dfs', function_name='taskClick'),
             [Output('highlighted-task-id', 'data'),
-             Output('waypoint-task-id', 'data')],
-            [Input({'type': 'task-view-btn', 'task_id': dash.dependencies.ALL}, 'n_clicks')],
+             Output('waypoint-task-id', 'data'),
+             Output('task-table', 'active_cell')],
+            [Input('task-table', 'active_cell')],
             [State('highlighted-task-id', 'data'),
-             State('waypoint-task-id', 'data')],
-            prevent_initial_call=True
+             State('waypoint-task-id', 'data')]
         )
-        def handle_task_click(n_clicks_list, current_highlighted, current_waypoint):
-            ctx = dash.callback_context
-            if not ctx.triggered:
-                return current_highlighted, current_waypoint
-            
-            # Get which button was clicked
-            triggered_id = ctx.triggered[0]['prop_id']
-            if 'task-view-btn' in triggered_id:
-                import json
-                try:
-                    id_dict = json.loads(triggered_id.split('.')[0])
-                    task_id = id_dict['task_id']
-                    
-                    # Check if this is a double-click (same task clicked twice quickly)
-                    import time
-                    current_time = time.time()
-                    
-                    if task_id in self.click_counts:
-                        last_click_time = self.click_counts[task_id]
-                        time_diff = current_time - last_click_time
-                        
-                        if time_diff < 1.0:  # Double-click within 1 second
-                            # Double-click detected
-                            self.click_counts.pop(task_id, None)
-                            
-                            if current_waypoint == task_id:
-                                # Turn off waypoints
-                                return '', ''
-                            else:
-                                # Show waypoints
-                                return task_id, task_id
-                    
-                    # Single click: just highlight
-                    self.click_counts[task_id] = current_time
-                    if current_highlighted == task_id:
-                        # Toggle off highlight
-                        return '', ''
-                    else:
-                        # Highlight only
-                        return task_id, ''
-                except Exception as e:
-                    pass
-            
-            return current_highlighted, current_waypoint
         
         # Callback to update selected task info display
         @self.app.callback(
@@ -744,8 +1063,10 @@ class DFSDashboard:
         def update_task_info(highlighted_task_id, waypoint_task_id):
             if waypoint_task_id:
                 # Check if waypoints are loaded
-                if waypoint_task_id in self.gps_cache and self.gps_cache[waypoint_task_id]:
-                    num_waypoints = len(self.gps_cache[waypoint_task_id]['lats'])
+                entry = self.gps_cache.get(waypoint_task_id)
+                cached_data = entry['data'] if entry else None
+                if cached_data:
+                    num_waypoints = cached_data['count']
                     return html.Div([
                         html.I(className="bi bi-check-circle-fill me-2", style={'color': 'lime'}),
                         html.Span(f"Showing flight path for {waypoint_task_id} ({num_waypoints} waypoints)", 
@@ -764,7 +1085,7 @@ class DFSDashboard:
                              style={'color': 'cyan'})
                 ])
             else:
-                return html.Span("Click 👁 to highlight task area, double-click to show waypoints")
+                return html.Span("Click a task row to highlight its area, double-click to show waypoints")
     
     def run(self, debug=None):
         """Run the dashboard"""
@@ -777,7 +1098,12 @@ class DFSDashboard:
         logger.info(f"\n  Starting DFS Dashboard...")
         logger.info(f"   URL: http://{host}:{port}")
         
-        self.app.run_server(host=host, port=port, debug=debug)
+        if not debug and WAITRESS_AVAILABLE:
+            # Multi-threaded production server instead of the Flask dev server
+            # Each open /events stream holds a thread, so allow for a few tabs
+            waitress.serve(self.app.server, host=host, port=port, threads=32)
+        else:
+            self.app.run_server(host=host, port=port, debug=debug)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,164 @@
+/*
+ * DFS Dashboard - clientside callbacks
+ *
+ * Status cards, the fleet chart and the drone list are rendered in the
+ * browser from the fleet-snapshot store, and map refreshes are throttled
+ * here, so a refresh costs two server round-trips (snapshot and task
+ * table) instead of one per component. Refreshes are only sent when the
+ * server has pushed a new snapshot version over /events. Task-row clicks
+ * are resolved to highlight/waypoint selections here as well.
+ */
+var DRONE_STATE_COLORS = {idle: 'success', flying: 'warning'};
+var DOUBLE_CLICK_MS = 1000;
+var lastTaskClick = {taskId: null, time: 0};
+
+// Snapshot versions pushed by the server over /events. A stream that sees
+// no interval ticks for EVENTS_IDLE_MS (paused or hidden tab) is closed so
+// the server-side refresher can go idle.
+var EVENTS_IDLE_MS = 3000;
+var snapshotEvents = {source: null, version: null, sent: null, idleTimer: null};
+
+function snapshotStreamOpen() {
+    var ev = snapshotEvents;
+    return ev.source !== null && ev.source.readyState === EventSource.OPEN && ev.version !== null;
+}
+
+function touchSnapshotStream() {
+    var ev = snapshotEvents;
+    if (ev.source === null && typeof EventSource !== 'undefined') {
+        ev.source = new EventSource('events');
+        ev.source.onmessage = function(e) {
+            ev.version = JSON.parse(e.data).v;
+        };
+    }
+    clearTimeout(ev.idleTimer);
+    ev.idleTimer = setTimeout(function() {
+        if (ev.source !== null) {
+            ev.source.close();
+        }
+        ev.source = null;
+        ev.version = null;
+    }, EVENTS_IDLE_MS);
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dfs: {
+        renderCards: function(snapshot) {
+            if (!snapshot) {
+                return window.dash_clientside.no_update;
+            }
+            var drones = snapshot.drone_counts;
+            var tasks = snapshot.task_counts;
+            var detections = snapshot.detection_counts;
+            var count = function(counts, key) { return counts[key] || 0; };
+            var total = function(counts) {
+                return Object.values(counts).reduce(function(a, b) { return a + b; }, 0);
+            };
+
+            return [
+                String(snapshot.drones.length),
+                count(drones, 'idle') + ' idle, ' + count(drones, 'flying') + ' flying',
+                String(count(tasks, 'assigned') + count(tasks, 'executing')),
+                count(tasks, 'completed') + ' completed',
+                String(total(detections)),
+                count(detections, 'detected') + ' active, ' + count(detections, 'suppressed') + ' suppressed',
+                'OPERATIONAL'
+            ];
+        },
+
+        renderClock: function(n) {
+            return new Date().toTimeString().slice(0, 8);  // HH:MM:SS
+        },
+
+        renderDroneChart: function(snapshot) {
+            if (!snapshot) {
+                return window.dash_clientside.no_update;
+            }
+            return {
+                data: [{
+                    type: 'pie',
+                    labels: Object.keys(snapshot.drone_counts),
+                    values: Object.values(snapshot.drone_counts),
+                    hole: 0.3
+                }],
+                layout: {
+                    showlegend: true,
+                    margin: {l: 0, r: 0, t: 0, b: 0},
+                    paper_bgcolor: '#222',
+                    plot_bgcolor: '#222'
+                }
+            };
+        },
+
+        snapshotTick: function(n) {
+            touchSnapshotStream();
+            var ev = snapshotEvents;
+            // Without a live stream, fall back to fetching on every tick
+            if (snapshotStreamOpen()) {
+                if (ev.version === ev.sent) {
+                    return window.dash_clientside.no_update;
+                }
+                ev.sent = ev.version;
+            }
+            return n;
+        },
+
+        mapTick: function(n, tick) {
+            // The initial map is drawn by the server on page load
+            if (!n || n % tick.every !== 0) {
+                return window.dash_clientside.no_update;
+            }
+            if (snapshotStreamOpen() && snapshotEvents.version === tick.version) {
+                return window.dash_clientside.no_update;
+            }
+            return {every: tick.every, n: n, version: snapshotEvents.version};
+        },
+
+        taskClick: function(activeCell, highlighted, waypoint) {
+            var no_update = window.dash_clientside.no_update;
+            if (!activeCell) {
+                return [no_update, no_update, no_update];
+            }
+            var taskId = activeCell.row_id;
+            var now = performance.now();  // Monotonic - unaffected by clock changes
+
+            // Second click on the same row within the window toggles waypoints
+            if (lastTaskClick.taskId === taskId && now - lastTaskClick.time < DOUBLE_CLICK_MS) {
+                lastTaskClick = {taskId: null, time: 0};
+                return waypoint === taskId ? ['', '', null] : [taskId, taskId, null];
+            }
+
+            // Single click toggles the highlight only
+            lastTaskClick = {taskId: taskId, time: now};
+            return highlighted === taskId ? ['', '', null] : [taskId, '', null];
+        },
+
+        renderDroneList: function(snapshot) {
+            if (!snapshot) {
+                return window.dash_clientside.no_update;
+            }
+            return snapshot.drones.map(function(drone) {
+                var color = DRONE_STATE_COLORS[drone.state] || 'secondary';
+                return {
+                    namespace: 'dash_html_components',
+                    type: 'Div',
+                    props: {
+                        className: 'mb-2',
+                        children: [
+                            {
+                                namespace: 'dash_bootstrap_components',
+                                type: 'Badge',
+                                props: {children: drone.drone_id, color: color, className: 'me-2'}
+                            },
+                            {
+                                namespace: 'dash_html_components',
+                                type: 'Small',
+                                props: {children: Math.round(drone.battery_percent) + '%', className: 'text-muted'}
+                            }
+                        ]
+                    }
+                };
+            });
+        }
+    }
+});
@@ -1,17 +1,39 @@
 """
 Database module for Drone Firefighting System
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
 from .models import Base, Drone, Task, FireDetection, Telemetry, SystemLog
 from .models import DroneType, DroneState, TaskState
-import yaml
 import os
+from contextlib import contextmanager
+from utils.config import load_config
+
+# WAL lets the dashboard read while the orchestrator writes, and NORMAL
+# sync skips the per-commit fsync (still safe in WAL mode)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout=5000"
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to every new pool connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class DatabaseManager:
     def __init__(self, config_path='config/dfs_config.yaml'):
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         
         db_config = config['database']
         db_path = db_config['path']
@@ -25,6 +47,7 @@ class DatabaseManager:
             echo=db_config.get('echo', False),
             pool_size=db_config.get('pool_size', 10)
         )
+        event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         
         # Create session factory
         session_factory = sessionmaker(bind=self.engine)
@@ -32,6 +55,12 @@ class DatabaseManager:
         
         # Create tables
         Base.metadata.create_all(self.engine)
+        
+        # create_all skips tables that already exist, so indexes added to
+        # the models later are created here for older databases
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
     
     def get_session(self):
         return self.Session()
@@ -39,67 +68,87 @@ class DatabaseManager:
     def close_session(self, session):
         session.close()
     
+    @contextmanager
+    def session_scope(self):
+        """Session that commits on success, rolls back on error and always closes"""
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def bulk_add_telemetry(self, rows):
+        """Insert telemetry row dicts as one executemany batch (Core, no ORM)"""
+        if not rows:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(Telemetry.__table__.insert(), rows)
+    
     def init_drone_pool(self, config_path='config/dfs_config.yaml'):
         """Initialize drone pool from config"""
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        session = self.get_session()
+        config = load_config(config_path)
         
         try:
-            # Check if drones already exist
-            existing_count = session.query(Drone).count()
-            if existing_count > 0:
-                print(f"Drone pool already initialized with {existing_count} drones")
-                return
-            
-            # Create Scouter Drones
-            sd_config = config['drone_pool']['scouter_drones']
-            for i in range(1, sd_config['count'] + 1):
-                drone = Drone(
-                    drone_id=f"{sd_config['prefix']}-{i:03d}",
-                    drone_type=DroneType.SCOUTER,
-                    state=DroneState.IDLE,
-                    battery_percent=100.0,
-                    battery_capacity_mah=sd_config['battery_capacity_mah'],
-                    max_flight_time_min=sd_config['max_flight_time_min'],
-                    cruise_speed_ms=sd_config['cruise_speed_ms'],
-                    cruise_altitude_m=sd_config['cruise_altitude_m'],
-                    current_latitude=33.2271901,
-                    current_longitude=-96.8252657,
-                    current_altitude=0.0
-                )
-                session.add(drone)
-            
-            # Create Firefighter Drones
-            fd_config = config['drone_pool']['firefighter_drones']
-            for i in range(1, fd_config['count'] + 1):
-                drone = Drone(
-                    drone_id=f"{fd_config['prefix']}-{i:03d}",
-                    drone_type=DroneType.FIREFIGHTER,
-                    state=DroneState.IDLE,
-                    battery_percent=100.0,
-                    battery_capacity_mah=fd_config['battery_capacity_mah'],
-                    max_flight_time_min=fd_config['max_flight_time_min'],
-                    cruise_speed_ms=fd_config['cruise_speed_ms'],
-                    cruise_altitude_m=fd_config['cruise_altitude_m'],
-                    payload_capacity_kg=fd_config['payload_capacity_kg'],
-                    payload_remaining_kg=fd_config['payload_capacity_kg'],
-                    current_latitude=33.2271901,
-                    current_longitude=-96.8252657,
-                    current_altitude=0.0
-                )
-                session.add(drone)
-            
-            session.commit()
-            print(f"Initialized {sd_config['count']} Scouter Drones and {fd_config['count']} Firefighter Drones")
-            
+            with self.session_scope() as session:
+                # Check if drones already exist
+                existing_count = session.query(Drone).count()
+                if existing_count > 0:
+                    print(f"Drone pool already initialized with {existing_count} drones")
+                    return
+                
+                # Plain row dicts inserted in one executemany batch - no
+                # per-drone ORM instances or identity-map bookkeeping
+                home = {
+                    'state': DroneState.IDLE,
+                    'battery_percent': 100.0,
+                    'current_latitude': 33.2271901,
+                    'current_longitude': -96.8252657,
+                    'current_altitude': 0.0
+                }
+                
+                # Create Scouter Drones
+                sd_config = config['drone_pool']['scouter_drones']
+                sd_rows = [
+                    dict(
+                        home,
+                        drone_id=f"{sd_config['prefix']}-{i:03d}",
+                        drone_type=DroneType.SCOUTER,
+                        battery_capacity_mah=sd_config['battery_capacity_mah'],
+                        max_flight_time_min=sd_config['max_flight_time_min'],
+                        cruise_speed_ms=sd_config['cruise_speed_ms'],
+                        cruise_altitude_m=sd_config['cruise_altitude_m']
+                    )
+                    for i in range(1, sd_config['count'] + 1)
+                ]
+                
+                # Create Firefighter Drones
+                fd_config = config['drone_pool']['firefighter_drones']
+                fd_rows = [
+                    dict(
+                        home,
+                        drone_id=f"{fd_config['prefix']}-{i:03d}",
+                        drone_type=DroneType.FIREFIGHTER,
+                        battery_capacity_mah=fd_config['battery_capacity_mah'],
+                        max_flight_time_min=fd_config['max_flight_time_min'],
+                        cruise_speed_ms=fd_config['cruise_speed_ms'],
+                        cruise_altitude_m=fd_config['cruise_altitude_m'],
+                        payload_capacity_kg=fd_config['payload_capacity_kg'],
+                        payload_remaining_kg=fd_config['payload_capacity_kg']
+                    )
+                    for i in range(1, fd_config['count'] + 1)
+                ]
+                
+                session.bulk_insert_mappings(Drone, sd_rows)
+                session.bulk_insert_mappings(Drone, fd_rows)
         except Exception as e:
-            session.rollback()
             print(f"Error initializing drone pool: {e}")
             raise
-        finally:
-            self.close_session(session)
+        
+        print(f"Initialized {sd_config['count']} Scouter Drones and {fd_config['count']} Firefighter Drones")
 
 __all__ = [
     'DatabaseManager',
@@ -1,7 +1,7 @@
 """
 Database Models for Drone Firefighting System
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -94,7 +94,7 @@ class Task(Base):
     id = Column(Integer, primary_key=True)
     task_id = Column(String(50), unique=True, nullable=False)
     task_type = Column(String(20))  # 'scout' or 'suppress'
-    state = Column(Enum(TaskState), default=TaskState.CREATED)
+    state = Column(Enum(TaskState), default=TaskState.CREATED, index=True)
     priority = Column(String(10), default='medium')
     
     # Flight area (rectangular A-B-C-D)
@@ -113,7 +113,7 @@ class Task(Base):
     pattern = Column(String(20), default='serpentine')
     
     # Assignment
-    drone_id = Column(Integer, ForeignKey('drones.id'))
+    drone_id = Column(Integer, ForeignKey('drones.id'), index=True)
     assigned_at = Column(DateTime)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
@@ -124,7 +124,7 @@ class Task(Base):
     data_path = Column(String(255))
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)  # Dashboard lists newest first
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     notes = Column(Text)
     
@@ -175,6 +175,10 @@ class FireDetection(Base):
     
     # Relationships
     task = relationship("Task", back_populates="detections")
+    
+    __table_args__ = (
+        Index('ix_det_status_time', 'status', 'detected_at'),
+    )
 
 
 class Telemetry(Base):
@@ -202,6 +206,10 @@ class Telemetry(Base):
     
     # Relationships
     drone = relationship("Drone", back_populates="telemetry")
+    
+    __table_args__ = (
+        Index('ix_telemetry_drone_time', 'drone_id', 'timestamp'),
+    )
 
 
 class SystemLog(Base):
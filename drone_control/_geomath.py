@@ -0,0 +1,83 @@
+"""
+Scalar GPS math kernels for the simulated controllers
+Compiled with Numba when it is installed, plain math-module code otherwise
+"""
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_R = 6371000  # Earth radius in meters
+
+# Bound once so the pure-Python fallback skips the math module lookups
+_radians = math.radians
+_degrees = math.degrees
+_sin = math.sin
+_cos = math.cos
+_sqrt = math.sqrt
+_atan2 = math.atan2
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two GPS coordinates in meters"""
+    return haversine_m_trig(lat1, lon1, lat2, lon2, _cos(_radians(lat1)))
+
+
+def haversine_m_trig(lat1, lon1, lat2, lon2, cos_lat1):
+    """haversine_m with cos(lat1) supplied by the caller"""
+    lat2_rad = _radians(lat2)
+    dlat = _radians(lat2 - lat1)
+    dlon = _radians(lon2 - lon1)
+    
+    a = _sin(dlat/2)**2 + cos_lat1 * _cos(lat2_rad) * _sin(dlon/2)**2
+    c = 2 * _atan2(_sqrt(a), _sqrt(1-a))
+    
+    return EARTH_R * c
+
+
+def bearing_deg(lat1, lon1, lat2, lon2):
+    """Initial bearing from the first GPS coordinate to the second in degrees"""
+    lat1_rad = _radians(lat1)
+    return bearing_deg_trig(lon1, lat2, lon2, _sin(lat1_rad), _cos(lat1_rad))
+
+
+def bearing_deg_trig(lon1, lat2, lon2, sin_lat1, cos_lat1):
+    """bearing_deg with sin/cos(lat1) supplied by the caller"""
+    lat2_rad = _radians(lat2)
+    dlon = _radians(lon2 - lon1)
+    
+    y = _sin(dlon) * _cos(lat2_rad)
+    x = cos_lat1 * _sin(lat2_rad) - sin_lat1 * _cos(lat2_rad) * _cos(dlon)
+    
+    heading = _degrees(_atan2(y, x))
+    return heading + 360.0 if heading < 0.0 else heading  # atan2 is within [-180, 180]
+
+
+def distance_bearing_trig(lat1, lon1, lat2, lon2, sin_lat1, cos_lat1):
+    """(haversine_m, bearing_deg) in one pass, sharing the end-point trig"""
+    lat2_rad = _radians(lat2)
+    sin_lat2 = _sin(lat2_rad)
+    cos_lat2 = _cos(lat2_rad)
+    dlat = _radians(lat2 - lat1)
+    dlon = _radians(lon2 - lon1)
+    
+    a = _sin(dlat/2)**2 + cos_lat1 * cos_lat2 * _sin(dlon/2)**2
+    distance = EARTH_R * 2 * _atan2(_sqrt(a), _sqrt(1-a))
+    
+    y = _sin(dlon) * cos_lat2
+    x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * _cos(dlon)
+    heading = _degrees(_atan2(y, x))
+    
+    return distance, (heading + 360.0 if heading < 0.0 else heading)
+
+
+if NUMBA_AVAILABLE:
+    # The *_trig kernels are wrapped first so the wrappers call compiled code
+    haversine_m_trig = njit(cache=True, fastmath=True)(haversine_m_trig)
+    bearing_deg_trig = njit(cache=True, fastmath=True)(bearing_deg_trig)
+    distance_bearing_trig = njit(cache=True, fastmath=True)(distance_bearing_trig)
+    haversine_m = njit(cache=True, fastmath=True)(haversine_m)
+    bearing_deg = njit(cache=True, fastmath=True)(bearing_deg)
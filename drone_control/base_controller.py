@@ -6,6 +6,19 @@ Abstract base class defining the interface for all drone controllers
 from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
+import numpy as np
+
+DEFAULT_WAYPOINT_ALT = 50.0
+
+
+def waypoint_array(waypoints) -> np.ndarray:
+    """(N, 3) float64 lat/lon/alt array from waypoint dicts or an existing array"""
+    if isinstance(waypoints, np.ndarray):
+        return waypoints.astype(np.float64, copy=False).reshape(-1, 3)
+    return np.asarray(
+        [(wp['lat'], wp['lon'], wp.get('alt', DEFAULT_WAYPOINT_ALT)) for wp in waypoints],
+        dtype=np.float64
+    ).reshape(-1, 3)
 
 
 class FlightMode(Enum):
@@ -66,6 +79,7 @@ class DroneControllerBase(ABC):
     def upload_mission(self, waypoints: List[Dict]) -> bool:
         """
         Upload waypoint mission to drone
+        Waypoints are {'lat', 'lon', 'alt'} dicts or an (N, 3) lat/lon/alt array
         """
         pass
     
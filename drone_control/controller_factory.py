@@ -6,30 +6,48 @@ Creates appropriate drone controller based on config
 from .base_controller import DroneControllerBase
 from .demo_controller import DemoController
 from .pixhawk_controller import PixhawkController
-import yaml
+from utils.config import load_config
+from functools import lru_cache
+from typing import Dict, Tuple
+import threading
 import os
 
 
 class ControllerFactory:
     """Factory to create appropriate drone controller based on config"""
     
-    @staticmethod
-    def create_controller(drone_id: str, config_path: str = 'config/dfs_config.yaml', mode_override: str = None) -> DroneControllerBase:
+    # One controller per (drone_id, mode, config file), reused across missions
+    _controllers: Dict[Tuple[str, str, str], DroneControllerBase] = {}
+    _controllers_lock = threading.Lock()
+    
+    @classmethod
+    def create_controller(cls, drone_id: str, config_path: str = 'config/dfs_config.yaml', mode_override: str = None) -> DroneControllerBase:
         """
         Create drone controller based on config
+        Returns the cached controller if this drone already has one for the mode and config
         """
         
         # Load config
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         
         # Get drone control config
         drone_control_config = config.get('drone_control', {})
         mode = mode_override if mode_override else drone_control_config.get('mode', 'demo')
         
+        key = (drone_id, mode, os.path.abspath(config_path))
+        with cls._controllers_lock:
+            controller = cls._controllers.get(key)
+            if controller is None:
+                controller = cls._build_controller(drone_id, mode, drone_control_config)
+                cls._controllers[key] = controller
+        return controller
+    
+    @staticmethod
+    def _build_controller(drone_id: str, mode: str, drone_control_config: Dict) -> DroneControllerBase:
+        """Construct a new controller for the given mode"""
         # Create appropriate controller based on mode
         if mode in ['demo', 'simulation']:
             print(f"[FACTORY] Creating DEMO controller for {drone_id}")
@@ -46,6 +64,19 @@ class ControllerFactory:
         else:
             raise ValueError(f"Unknown drone control mode: {mode}. Use 'demo', 'simulation', or 'hardware'")
     
+    @classmethod
+    def release(cls, drone_id: str):
+        """
+        Disconnect and forget the cached controllers of a drone
+        """
+        with cls._controllers_lock:
+            keys = [key for key in cls._controllers if key[0] == drone_id]
+            controllers = [cls._controllers.pop(key) for key in keys]
+        
+        for controller in controllers:
+            if controller.is_connected():
+                controller.disconnect()
+    
     @staticmethod
     def get_available_modes() -> list:
         """
@@ -54,9 +85,11 @@ class ControllerFactory:
         return ['demo', 'simulation', 'hardware']
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_hardware_available() -> bool:
         """
         Check if hardware mode is available (dronekit installed)
+        Probed once per process - a failed import is retried on every call otherwise
         """
         try:
             import dronekit
@@ -6,8 +6,21 @@ Simulated drone controller for testing and demonstration without hardware
 from .base_controller import DroneControllerBase, FlightMode
 from typing import List, Dict, Tuple
 import time
-import random
 import math
+import logging
+import numpy as np
+from ._geomath import distance_bearing_trig
+
+log = logging.getLogger('DFS.drone_control')
+
+# Cheap-ruler constants (WGS84) - a flat-earth approximation that is within
+# 0.1% of the true ellipsoidal distance for hops of a few kilometres (the
+# spherical Haversine it replaces is itself up to ~0.5% off)
+_RE_M = 6378137.0
+_E2 = (1 / 298.257223563) * (2 - 1 / 298.257223563)
+_RULER_REFRESH_DEG = 0.5  # Recompute scale factors once this far from their latitude
+_NOISE_BATCH = 4096  # GPS noise samples drawn per RNG call
+_TRIG_LAT_DECIMALS = 4  # Start-latitude sin/cos are reused per 0.0001 deg bucket
 
 
 class DemoController(DroneControllerBase):
@@ -22,6 +35,22 @@ class DemoController(DroneControllerBase):
         
         # Connection state
         self.connected = False
+        self.battery_drain_rate = self.config.get('battery_drain_rate', 0.1)
+        self._reset_vehicle_state()
+        
+        # Simulation settings
+        self.simulate_delays = self.config.get('simulate_delays', True)
+        self.gps_noise = self.config.get('gps_noise_meters', 0.5)
+        self._rng = np.random.default_rng()
+        self._noise_buf = []
+        self._noise_idx = 0
+        self.use_cheap_ruler = self.config.get('use_cheap_ruler', True)
+        self._ruler_lat = None
+        self._kx = self._ky = 0.0
+        self._trig_cache = None  # (rounded lat, sin, cos) of the last start latitude
+        
+    def _reset_vehicle_state(self):
+        """Fresh simulated vehicle: on the ground, full battery, no mission"""
         self.armed = False
         self.mode = FlightMode.IDLE
         
@@ -32,28 +61,26 @@ class DemoController(DroneControllerBase):
         
         # Battery state
         self.battery = 100.0
-        self.battery_drain_rate = self.config.get('battery_drain_rate', 0.1)
         
         # Mission state
         self.mission_waypoints = []
         self.current_waypoint_index = 0
-        
-        # Simulation settings
-        self.simulate_delays = self.config.get('simulate_delays', True)
-        self.gps_noise = self.config.get('gps_noise_meters', 0.5)
-        
+    
     def connect(self) -> bool:
         """Connect to simulated drone"""
-        print(f"[DEMO] {self.drone_id}: Simulating connection...")
+        log.info("[DEMO] %s: Simulating connection...", self.drone_id)
         if self.simulate_delays:
             time.sleep(0.5)
+        # The factory reuses controllers across missions; each connection
+        # starts from a fresh vehicle rather than the last mission's state
+        self._reset_vehicle_state()
         self.connected = True
-        print(f"[DEMO] {self.drone_id}: Connected (simulated)")
+        log.info("[DEMO] %s: Connected (simulated)", self.drone_id)
         return True
     
     def disconnect(self):
         """Disconnect from simulated drone"""
-        print(f"[DEMO] {self.drone_id}: Disconnecting (simulated)")
+        log.info("[DEMO] %s: Disconnecting (simulated)", self.drone_id)
         self.connected = False
         self.armed = False
         self.mode = FlightMode.IDLE
@@ -61,43 +88,43 @@ class DemoController(DroneControllerBase):
     def arm(self) -> bool:
         """Arm simulated drone"""
         if not self.connected:
-            print(f"[DEMO] {self.drone_id}: Cannot arm - not connected")
+            log.warning("[DEMO] %s: Cannot arm - not connected", self.drone_id)
             return False
         
-        print(f"[DEMO] {self.drone_id}: Arming motors (simulated)")
+        log.info("[DEMO] %s: Arming motors (simulated)", self.drone_id)
         if self.simulate_delays:
             time.sleep(0.5)
         self.armed = True
-        print(f"[DEMO] {self.drone_id}: Motors armed")
+        log.info("[DEMO] %s: Motors armed", self.drone_id)
         return True
     
     def disarm(self) -> bool:
         """Disarm simulated drone"""
-        print(f"[DEMO] {self.drone_id}: Disarming motors (simulated)")
+        log.info("[DEMO] %s: Disarming motors (simulated)", self.drone_id)
         self.armed = False
         return True
     
     def takeoff(self, altitude_m: float) -> bool:
         """Simulate takeoff"""
         if not self.armed:
-            print(f"[DEMO] {self.drone_id}: Cannot takeoff - not armed")
+            log.warning("[DEMO] %s: Cannot takeoff - not armed", self.drone_id)
             return False
         
-        print(f"[DEMO] {self.drone_id}: Taking off to {altitude_m}m (simulated)")
+        log.info("[DEMO] %s: Taking off to %sm (simulated)", self.drone_id, altitude_m)
         if self.simulate_delays:
             time.sleep(1.0)
         
         lat, lon, _ = self.position
         self.position = (lat, lon, altitude_m)
         self.mode = FlightMode.GUIDED
-        self.battery -= 1.0  # Takeoff uses battery
+        self._drain_battery(1.0)  # Takeoff uses battery
         
-        print(f"[DEMO] {self.drone_id}: Reached altitude {altitude_m}m")
+        log.info("[DEMO] %s: Reached altitude %sm", self.drone_id, altitude_m)
         return True
     
     def land(self) -> bool:
         """Simulate landing"""
-        print(f"[DEMO] {self.drone_id}: Landing (simulated)")
+        log.info("[DEMO] %s: Landing (simulated)", self.drone_id)
         if self.simulate_delays:
             time.sleep(1.0)
         
@@ -106,24 +133,24 @@ class DemoController(DroneControllerBase):
         self.mode = FlightMode.LAND
         self.speed = 0.0
         
-        print(f"[DEMO] {self.drone_id}: Landed")
+        log.info("[DEMO] %s: Landed", self.drone_id)
         return True
     
     def upload_mission(self, waypoints: List[Dict]) -> bool:
         """Upload simulated mission"""
-        print(f"[DEMO] {self.drone_id}: Uploading {len(waypoints)} waypoints (simulated)")
+        log.info("[DEMO] %s: Uploading %s waypoints (simulated)", self.drone_id, len(waypoints))
         self.mission_waypoints = waypoints
         self.current_waypoint_index = 0
-        print(f"[DEMO] {self.drone_id}: Mission uploaded")
+        log.info("[DEMO] %s: Mission uploaded", self.drone_id)
         return True
     
     def start_mission(self) -> bool:
         """Start simulated mission"""
         if not self.mission_waypoints:
-            print(f"[DEMO] {self.drone_id}: No mission to start")
+            log.warning("[DEMO] %s: No mission to start", self.drone_id)
             return False
         
-        print(f"[DEMO] {self.drone_id}: Starting mission with {len(self.mission_waypoints)} waypoints (simulated)")
+        log.info("[DEMO] %s: Starting mission with %s waypoints (simulated)", self.drone_id, len(self.mission_waypoints))
         self.mode = FlightMode.AUTO
         self.current_waypoint_index = 0
         return True
@@ -131,28 +158,32 @@ class DemoController(DroneControllerBase):
     def goto_waypoint(self, lat: float, lon: float, alt: float) -> bool:
         """Simulate going to waypoint"""
         if not self.armed:
-            print(f"[DEMO] {self.drone_id}: Cannot goto waypoint - not armed")
+            log.warning("[DEMO] %s: Cannot goto waypoint - not armed", self.drone_id)
             return False
         
         # Calculate distance for simulation
         current_lat, current_lon, current_alt = self.position
-        distance = self._calculate_distance(current_lat, current_lon, lat, lon)
+        distance, heading = self._calc_dist_and_heading(current_lat, current_lon, lat, lon)
         
         # Simulate movement delay based on distance
         if self.simulate_delays and distance > 0:
             delay = min(distance / 10.0, 0.5)  # Max 0.5s delay
             time.sleep(delay)
         
-        # Add GPS noise
-        noise_lat = random.uniform(-self.gps_noise / 111000, self.gps_noise / 111000)
-        noise_lon = random.uniform(-self.gps_noise / 111000, self.gps_noise / 111000)
+        # Add GPS noise - drawn as east/north metres and scaled per axis with
+        # the local ruler factors, so longitude noise is not overstated
+        if self._noise_idx >= len(self._noise_buf):
+            self._refill_noise()
+        noise_x, noise_y = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
         
-        self.position = (lat + noise_lat, lon + noise_lon, alt)
-        self.battery -= self.battery_drain_rate
+        self._ensure_ruler(lat)
+        self.position = (lat + noise_y / self._ky, lon + noise_x / self._kx, alt)
+        self._drain_battery(self.battery_drain_rate)
         
         # Update speed and heading
         self.speed = 5.0  # Simulated cruise speed
-        self.heading = self._calculate_heading(current_lat, current_lon, lat, lon)
+        self.heading = heading
         
         return True
     
@@ -162,7 +193,12 @@ class DemoController(DroneControllerBase):
     
     def get_battery(self) -> float:
         """Get simulated battery level"""
-        return max(0.0, min(100.0, self.battery))
+        return self.battery  # Clamped when drained
+    
+    def _drain_battery(self, amount: float):
+        """Use battery charge, never going below empty"""
+        level = self.battery - amount
+        self.battery = level if level > 0.0 else 0.0
     
     def get_mode(self) -> FlightMode:
         """Get current flight mode"""
@@ -170,7 +206,7 @@ class DemoController(DroneControllerBase):
     
     def set_mode(self, mode: FlightMode) -> bool:
         """Set flight mode"""
-        print(f"[DEMO] {self.drone_id}: Setting mode to {mode.value} (simulated)")
+        log.info("[DEMO] %s: Setting mode to %s (simulated)", self.drone_id, mode.value)
         self.mode = mode
         return True
     
@@ -192,7 +228,7 @@ class DemoController(DroneControllerBase):
     
     def emergency_stop(self):
         """Simulate emergency stop"""
-        print(f"[DEMO] {self.drone_id}: EMERGENCY STOP - RTL (simulated)")
+        log.warning("[DEMO] %s: EMERGENCY STOP - RTL (simulated)", self.drone_id)
         self.mode = FlightMode.RTL
         self.speed = 0.0
     
@@ -202,7 +238,7 @@ class DemoController(DroneControllerBase):
         if abs(current_alt - target_altitude) < 0.5:
             return True
         
-        print(f"[DEMO] {self.drone_id}: Waiting for altitude {target_altitude}m (simulated)")
+        log.debug("[DEMO] %s: Waiting for altitude %sm (simulated)", self.drone_id, target_altitude)
         if self.simulate_delays:
             time.sleep(0.5)
         return True
@@ -213,37 +249,62 @@ class DemoController(DroneControllerBase):
             time.sleep(0.1)
         return True
     
-    def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance between two GPS coordinates in meters"""
-        # Haversine formula
-        R = 6371000  # Earth radius in meters
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return R * c
+    def _refill_noise(self):
+        """Draw the next batch of (east, north) GPS noise offsets in meters"""
+        s = self.gps_noise
+        self._noise_buf = self._rng.uniform(-s, s, size=(_NOISE_BATCH, 2)).tolist()
+        self._noise_idx = 0
+    
+    def _ruler_scale(self, lat: float):
+        """Cache metres-per-degree of longitude (kx) and latitude (ky) near lat"""
+        cos_lat = math.cos(math.radians(lat))
+        w2 = 1 / (1 - _E2 * (1 - cos_lat * cos_lat))
+        w = math.sqrt(w2)
+        m = math.radians(1) * _RE_M
+        self._kx = m * w * cos_lat
+        self._ky = m * w * w2 * (1 - _E2)
+        self._ruler_lat = lat
     
-    def _calculate_heading(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate heading between two GPS coordinates in degrees"""
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dlon = math.radians(lon2 - lon1)
+    def _ensure_ruler(self, lat: float):
+        """Refresh the ruler factors if lat has drifted away from them"""
+        if self._ruler_lat is None or abs(lat - self._ruler_lat) > _RULER_REFRESH_DEG:
+            self._ruler_scale(lat)
+    
+    def _calc_dist_and_heading(self, lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+        """Distance in meters and heading in degrees, sharing trig where possible"""
+        if self.use_cheap_ruler:
+            # Both come from the same local east/north offsets. The ruler scales
+            # are WGS84 ones, so this heading can differ from the spherical
+            # bearing by a few tenths of a degree - the ellipsoid accounts for
+            # most of that, not the flat projection
+            self._ensure_ruler(lat1)
+            dx = (lon2 - lon1) * self._kx
+            dy = (lat2 - lat1) * self._ky
+            heading = math.degrees(math.atan2(dx, dy))
+            return math.hypot(dx, dy), (heading + 360.0 if heading < 0.0 else heading)
         
-        y = math.sin(dlon) * math.cos(lat2_rad)
-        x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon)
+        sin_lat1, cos_lat1 = self._lat_trig(lat1)
+        return distance_bearing_trig(lat1, lon1, lat2, lon2, sin_lat1, cos_lat1)
+    
+    def _lat_trig(self, lat: float) -> Tuple[float, float]:
+        """sin/cos of a start latitude, reused while the drone stays near it"""
+        key = round(lat, _TRIG_LAT_DECIMALS)
+        cache = self._trig_cache
+        if cache is None or cache[0] != key:
+            lat_rad = math.radians(key)
+            cache = self._trig_cache = (key, math.sin(lat_rad), math.cos(lat_rad))
         
-        heading = math.degrees(math.atan2(y, x))
-        return (heading + 360) % 360
+        # First-order correction from the bucket centre - the offset is under
+        # 1e-6 rad, so the dropped terms are far below float noise in metres
+        _, sin_key, cos_key = cache
+        delta = math.radians(lat - key)
+        return sin_key + delta * cos_key, cos_key - delta * sin_key
     
     def set_home_position(self, lat: float, lon: float, alt: float):
         """Set home position for simulated drone"""
-        print(f"[DEMO] {self.drone_id}: Setting home position to ({lat:.6f}, {lon:.6f}, {alt}m)")
+        log.info("[DEMO] %s: Setting home position to (%.6f, %.6f, %sm)", self.drone_id, lat, lon, alt)
         self.position = (lat, lon, 0.0)  # Start on ground
+        self._ruler_scale(lat)
     
     def get_mission_progress(self) -> Tuple[int, int]:
         """
@@ -3,11 +3,18 @@ Pixhawk Drone Controller
 Real hardware controller using MAVLink/DroneKit for Pixhawk flight controllers
 """
 
-from .base_controller import DroneControllerBase, FlightMode
+from .base_controller import DroneControllerBase, FlightMode, waypoint_array
 from typing import List, Dict, Tuple
 import os
-import glob
 import time
+import threading
+import logging
+from functools import reduce
+from types import MappingProxyType
+
+# Child of the DFS logger, so messages use its handlers and level; arguments
+# are only formatted for records that pass the level check
+log = logging.getLogger('DFS.drone_control')
 
 # Try to import dronekit - it's optional for demo mode
 try:
@@ -19,10 +26,31 @@ except ImportError:
     print("WARNING: dronekit not installed. Hardware mode unavailable.")
     print("Install with: pip install dronekit pymavlink")
 
+# Autopilot mode name <-> FlightMode, read-only and shared by all controllers
+_MODE_FROM_MAVLINK = MappingProxyType({
+    "STABILIZE": FlightMode.IDLE,
+    "GUIDED": FlightMode.GUIDED,
+    "AUTO": FlightMode.AUTO,
+    "RTL": FlightMode.RTL,
+    "LAND": FlightMode.LAND
+})
+_MODE_TO_MAVLINK = MappingProxyType({
+    mode: name for name, mode in _MODE_FROM_MAVLINK.items() if mode != FlightMode.IDLE
+})
+
+# Mode objects are built once and reused for every mode change
+if DRONEKIT_AVAILABLE:
+    _MODES = MappingProxyType({mode: VehicleMode(name) for mode, name in _MODE_TO_MAVLINK.items()})
+
 
 class PixhawkController(DroneControllerBase):
     """Real Pixhawk flight controller via MAVLink"""
     
+    # /dev scan results shared by all controllers: (monotonic time, ports)
+    _PORT_CACHE = {}
+    _PORT_CACHE_TTL = 2.0
+    _SERIAL_PREFIXES = ("serial", "ttyAMA", "ttyACM", "ttyUSB")
+    
     def __init__(self, drone_id: str, connection_string: str = '/dev/ttyACM0', baud: int = 57600):
         """
         Initialize Pixhawk controller
@@ -38,76 +66,90 @@ class PixhawkController(DroneControllerBase):
     def connect(self) -> bool:
         """Connect to Pixhawk via MAVLink"""
         try:
-            print(f"[HARDWARE] {self.drone_id}: Connecting to Pixhawk at {self.connection_string}...")
+            log.info("[HARDWARE] %s: Connecting to Pixhawk at %s...", self.drone_id, self.connection_string)
 
             if (
                 isinstance(self.connection_string, str)
                 and self.connection_string.startswith("/dev/")
                 and not os.path.exists(self.connection_string)
             ):
-                candidates = []
-                for pattern in (
-                    "/dev/serial*",
-                    "/dev/ttyAMA*",
-                    "/dev/ttyACM*",
-                    "/dev/ttyUSB*",
-                ):
-                    candidates.extend(sorted(glob.glob(pattern)))
+                candidates = self._scan_serial_ports()
 
-                print(
-                    f"[HARDWARE] {self.drone_id}: Connection failed: device does not exist: {self.connection_string}"
+                log.error(
+                    "[HARDWARE] %s: Connection failed: device does not exist: %s",
+                    self.drone_id, self.connection_string
                 )
                 if candidates:
-                    print(f"[HARDWARE] {self.drone_id}: Available serial candidates:")
+                    log.info("[HARDWARE] %s: Available serial candidates:", self.drone_id)
                     for c in candidates:
-                        print(f"[HARDWARE]   - {c}")
+                        log.info("[HARDWARE]   - %s", c)
                 else:
-                    print(
-                        f"[HARDWARE] {self.drone_id}: No serial devices found under /dev/serial*, /dev/ttyAMA*, /dev/ttyACM*, /dev/ttyUSB*"
+                    log.warning(
+                        "[HARDWARE] %s: No serial devices found under /dev/serial*, /dev/ttyAMA*, /dev/ttyACM*, /dev/ttyUSB*",
+                        self.drone_id
                     )
                 return False
 
             self.vehicle = connect(self.connection_string, baud=self.baud, wait_ready=True, timeout=30)
             
-            print(f"[HARDWARE] {self.drone_id}: Connected to Pixhawk")
-            print(f"[HARDWARE] Autopilot: {self.vehicle.version}")
-            print(f"[HARDWARE] GPS: {self.vehicle.gps_0}")
-            print(f"[HARDWARE] Battery: {self.vehicle.battery}")
+            log.info("[HARDWARE] %s: Connected to Pixhawk", self.drone_id)
+            log.info("[HARDWARE] Autopilot: %s", self.vehicle.version)
+            log.info("[HARDWARE] GPS: %s", self.vehicle.gps_0)
+            log.info("[HARDWARE] Battery: %s", self.vehicle.battery)
             
             return True
         except Exception as e:
-            print(f"[HARDWARE] {self.drone_id}: Connection failed: {e}")
+            log.error("[HARDWARE] %s: Connection failed: %s", self.drone_id, e)
             return False
     
+    @classmethod
+    def _scan_serial_ports(cls) -> List[str]:
+        """Serial device candidates under /dev, cached briefly across reconnect attempts"""
+        cached = cls._PORT_CACHE.get('/dev')
+        now = time.monotonic()
+        if cached and now - cached[0] < cls._PORT_CACHE_TTL:
+            return cached[1]
+        
+        # One directory read instead of a glob per prefix
+        by_prefix = {prefix: [] for prefix in cls._SERIAL_PREFIXES}
+        try:
+            with os.scandir('/dev') as entries:
+                for entry in entries:
+                    for prefix in cls._SERIAL_PREFIXES:
+                        if entry.name.startswith(prefix):
+                            by_prefix[prefix].append(entry.path)
+                            break
+        except OSError:
+            pass
+        
+        ports = [path for prefix in cls._SERIAL_PREFIXES for path in sorted(by_prefix[prefix])]
+        cls._PORT_CACHE['/dev'] = (now, ports)
+        return ports
+    
     def disconnect(self):
         """Disconnect from Pixhawk"""
         if self.vehicle:
-            print(f"[HARDWARE] {self.drone_id}: Disconnecting from Pixhawk")
+            log.info("[HARDWARE] %s: Disconnecting from Pixhawk", self.drone_id)
             self.vehicle.close()
             self.vehicle = None
     
     def arm(self) -> bool:
         """Arm the drone motors"""
         if not self.vehicle:
-            print(f"[HARDWARE] {self.drone_id}: Cannot arm - not connected")
+            log.warning("[HARDWARE] %s: Cannot arm - not connected", self.drone_id)
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Arming motors...")
-        self.vehicle.mode = VehicleMode("GUIDED")
+        log.info("[HARDWARE] %s: Arming motors...", self.drone_id)
+        self.vehicle.mode = _MODES[FlightMode.GUIDED]
         self.vehicle.armed = True
         
         # Wait for arming
-        timeout = 10
-        start = time.time()
-        while not self.vehicle.armed and (time.time() - start) < timeout:
-            print(f"[HARDWARE] {self.drone_id}: Waiting for arming...")
-            time.sleep(1)
-        
-        if self.vehicle.armed:
-            print(f"[HARDWARE] {self.drone_id}: Motors armed")
+        log.debug("[HARDWARE] %s: Waiting for arming...", self.drone_id)
+        if self._wait_for('armed', bool, timeout=10):
+            log.info("[HARDWARE] %s: Motors armed", self.drone_id)
             return True
         else:
-            print(f"[HARDWARE] {self.drone_id}: Arming failed")
+            log.error("[HARDWARE] %s: Arming failed", self.drone_id)
             return False
     
     def disarm(self) -> bool:
@@ -115,29 +157,25 @@ class PixhawkController(DroneControllerBase):
         if not self.vehicle:
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Disarming motors...")
+        log.info("[HARDWARE] %s: Disarming motors...", self.drone_id)
         self.vehicle.armed = False
-        time.sleep(1)
-        return not self.vehicle.armed
+        return self._wait_for('armed', lambda armed: not armed, timeout=1)
     
     def takeoff(self, altitude_m: float) -> bool:
         """Takeoff to specified altitude"""
         if not self.vehicle or not self.vehicle.armed:
-            print(f"[HARDWARE] {self.drone_id}: Cannot takeoff - not armed")
+            log.warning("[HARDWARE] %s: Cannot takeoff - not armed", self.drone_id)
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Taking off to {altitude_m}m...")
+        log.info("[HARDWARE] %s: Taking off to %sm...", self.drone_id, altitude_m)
         self.vehicle.simple_takeoff(altitude_m)
         
         # Wait for altitude
-        while True:
-            current_alt = self.vehicle.location.global_relative_frame.alt
-            print(f"[HARDWARE] {self.drone_id}: Altitude: {current_alt:.1f}m")
-            
-            if current_alt >= altitude_m * 0.95:
-                print(f"[HARDWARE] {self.drone_id}: Reached target altitude")
-                break
-            time.sleep(1)
+        self._wait_for(
+            'location.global_relative_frame',
+            lambda loc: loc.alt is not None and loc.alt >= altitude_m * 0.95
+        )
+        log.info("[HARDWARE] %s: Reached target altitude", self.drone_id)
         
         return True
     
@@ -146,36 +184,37 @@ class PixhawkController(DroneControllerBase):
         if not self.vehicle:
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Landing...")
-        self.vehicle.mode = VehicleMode("LAND")
+        log.info("[HARDWARE] %s: Landing...", self.drone_id)
+        self.vehicle.mode = _MODES[FlightMode.LAND]
         return True
     
     def upload_mission(self, waypoints: List[Dict]) -> bool:
         """Upload waypoint mission to Pixhawk"""
         if not self.vehicle:
-            print(f"[HARDWARE] {self.drone_id}: Cannot upload mission - not connected")
+            log.warning("[HARDWARE] %s: Cannot upload mission - not connected", self.drone_id)
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Uploading {len(waypoints)} waypoints...")
+        log.info("[HARDWARE] %s: Uploading %s waypoints...", self.drone_id, len(waypoints))
+        
+        # Build every command up front - plain floats from one array conversion,
+        # and a malformed waypoint fails before the vehicle mission is cleared
+        frame = mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT
+        nav_waypoint = mavutil.mavlink.MAV_CMD_NAV_WAYPOINT
+        cmd_list = [
+            Command(0, 0, 0, frame, nav_waypoint, 0, 0, 0, 0, 0, 0, lat, lon, alt)
+            for lat, lon, alt in waypoint_array(waypoints).tolist()
+        ]
         
-        # Clear existing mission
+        # Replace the existing mission
         cmds = self.vehicle.commands
         cmds.clear()
+        add = cmds.add
+        for cmd in cmd_list:
+            add(cmd)
         
-        # Add waypoints
-        for i, wp in enumerate(waypoints):
-            cmd = Command(
-                0, 0, 0,
-                mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT,
-                mavutil.mavlink.MAV_CMD_NAV_WAYPOINT,
-                0, 0, 0, 0, 0, 0,
-                wp['lat'], wp['lon'], wp.get('alt', 50.0)
-            )
-            cmds.add(cmd)
-            
         # Upload
         cmds.upload()
-        print(f"[HARDWARE] {self.drone_id}: Mission uploaded OK")
+        log.info("[HARDWARE] %s: Mission uploaded OK", self.drone_id)
         return True
     
     def start_mission(self) -> bool:
@@ -183,8 +222,8 @@ class PixhawkController(DroneControllerBase):
         if not self.vehicle:
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Starting mission...")
-        self.vehicle.mode = VehicleMode("AUTO")
+        log.info("[HARDWARE] %s: Starting mission...", self.drone_id)
+        self.vehicle.mode = _MODES[FlightMode.AUTO]
         return True
     
     def goto_waypoint(self, lat: float, lon: float, alt: float) -> bool:
@@ -192,7 +231,7 @@ class PixhawkController(DroneControllerBase):
         if not self.vehicle:
             return False
         
-        print(f"[HARDWARE] {self.drone_id}: Going to ({lat:.6f}, {lon:.6f}, {alt}m)")
+        log.debug("[HARDWARE] %s: Going to (%.6f, %.6f, %sm)", self.drone_id, lat, lon, alt)
         location = LocationGlobalRelative(lat, lon, alt)
         self.vehicle.simple_goto(location)
         return True
@@ -217,31 +256,17 @@ class PixhawkController(DroneControllerBase):
         if not self.vehicle:
             return FlightMode.IDLE
         
-        mode_map = {
-            "STABILIZE": FlightMode.IDLE,
-            "GUIDED": FlightMode.GUIDED,
-            "AUTO": FlightMode.AUTO,
-            "RTL": FlightMode.RTL,
-            "LAND": FlightMode.LAND
-        }
-        return mode_map.get(self.vehicle.mode.name, FlightMode.IDLE)
+        return _MODE_FROM_MAVLINK.get(self.vehicle.mode.name, FlightMode.IDLE)
     
     def set_mode(self, mode: FlightMode) -> bool:
         """Set flight mode"""
         if not self.vehicle:
             return False
         
-        mode_map = {
-            FlightMode.GUIDED: "GUIDED",
-            FlightMode.AUTO: "AUTO",
-            FlightMode.RTL: "RTL",
-            FlightMode.LAND: "LAND"
-        }
-        
-        mavlink_mode = mode_map.get(mode)
+        mavlink_mode = _MODES.get(mode)
         if mavlink_mode:
-            print(f"[HARDWARE] {self.drone_id}: Setting mode to {mavlink_mode}")
-            self.vehicle.mode = VehicleMode(mavlink_mode)
+            log.info("[HARDWARE] %s: Setting mode to %s", self.drone_id, mavlink_mode.name)
+            self.vehicle.mode = mavlink_mode
             return True
         return False
     
@@ -268,34 +293,52 @@ class PixhawkController(DroneControllerBase):
     def emergency_stop(self):
         """Emergency stop - RTL"""
         if self.vehicle:
-            print(f"[HARDWARE] {self.drone_id}: EMERGENCY - Returning to launch")
-            self.vehicle.mode = VehicleMode("RTL")
+            log.warning("[HARDWARE] %s: EMERGENCY - Returning to launch", self.drone_id)
+            self.vehicle.mode = _MODES[FlightMode.RTL]
+    
+    def _wait_for(self, attr_name: str, done, timeout: float = None) -> bool:
+        """Block until done(value) holds for a vehicle attribute, driven by MAVLink updates"""
+        reached = threading.Event()
+        
+        def listener(vehicle, name, value):
+            if done(value):
+                reached.set()
+        
+        self.vehicle.add_attribute_listener(attr_name, listener)
+        try:
+            if done(reduce(getattr, attr_name.split('.'), self.vehicle)):
+                return True
+            return reached.wait(timeout)
+        finally:
+            self.vehicle.remove_attribute_listener(attr_name, listener)
     
     def wait_for_altitude(self, target_altitude: float, timeout: float = 30.0) -> bool:
         """Wait until drone reaches target altitude"""
         if not self.vehicle:
             return False
         
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            current_alt = self.vehicle.location.global_relative_frame.alt
-            if abs(current_alt - target_altitude) < 0.5:
-                return True
-            time.sleep(0.5)
-        
-        return False
+        return self._wait_for(
+            'location.global_relative_frame',
+            lambda loc: loc.alt is not None and abs(loc.alt - target_altitude) < 0.5,
+            timeout=timeout
+        )
     
     def wait_for_waypoint(self, timeout: float = 60.0) -> bool:
         """Wait until current waypoint is reached"""
         if not self.vehicle:
             return False
         
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            # Check if waypoint reached (distance < 1m)
-            nextwaypoint = self.vehicle.commands.next
-            if nextwaypoint == 0:
-                return True
-            time.sleep(0.5)
+        if self.vehicle.commands.next == 0:
+            return True
         
-        return False
+        # The autopilot reports each waypoint it reaches
+        reached = threading.Event()
+        
+        def listener(vehicle, name, message):
+            reached.set()
+        
+        self.vehicle.add_message_listener('MISSION_ITEM_REACHED', listener)
+        try:
+            return reached.wait(timeout)
+        finally:
+            self.vehicle.remove_message_listener('MISSION_ITEM_REACHED', listener)
@@ -5,101 +5,210 @@ Run this in a separate terminal while mission is executing to send emergency com
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import argparse
+import asyncio
+import json
 import sys
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class EmergencyControl:
     """Send emergency commands to drone during mission execution"""
     
-    def __init__(self, drone_ip: str, drone_port: int = 5000):
+    def __init__(self, drone_ip: str, drone_port: int = 5000, output=print):
         self.base_url = f"http://{drone_ip}:{drone_port}"
         self.drone_ip = drone_ip
         self.drone_port = drone_port
+        # Where command feedback goes; fleet commands collect it per drone
+        self.output = output
+        
+        # One keep-alive connection to the drone, reused by every command
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        # Replies are small JSON blobs - not worth a gzip round on either end
+        self.session.headers['Accept-Encoding'] = 'identity'
     
     def get_status(self) -> Optional[dict]:
         """Get current drone status"""
         try:
-            response = requests.get(f"{self.base_url}/api/status", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/status", timeout=5)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             return None
         except Exception as e:
-            print(f"[ERROR] Failed to get status: {e}")
+            self.output(f"[ERROR] Failed to get status: {e}")
             return None
     
     def abort_mission(self) -> bool:
         """Abort current mission and RTL"""
         try:
-            print("\n[WARN] Sending ABORT command...")
-            response = requests.post(f"{self.base_url}/api/mission/abort", timeout=5)
+            self.output("\n[WARN] Sending ABORT command...")
+            response = self.session.post(f"{self.base_url}/api/mission/abort", timeout=5)
             if response.status_code == 200:
-                result = response.json()
-                print(f"[OK] {result.get('message', 'Mission aborted')}")
+                result = _json_loads(response.content)
+                self.output(f"[OK] {result.get('message', 'Mission aborted')}")
                 return True
             else:
-                print(f"[ERROR] Abort failed: {response.status_code}")
+                self.output(f"[ERROR] Abort failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"[ERROR] Failed to abort: {e}")
+            self.output(f"[ERROR] Failed to abort: {e}")
             return False
     
     def return_to_launch(self) -> bool:
         """Return to launch position (safe return home)"""
         try:
-            print("\n[HOME] Sending RTL command...")
-            response = requests.post(f"{self.base_url}/api/rtl", timeout=5)
+            self.output("\n[HOME] Sending RTL command...")
+            response = self.session.post(f"{self.base_url}/api/rtl", timeout=5)
             if response.status_code == 200:
-                result = response.json()
-                print(f"[OK] {result.get('message', 'RTL initiated')}")
+                result = _json_loads(response.content)
+                self.output(f"[OK] {result.get('message', 'RTL initiated')}")
                 return True
             else:
-                print(f"[ERROR] RTL failed: {response.status_code}")
+                self.output(f"[ERROR] RTL failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"[ERROR] Failed to RTL: {e}")
+            self.output(f"[ERROR] Failed to RTL: {e}")
             return False
     
     def land(self) -> bool:
         """Emergency land at current position"""
         try:
-            print("\n[LAND] Sending LAND command...")
-            response = requests.post(f"{self.base_url}/api/land", timeout=5)
+            self.output("\n[LAND] Sending LAND command...")
+            response = self.session.post(f"{self.base_url}/api/land", timeout=5)
             if response.status_code == 200:
-                result = response.json()
-                print(f"[OK] {result.get('message', 'Landing initiated')}")
+                result = _json_loads(response.content)
+                self.output(f"[OK] {result.get('message', 'Landing initiated')}")
                 return True
             else:
-                print(f"[ERROR] Land failed: {response.status_code}")
+                self.output(f"[ERROR] Land failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"[ERROR] Failed to land: {e}")
+            self.output(f"[ERROR] Failed to land: {e}")
             return False
     
     def kill(self) -> bool:
         """KILL SWITCH - Immediate motor stop (DANGEROUS!)"""
         try:
-            print("\n[KILL] WARNING: KILL SWITCH - MOTORS WILL STOP IMMEDIATELY!")
-            print("[KILL] WARNING: DRONE WILL FALL IF AIRBORNE!")
+            self.output("\n[KILL] WARNING: KILL SWITCH - MOTORS WILL STOP IMMEDIATELY!")
+            self.output("[KILL] WARNING: DRONE WILL FALL IF AIRBORNE!")
             confirm = input("[KILL] Type 'KILL' to confirm: ")
             
             if confirm != "KILL":
-                print("[KILL] Cancelled")
+                self.output("[KILL] Cancelled")
                 return False
             
-            response = requests.post(f"{self.base_url}/api/kill", timeout=5)
+            response = self.session.post(f"{self.base_url}/api/kill", timeout=5)
             if response.status_code == 200:
-                result = response.json()
-                print(f"[KILL] {result.get('message', 'Motors stopped')}")
+                result = _json_loads(response.content)
+                self.output(f"[KILL] {result.get('message', 'Motors stopped')}")
                 return True
             else:
-                print(f"[ERROR] Kill failed: {response.status_code}")
+                self.output(f"[ERROR] Kill failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"[ERROR] Failed to kill: {e}")
+            self.output(f"[ERROR] Failed to kill: {e}")
             return False
 
 
+class FleetEmergencyControl:
+    """Send the same emergency command to several drones concurrently"""
+    
+    def __init__(self, drones: List[Tuple[str, int]]):
+        self.controllers = [EmergencyControl(ip, port) for ip, port in drones]
+    
+    def abort_all(self) -> Dict[str, bool]:
+        """Abort the mission on every drone"""
+        return self._fan_out('abort_mission')
+    
+    def return_to_launch_all(self) -> Dict[str, bool]:
+        """Send every drone home"""
+        return self._fan_out('return_to_launch')
+    
+    def land_all(self) -> Dict[str, bool]:
+        """Land every drone at its current position"""
+        return self._fan_out('land')
+    
+    def get_status_all(self) -> Dict[str, Optional[dict]]:
+        """Current status of every drone"""
+        return self._fan_out('get_status')
+    
+    def _fan_out(self, method: str) -> Dict:
+        """Run one EmergencyControl method against all drones at once"""
+        results = {}
+        for drone, (result, messages) in asyncio.run(self._gather(method)).items():
+            # Printed once every drone has answered, so lines never interleave
+            for message in messages:
+                print(f"{drone}  {message.strip()}")
+            results[drone] = result
+        return results
+    
+    async def _gather(self, method: str) -> Dict:
+        # Each blocking request runs on its own worker thread, so the whole
+        # fleet is reached in roughly one round trip instead of one per drone
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._run_collecting, controller, method)
+            for controller in self.controllers
+        ))
+        return {
+            f"{controller.drone_ip}:{controller.drone_port}": result
+            for controller, result in zip(self.controllers, results)
+        }
+    
+    @staticmethod
+    def _run_collecting(controller: EmergencyControl, method: str) -> Tuple:
+        """(result, messages) of one controller method, its output held back"""
+        messages = []
+        output, controller.output = controller.output, messages.append
+        try:
+            return getattr(controller, method)(), messages
+        finally:
+            controller.output = output
+
+
+def print_status(status: Optional[dict]):
+    """Print a drone status dict"""
+    if status:
+        print("\n[STATUS] Drone Status:")
+        for key, value in status.items():
+            print(f"   {key}: {value}")
+    else:
+        print("\n[ERROR] Cannot get status")
+
+
+def fleet_mode(fleet: FleetEmergencyControl, args):
+    """Run a single command against every drone given with --ips"""
+    if args.abort:
+        results = fleet.abort_all()
+    elif args.rtl:
+        results = fleet.return_to_launch_all()
+    elif args.land:
+        results = fleet.land_all()
+    else:
+        for drone, status in fleet.get_status_all().items():
+            print(f"\n[DRONE] {drone}")
+            print_status(status)
+        return
+    
+    print("\n" + "-"*70)
+    for drone, ok in results.items():
+        print(f"  {'[OK]' if ok else '[FAIL]'} {drone}")
+
+
 def interactive_mode(controller: EmergencyControl):
     """Interactive menu for emergency control"""
     print("\n" + "="*70)
@@ -140,13 +249,7 @@ def interactive_mode(controller: EmergencyControl):
         elif choice == '4':
             controller.kill()
         elif choice == '5':
-            status = controller.get_status()
-            if status:
-                print(f"\n[STATUS] Drone Status:")
-                for key, value in status.items():
-                    print(f"   {key}: {value}")
-            else:
-                print("\n[ERROR] Cannot get status")
+            print_status(controller.get_status())
         elif choice == '6':
             print("\n[EXIT] Exiting emergency control")
             break
@@ -169,6 +272,9 @@ Examples:
   python emergency_control.py --ip 10.10.8.1 --land
   python emergency_control.py --ip 10.10.8.1 --kill
   python emergency_control.py --ip 10.10.8.1 --status
+  
+  # Same command to several drones at once
+  python emergency_control.py --ips 10.10.8.1,10.10.8.2 --abort
 
 Safety Notes:
   - ABORT: Safest option - stops mission and returns home
@@ -177,7 +283,9 @@ Safety Notes:
   - KILL: DANGEROUS - Stops motors immediately, drone will fall!
         """
     )
-    parser.add_argument('--ip', required=True, help='Drone IP address (e.g., 10.10.8.1)')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--ip', help='Drone IP address (e.g., 10.10.8.1)')
+    target.add_argument('--ips', help='Comma-separated drone IPs for fleet-wide abort/rtl/land/status (not --kill)')
     parser.add_argument('--port', type=int, default=5000, help='Drone port (default: 5000)')
     parser.add_argument('--abort', action='store_true', help='Abort mission')
     parser.add_argument('--rtl', action='store_true', help='Return to launch')
@@ -187,6 +295,16 @@ Safety Notes:
     
     args = parser.parse_args()
     
+    if args.ips:
+        # Kill is never fanned out: each drone needs its own typed confirmation
+        if args.kill:
+            parser.error('--kill cannot be combined with --ips; use --ip for each drone')
+        if not (args.abort or args.rtl or args.land or args.status):
+            parser.error('--ips needs one of --abort, --rtl, --land or --status')
+        drones = [(ip.strip(), args.port) for ip in args.ips.split(',') if ip.strip()]
+        fleet_mode(FleetEmergencyControl(drones), args)
+        return
+    
     controller = EmergencyControl(args.ip, args.port)
     
     # Check if any command flag is set
@@ -199,13 +317,7 @@ Safety Notes:
     elif args.kill:
         controller.kill()
     elif args.status:
-        status = controller.get_status()
-        if status:
-            print("\n[STATUS] Drone Status:")
-            for key, value in status.items():
-                print(f"   {key}: {value}")
-        else:
-            print("\n[ERROR] Cannot get status")
+        print_status(controller.get_status())
     else:
         # No command flag - enter interactive mode
         interactive_mode(controller)
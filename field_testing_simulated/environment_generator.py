@@ -6,77 +6,111 @@ Generates realistic DHT22 and BMP280 sensor data
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict
 import yaml
 
+try:
+    from utils.config import load_config
+except ImportError:
+    # Standalone run from this directory: parse without the shared cache
+    def load_config(config_path):
+        with open(config_path, 'r') as f:
+            return yaml.safe_load(f)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _baro_alt(pressure_hpa, sea_level_pressure):
+    """Barometric formula: altitude in meters for one pressure reading"""
+    return 44330 * (1 - (pressure_hpa / sea_level_pressure) ** 0.1903)
+
+
+if NUMBA_AVAILABLE:
+    _baro_alt = njit(cache=True, fastmath=True)(_baro_alt)
+
 
 class EnvironmentGenerator:
     def __init__(self, config_file: str = "simulation_config.yaml"):
         """Initialize environment generator with config"""
-        with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_file)
         
         self.env_config = self.config['environment']
         self.sim_config = self.config['simulation']
         
-        # Set random seed
-        if self.sim_config.get('random_seed'):
-            np.random.seed(self.sim_config['random_seed'])
+        # Own PCG64 stream, seeded for reproducible runs when configured
+        self.rng = np.random.default_rng(self.sim_config.get('random_seed') or None)
     
-    def generate_temperature(self, base_temp: float, variation: float) -> float:
-        """Generate temperature reading with natural variation"""
-        temp = np.random.uniform(
-            base_temp - variation,
-            base_temp + variation
-        )
+    def generate_temperature(self, base_temp: float, variation: float, size=None):
+        """Generate temperature reading(s) with natural variation"""
+        temp = self.rng.uniform(base_temp - variation, base_temp + variation, size)
         
         # Add sensor noise
-        noise = np.random.normal(0, self.env_config['dht22']['accuracy_temp_c'])
+        noise = self.rng.normal(0, self.env_config['dht22']['accuracy_temp_c'], size)
         
-        return round(temp + noise, 1)
+        return np.round(temp + noise, 1)
     
-    def generate_humidity(self, base_humidity: float, variation: float) -> float:
-        """Generate humidity reading with natural variation"""
-        humidity = np.random.uniform(
-            base_humidity - variation,
-            base_humidity + variation
-        )
+    def generate_humidity(self, base_humidity: float, variation: float, size=None):
+        """Generate humidity reading(s) with natural variation"""
+        humidity = self.rng.uniform(base_humidity - variation, base_humidity + variation, size)
         
         # Add sensor noise
-        noise = np.random.normal(0, self.env_config['dht22']['accuracy_humidity'])
+        noise = self.rng.normal(0, self.env_config['dht22']['accuracy_humidity'], size)
         
         # Clamp to valid range
-        return round(max(0, min(100, humidity + noise)), 1)
+        return np.round(np.clip(humidity + noise, 0, 100), 1)
     
-    def generate_pressure(self, base_pressure: float, variation: float,
-                         altitude: float) -> float:
-        """Generate barometric pressure reading"""
-        pressure = np.random.uniform(
-            base_pressure - variation,
-            base_pressure + variation
-        )
+    def generate_pressure(self, base_pressure: float, variation: float, altitude):
+        """Generate barometric pressure reading(s); altitude may be an array"""
+        size = np.shape(altitude) or None
+        pressure = self.rng.uniform(base_pressure - variation, base_pressure + variation, size)
         
         # Adjust for altitude (approximate)
         # Pressure decreases ~12 Pa per meter
-        altitude_adjustment = -altitude * 0.12
-        pressure += altitude_adjustment / 100  # Convert Pa to hPa
+        altitude_adjustment = -np.asarray(altitude) * 0.12
+        pressure = pressure + altitude_adjustment / 100  # Convert Pa to hPa
         
         # Add sensor noise
-        noise = np.random.normal(0, self.env_config['bmp280']['accuracy_pressure'])
+        noise = self.rng.normal(0, self.env_config['bmp280']['accuracy_pressure'], size)
         
-        return round(pressure + noise, 2)
+        return np.round(pressure + noise, 2)
     
-    def calculate_barometric_altitude(self, pressure_hpa: float,
-                                     sea_level_pressure: float = 1013.25) -> float:
-        """Calculate altitude from barometric pressure"""
-        # Barometric formula
-        altitude = 44330 * (1 - (pressure_hpa / sea_level_pressure) ** 0.1903)
+    def calculate_barometric_altitude(self, pressure_hpa,
+                                     sea_level_pressure: float = 1013.25):
+        """Calculate altitude(s) from barometric pressure"""
+        # Barometric formula - the scalar kernel for single readings, NumPy for arrays
+        if np.ndim(pressure_hpa) == 0:
+            altitude = _baro_alt(float(pressure_hpa), sea_level_pressure)
+        else:
+            altitude = 44330 * (1 - (np.asarray(pressure_hpa) / sea_level_pressure) ** 0.1903)
         
         # Add sensor noise
-        noise = np.random.normal(0, self.env_config['bmp280']['accuracy_altitude'])
+        noise = self.rng.normal(0, self.env_config['bmp280']['accuracy_altitude'], np.shape(altitude) or None)
         
-        return round(altitude + noise, 2)
+        return np.round(altitude + noise, 2)
+    
+    def _generate_batch(self, altitudes: np.ndarray) -> Dict[str, np.ndarray]:
+        """Sensor values for one reading per altitude, each field drawn in a single call"""
+        n = len(altitudes)
+        dht22 = self.env_config['dht22']
+        bmp280 = self.env_config['bmp280']
+        
+        pressure = self.generate_pressure(bmp280['pressure_hpa'], bmp280['pressure_variation'], altitudes)
+        return {
+            'temperature': self.generate_temperature(
+                np.mean(dht22['temperature_range_c']), dht22['temperature_variation_c'], n
+            ),
+            'humidity': self.generate_humidity(
+                np.mean(dht22['humidity_percent']), dht22['humidity_variation'], n
+            ),
+            'pressure': pressure,
+            'baro_altitude': self.calculate_barometric_altitude(pressure),
+            'baro_temperature': bmp280['temperature_c'] + self.rng.normal(0, 0.2, n)
+        }
     
     def generate_environment_data(self, gps_telemetry: pd.DataFrame,
                                  output_file: str):
@@ -86,67 +120,61 @@ class EnvironmentGenerator:
         # Environment capture interval
         interval_sec = self.config['data_collection']['environment_interval_sec']
         
-        # Get start time
-        start_time = pd.to_datetime(gps_telemetry['timestamp'].iloc[0])
-        
-        # Base values
-        temp_range = self.env_config['dht22']['temperature_range_c']
-        base_temp = np.mean(temp_range)
-        temp_variation = self.env_config['dht22']['temperature_variation_c']
-        
-        humidity_range = self.env_config['dht22']['humidity_percent']
-        base_humidity = np.mean(humidity_range)
-        humidity_variation = self.env_config['dht22']['humidity_variation']
-        
-        base_pressure = self.env_config['bmp280']['pressure_hpa']
-        pressure_variation = self.env_config['bmp280']['pressure_variation']
-        
-        bmp_temp = self.env_config['bmp280']['temperature_c']
-        
-        readings = []
-        last_capture_time = start_time - timedelta(seconds=interval_sec)
-        last_valid_reading = None
-        
-        for idx, row in gps_telemetry.iterrows():
-            current_time = pd.to_datetime(row['timestamp'])
-            
-            # Check if it's time to capture
-            if (current_time - last_capture_time).total_seconds() >= interval_sec:
-                # Simulate read error
-                if np.random.random() < self.sim_config['environment_read_error_probability']:
-                    # Use last valid reading with note
-                    if last_valid_reading:
-                        reading = last_valid_reading.copy()
-                        reading['timestamp'] = current_time.isoformat()
-                        reading['mode'] = 'unknown'
-                        reading['note'] = 'Read error, using last valid'
-                        readings.append(reading)
-                    continue
-                
-                # Generate new reading
-                temperature = self.generate_temperature(base_temp, temp_variation)
-                humidity = self.generate_humidity(base_humidity, humidity_variation)
-                pressure = self.generate_pressure(base_pressure, pressure_variation, 
-                                                 row['altitude'])
-                baro_altitude = self.calculate_barometric_altitude(pressure)
-                
-                reading = {
-                    'timestamp': current_time.isoformat(),
-                    'temperature': temperature,
-                    'humidity': humidity,
-                    'pressure': pressure,
-                    'baro_altitude': baro_altitude,
-                    'baro_temperature': bmp_temp + np.random.normal(0, 0.2),
-                    'mode': 'simulated',
-                    'note': ''
-                }
-                
-                readings.append(reading)
-                last_valid_reading = reading
-                last_capture_time = current_time
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(readings)
+        env_columns = ['timestamp', 'temperature', 'humidity', 'pressure', 'baro_altitude',
+                       'baro_temperature', 'mode', 'note']
+        
+        # Parse all timestamps once; intervals are compared in integer ns since the start.
+        # ISO8601 rather than inferring from the first row: isoformat() drops the
+        # fraction on whole seconds, so sub-second rates mix both forms
+        timestamps = pd.DatetimeIndex(pd.to_datetime(gps_telemetry['timestamp'], format='ISO8601'))
+        elapsed = (timestamps - timestamps[0]).to_numpy(dtype='timedelta64[ns]').view('i8').tolist()
+        interval_ns = round(interval_sec * 1e9)
+        read_errors = (
+            self.rng.random(len(elapsed)) < self.sim_config['environment_read_error_probability']
+        ).tolist()
+        
+        # Pick capture rows: the first sample at least interval_sec after the last
+        # good reading. A read error retries on the next sample and repeats the
+        # last good reading (dropped if there is none yet). Only this scan is
+        # sequential; all sensor values are generated below in whole arrays.
+        capture_rows = []
+        capture_valid = []
+        last_capture = -interval_ns
+        for i, t in enumerate(elapsed):
+            if t - last_capture < interval_ns:
+                continue
+            if read_errors[i]:
+                if capture_rows:
+                    capture_rows.append(i)
+                    capture_valid.append(False)
+                continue
+            capture_rows.append(i)
+            capture_valid.append(True)
+            last_capture = t
+        
+        capture_rows = np.asarray(capture_rows, dtype=np.intp)
+        capture_valid = np.asarray(capture_valid, dtype=bool)
+        altitudes = gps_telemetry['altitude'].to_numpy(dtype=float)[capture_rows[capture_valid]]
+        values = self._generate_batch(altitudes)
+        
+        # Each capture takes the values of the latest good reading at or before it.
+        # Readings are rounded to 1-2 decimals, so float32 columns lose nothing.
+        source = np.cumsum(capture_valid) - 1
+        
+        # ISO strings for all captures in one call; sub-second digits only when
+        # the GPS rate produces them, matching what isoformat() wrote before
+        capture_ts = timestamps[capture_rows]
+        ts_unit = 's' if not capture_ts.microsecond.any() else 'us'
+        
+        # mode/note take one of two values each, so store them as codes
+        df = pd.DataFrame({
+            'timestamp': np.datetime_as_string(capture_ts.values, unit=ts_unit),
+            **{name: column.astype(np.float32)[source] for name, column in values.items()},
+            'mode': pd.Categorical.from_codes((~capture_valid).astype(np.int8),
+                                              categories=['simulated', 'unknown']),
+            'note': pd.Categorical.from_codes((~capture_valid).astype(np.int8),
+                                              categories=['', 'Read error, using last valid'])
+        }, columns=env_columns)
         
         # Save to CSV
         df.to_csv(output_file, index=False)
@@ -10,12 +10,81 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 import math
 
+try:
+    from utils.config import load_config
+except ImportError:
+    # Standalone run from this directory: parse without the shared cache
+    def load_config(config_path):
+        with open(config_path, 'r') as f:
+            return yaml.safe_load(f)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_R = 6371000  # Earth radius in meters
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    """Haversine distance in meters (scalar kernel)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    
+    a = (math.sin(dlat/2)**2 + 
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    
+    return EARTH_R * c
+
+
+def _bearing(lat1, lon1, lat2, lon2):
+    """Bearing from point 1 to point 2 in degrees (scalar kernel)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlon = math.radians(lon2 - lon1)
+    
+    y = math.sin(dlon) * math.cos(lat2_rad)
+    x = (math.cos(lat1_rad) * math.sin(lat2_rad) -
+         math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon))
+    
+    bearing = math.degrees(math.atan2(y, x))
+    return (bearing + 360) % 360
+
+
+def _offset(lat, lon, distance_m, bearing_deg):
+    """Coordinate at distance and bearing from a start point (scalar kernel)"""
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    bearing_rad = math.radians(bearing_deg)
+    angular = distance_m / EARTH_R
+    
+    new_lat_rad = math.asin(
+        math.sin(lat_rad) * math.cos(angular) +
+        math.cos(lat_rad) * math.sin(angular) * math.cos(bearing_rad)
+    )
+    
+    new_lon_rad = lon_rad + math.atan2(
+        math.sin(bearing_rad) * math.sin(angular) * math.cos(lat_rad),
+        math.cos(angular) - math.sin(lat_rad) * math.sin(new_lat_rad)
+    )
+    
+    return math.degrees(new_lat_rad), math.degrees(new_lon_rad)
+
+
+if NUMBA_AVAILABLE:
+    _haversine = njit(cache=True, fastmath=True)(_haversine)
+    _bearing = njit(cache=True, fastmath=True)(_bearing)
+    _offset = njit(cache=True, fastmath=True)(_offset)
+
 
 class FlightPathCalculator:
     def __init__(self, config_file: str = "simulation_config.yaml"):
         """Initialize flight path calculator with config"""
-        with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_file)
         
         self.flight_area = self.config['flight_area']
         self.thermal = self.config['thermal_camera']
@@ -26,57 +95,71 @@ class FlightPathCalculator:
         """
         Calculate distance between two GPS coordinates using Haversine formula
         """
-        R = 6371000  # Earth radius in meters
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return R * c
+        return _haversine(lat1, lon1, lat2, lon2)
     
     def calculate_bearing(self, lat1: float, lon1: float,
                          lat2: float, lon2: float) -> float:
         """
         Calculate bearing from point 1 to point 2
         """
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dlon = math.radians(lon2 - lon1)
-        
-        y = math.sin(dlon) * math.cos(lat2_rad)
-        x = (math.cos(lat1_rad) * math.sin(lat2_rad) -
-             math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon))
-        
-        bearing = math.degrees(math.atan2(y, x))
-        return (bearing + 360) % 360
+        return _bearing(lat1, lon1, lat2, lon2)
     
     def offset_coordinate(self, lat: float, lon: float,
                          distance_m: float, bearing_deg: float) -> Tuple[float, float]:
         """
         Calculate new coordinate given distance and bearing
         """
-        R = 6371000  # Earth radius in meters
+        return _offset(lat, lon, distance_m, bearing_deg)
+    
+    def calculate_distance_vec(self, lat1, lon1, lat2, lon2) -> np.ndarray:
+        """
+        calculate_distance for NumPy arrays (or scalars) in one pass
+        """
+        lat1_rad = np.radians(lat1)
+        lat2_rad = np.radians(lat2)
+        dlat = np.radians(np.subtract(lat2, lat1))
+        dlon = np.radians(np.subtract(lon2, lon1))
+        
+        a = (np.sin(dlat/2)**2 +
+             np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon/2)**2)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+        
+        return EARTH_R * c
+    
+    def calculate_bearing_vec(self, lat1, lon1, lat2, lon2) -> np.ndarray:
+        """
+        calculate_bearing for NumPy arrays (or scalars) in one pass
+        """
+        lat1_rad = np.radians(lat1)
+        lat2_rad = np.radians(lat2)
+        dlon = np.radians(np.subtract(lon2, lon1))
         
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        bearing_rad = math.radians(bearing_deg)
+        y = np.sin(dlon) * np.cos(lat2_rad)
+        x = (np.cos(lat1_rad) * np.sin(lat2_rad) -
+             np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(dlon))
         
-        new_lat_rad = math.asin(
-            math.sin(lat_rad) * math.cos(distance_m / R) +
-            math.cos(lat_rad) * math.sin(distance_m / R) * math.cos(bearing_rad)
+        return (np.degrees(np.arctan2(y, x)) + 360) % 360
+    
+    def offset_coordinate_vec(self, lat, lon, distance_m, bearing_deg) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        offset_coordinate for NumPy arrays (or scalars) in one pass
+        """
+        lat_rad = np.radians(lat)
+        lon_rad = np.radians(lon)
+        bearing_rad = np.radians(bearing_deg)
+        angular = np.asarray(distance_m, dtype=float) / EARTH_R
+        
+        new_lat_rad = np.arcsin(
+            np.sin(lat_rad) * np.cos(angular) +
+            np.cos(lat_rad) * np.sin(angular) * np.cos(bearing_rad)
         )
         
-        new_lon_rad = lon_rad + math.atan2(
-            math.sin(bearing_rad) * math.sin(distance_m / R) * math.cos(lat_rad),
-            math.cos(distance_m / R) - math.sin(lat_rad) * math.sin(new_lat_rad)
+        new_lon_rad = lon_rad + np.arctan2(
+            np.sin(bearing_rad) * np.sin(angular) * np.cos(lat_rad),
+            np.cos(angular) - np.sin(lat_rad) * np.sin(new_lat_rad)
         )
         
-        return math.degrees(new_lat_rad), math.degrees(new_lon_rad)
+        return np.degrees(new_lat_rad), np.degrees(new_lon_rad)
     
     def calculate_area_dimensions(self) -> Dict:
         """Calculate actual area dimensions"""
@@ -229,55 +312,39 @@ class FlightPathCalculator:
             corner_d['latitude'], corner_d['longitude']
         )
         
-        current_lat = corner_a['latitude']
-        current_lon = corner_a['longitude']
+        # Passes run between the A-side and B-side edges, stepping one effective
+        # height south each time - both edges are offset in one vectorized call
+        south_m = np.arange(passes) * effective_height
+        a_lats, a_lons = self.offset_coordinate_vec(
+            corner_a['latitude'], corner_a['longitude'], south_m, bearing_ns
+        )
+        b_lat, b_lon = self.offset_coordinate(
+            corner_a['latitude'], corner_a['longitude'],
+            params['area']['width_m'], bearing_ew
+        )
+        b_lats, b_lons = self.offset_coordinate_vec(b_lat, b_lon, south_m, bearing_ns)
         
         # Generate serpentine pattern waypoints
-        for pass_num in range(passes):
-            # Move south for each pass
-            if pass_num > 0:
-                current_lat, current_lon = self.offset_coordinate(
-                    current_lat, current_lon,
-                    effective_height, bearing_ns
-                )
-            
-            # Waypoint at start of pass
-            waypoints.append({
-                'id': len(waypoints),
-                'type': 'scan',
-                'latitude': current_lat,
-                'longitude': current_lon,
-                'altitude_m': self.drone['cruise_altitude_m'],
-                'action': 'scan',
-                'pass_number': pass_num + 1
-            })
-            
-            # Waypoint at end of pass (East to West)
+        edges = zip(a_lats.tolist(), a_lons.tolist(), b_lats.tolist(), b_lons.tolist())
+        for pass_num, (a_lat, a_lon, b_lat, b_lon) in enumerate(edges):
             if pass_num % 2 == 0:
                 # Even passes: A to B direction
-                end_lat, end_lon = self.offset_coordinate(
-                    current_lat, current_lon,
-                    params['area']['width_m'], bearing_ew
-                )
+                pass_ends = ((a_lat, a_lon), (b_lat, b_lon))
             else:
                 # Odd passes: B to A direction (reverse)
-                end_lat, end_lon = self.offset_coordinate(
-                    current_lat, current_lon,
-                    params['area']['width_m'], (bearing_ew + 180) % 360
-                )
-            
-            waypoints.append({
-                'id': len(waypoints),
-                'type': 'scan',
-                'latitude': end_lat,
-                'longitude': end_lon,
-                'altitude_m': self.drone['cruise_altitude_m'],
-                'action': 'scan',
-                'pass_number': pass_num + 1
-            })
+                pass_ends = ((b_lat, b_lon), (a_lat, a_lon))
             
-            current_lat = end_lat
-            current_lon = end_lon
+            # Waypoints at start and end of pass
+            for lat, lon in pass_ends:
+                waypoints.append({
+                    'id': len(waypoints),
+                    'type': 'scan',
+                    'latitude': lat,
+                    'longitude': lon,
+                    'altitude_m': self.drone['cruise_altitude_m'],
+                    'action': 'scan',
+                    'pass_number': pass_num + 1
+                })
         
         # Final waypoint: Return to A
         waypoints.append({
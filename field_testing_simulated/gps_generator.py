@@ -11,12 +11,19 @@ from typing import List, Dict, Tuple
 import yaml
 import math
 
+try:
+    from utils.config import load_config
+except ImportError:
+    # Standalone run from this directory: parse without the shared cache
+    def load_config(config_path):
+        with open(config_path, 'r') as f:
+            return yaml.safe_load(f)
+
 
 class GPSGenerator:
     def __init__(self, config_file: str = "simulation_config.yaml"):
         """Initialize GPS generator with config"""
-        with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_file)
         
         self.gps_config = self.config['gps']
         self.drone_config = self.config['drone']
@@ -74,33 +81,37 @@ class GPSGenerator:
     
     def interpolate_path(self, start: Dict, end: Dict, num_points: int) -> List[Dict]:
         """Interpolate GPS points between two waypoints"""
-        points = []
+        if num_points < 1:
+            return []
         
-        for i in range(num_points):
-            t = i / (num_points - 1) if num_points > 1 else 0
-            
-            # Linear interpolation
-            lat = start['latitude'] + t * (end['latitude'] - start['latitude'])
-            lon = start['longitude'] + t * (end['longitude'] - start['longitude'])
-            alt = start['altitude_m'] + t * (end['altitude_m'] - start['altitude_m'])
-            
-            # Calculate heading
-            if i < num_points - 1:
-                next_t = (i + 1) / (num_points - 1)
-                next_lat = start['latitude'] + next_t * (end['latitude'] - start['latitude'])
-                next_lon = start['longitude'] + next_t * (end['longitude'] - start['longitude'])
-                heading = self.calculate_bearing(lat, lon, next_lat, next_lon)
-            else:
-                heading = points[-1]['heading'] if points else 0
-            
-            points.append({
-                'latitude': lat,
-                'longitude': lon,
-                'altitude': alt,
-                'heading': heading
-            })
+        # Linear interpolation of the whole segment at once
+        t = np.linspace(0, 1, num_points) if num_points > 1 else np.zeros(1)
+        lats = start['latitude'] + t * (end['latitude'] - start['latitude'])
+        lons = start['longitude'] + t * (end['longitude'] - start['longitude'])
+        alts = start['altitude_m'] + t * (end['altitude_m'] - start['altitude_m'])
+        
+        # Heading towards the next point; the last point keeps the previous one
+        headings = np.zeros(num_points)
+        if num_points > 1:
+            headings[:-1] = self.calculate_bearing_vec(lats[:-1], lons[:-1], lats[1:], lons[1:])
+            headings[-1] = headings[-2]
+        
+        return [
+            {'latitude': lat, 'longitude': lon, 'altitude': alt, 'heading': heading}
+            for lat, lon, alt, heading in zip(lats.tolist(), lons.tolist(), alts.tolist(), headings.tolist())
+        ]
+    
+    def calculate_bearing_vec(self, lat1, lon1, lat2, lon2) -> np.ndarray:
+        """Bearing between point arrays in one NumPy pass"""
+        lat1_rad = np.radians(lat1)
+        lat2_rad = np.radians(lat2)
+        dlon = np.radians(np.subtract(lon2, lon1))
+        
+        y = np.sin(dlon) * np.cos(lat2_rad)
+        x = (np.cos(lat1_rad) * np.sin(lat2_rad) -
+             np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(dlon))
         
-        return points
+        return (np.degrees(np.arctan2(y, x)) + 360) % 360
     
     def calculate_bearing(self, lat1: float, lon1: float, 
                          lat2: float, lon2: float) -> float:
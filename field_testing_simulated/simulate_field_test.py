@@ -16,14 +16,21 @@ from gps_generator import GPSGenerator
 from thermal_generator import ThermalGenerator
 from environment_generator import EnvironmentGenerator
 
+try:
+    from utils.config import load_config
+except ImportError:
+    # Standalone run from this directory: parse without the shared cache
+    def load_config(config_path):
+        with open(config_path, 'r') as f:
+            return yaml.safe_load(f)
+
 
 class FieldTestSimulator:
     def __init__(self, config_file: str = "simulation_config.yaml"):
         """Initialize field test simulator"""
         self.config_file = config_file
         
-        with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_file)
         
         self.mission = self.config['mission']
         self.data_collection = self.config['data_collection']
@@ -170,10 +177,11 @@ class FieldTestSimulator:
         
         # Check hotspot detection
         hotspots_detected = []
+        track = list(gps_telemetry[['latitude', 'longitude']].itertuples(index=False))
         for hotspot in self.config['hotspots']['locations']:
-            for _, row in gps_telemetry.iterrows():
+            for lat, lon in track:
                 distance = self.gps_generator.calculate_distance(
-                    row['latitude'], row['longitude'],
+                    lat, lon,
                     hotspot['latitude'], hotspot['longitude']
                 )
                 # If within thermal camera range
@@ -217,10 +225,10 @@ class FieldTestSimulator:
                 'alt_max': float(gps_telemetry['altitude'].max())
             },
             'environment_statistics': {
-                'temp_min': float(env_data['temperature'].min()),
-                'temp_max': float(env_data['temperature'].max()),
-                'humidity_min': float(env_data['humidity'].min()),
-                'humidity_max': float(env_data['humidity'].max())
+                'temp_min': round(float(env_data['temperature'].min()), 1),
+                'temp_max': round(float(env_data['temperature'].max()), 1),
+                'humidity_min': round(float(env_data['humidity'].min()), 1),
+                'humidity_max': round(float(env_data['humidity'].max()), 1)
             }
         }
         
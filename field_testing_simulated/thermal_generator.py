@@ -6,18 +6,25 @@ Generates realistic thermal camera data with hotspots
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Tuple
 import yaml
 import math
 
+try:
+    from utils.config import load_config
+except ImportError:
+    # Standalone run from this directory: parse without the shared cache
+    def load_config(config_path):
+        with open(config_path, 'r') as f:
+            return yaml.safe_load(f)
+
 
 class ThermalGenerator:
     def __init__(self, config_file: str = "simulation_config.yaml"):
         """Initrmal generator with config"""
-        with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_file)
         
         self.thermal_config = self.config['thermal_camera']
         self.hotspot_config = self.config['hotspots']
@@ -271,26 +278,32 @@ class ThermalGenerator:
         # Thermal capture interval
         interval_sec = self.config['data_collection']['thermal_interval_sec']
         
-        # Get start time
-        start_time = pd.to_datetime(gps_telemetry['timestamp'].iloc[0])
+        # Parse all timestamps once; capture checks use integer ns since the start.
+        # ISO8601 rather than inferring from the first row: isoformat() drops the
+        # fraction on whole seconds, so sub-second rates mix both forms
+        timestamps = pd.DatetimeIndex(pd.to_datetime(gps_telemetry['timestamp'], format='ISO8601'))
+        elapsed_ns = (timestamps - timestamps[0]).to_numpy(dtype='timedelta64[ns]').view('i8').tolist()
+        interval_ns = round(interval_sec * 1e9)
         
         frame_count = 0
-        last_capture_time = start_time - timedelta(seconds=interval_sec)
+        last_capture_ns = -interval_ns
         
-        for idx, row in gps_telemetry.iterrows():
-            current_time = pd.to_datetime(row['timestamp'])
-            
+        # Plain tuples of just the needed columns - no Series built per row
+        rows = gps_telemetry[['latitude', 'longitude', 'heading']].itertuples(index=False)
+        for i, row in enumerate(rows):
             # Check if it's time to capture a frame
-            if (current_time - last_capture_time).total_seconds() >= interval_sec:
+            if elapsed_ns[i] - last_capture_ns >= interval_ns:
+                current_time = timestamps[i]
+                
                 # Skip frame randomly (simulate missed frames)
                 if np.random.random() < self.sim_config['thermal_frame_skip_probability']:
                     continue
                 
                 # Generate thermal frame
                 frame = self.generate_frame(
-                    row['latitude'],
-                    row['longitude'],
-                    row['heading'],
+                    row.latitude,
+                    row.longitude,
+                    row.heading,
                     current_time
                 )
                 
@@ -307,7 +320,7 @@ class ThermalGenerator:
                 self.save_frame_csv(frame, str(csv_file), current_time)
                 
                 frame_count += 1
-                last_capture_time = current_time
+                last_capture_ns = elapsed_ns[i]
                 
                 if frame_count % 50 == 0:
                     print(f"   Generated {frame_count} frames...")
@@ -1,11 +1,28 @@
 """
 Mission Control Orchestrator - Core DFS logic
 """
-import yaml
+import functools
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
 import random
 from database import DatabaseManager, Drone, Task, FireDetection, DroneState, TaskState, DroneType
+from utils.config import load_config
+from sqlalchemy.orm import selectinload
+
+
+# Scout tasks whose FD dispatch settled before anyone waited on it
+_SETTLED_DISPATCH_LIMIT = 256
+
+
+def _serialized(method):
+    """Run an orchestrator method under its state lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._state_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class MissionOrchestrator:
@@ -20,10 +37,22 @@ class MissionOrchestrator:
     TODO: Add mission priority queue instead of FIFO
     """
     def __init__(self, config_path='config/dfs_config.yaml'):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
         
         self.db_manager = DatabaseManager(config_path)
+        
+        # Task/detection counters, the round-robin indexes and the
+        # "pick an IDLE drone, then mark it ASSIGNED" sequence are
+        # read-modify-write; batch_mission calls these from several threads
+        self._state_lock = threading.RLock()
+        
+        # Per scout-task events, set once FD dispatch for its detection is settled.
+        # Entries only live while a dispatch or a waiter is pending; settled
+        # tasks nobody waited for yet are kept in a bounded record instead
+        self._dispatch_events: Dict[str, threading.Event] = {}
+        self._settled_dispatches: OrderedDict = OrderedDict()
+        self._dispatch_events_lock = threading.Lock()
+        
         self._initialize_counters()
         self._load_round_robin_state()
     
@@ -122,6 +151,7 @@ class MissionOrchestrator:
         finally:
             self.db_manager.close_session(session)
     
+    @_serialized
     def create_scout_task(self, flight_area: Dict, priority: str = 'medium') -> Dict:
         """Create a new scouting task with flight area coordinates"""
         session = self.db_manager.get_session()
@@ -177,6 +207,7 @@ class MissionOrchestrator:
         finally:
             self.db_manager.close_session(session)
     
+    @_serialized
     def assign_task_to_drone(self, task_id: str) -> Optional[Dict]:
         """Assign task to available drone using round-robin with battery/capability checks"""
         session = self.db_manager.get_session()
@@ -284,6 +315,39 @@ class MissionOrchestrator:
         finally:
             self.db_manager.close_session(session)
     
+    def start_tasks_execution(self, task_ids: List[str]):
+        """Mark several tasks as executing with one bulk update and commit"""
+        if not task_ids:
+            return
+        
+        session = self.db_manager.get_session()
+        
+        try:
+            now = datetime.utcnow()
+            session.query(Task).filter(Task.task_id.in_(task_ids)).update(
+                {Task.state: TaskState.EXECUTING, Task.started_at: now},
+                synchronize_session=False
+            )
+            
+            drone_ids = [row.drone_id for row in session.query(Task.drone_id).filter(
+                Task.task_id.in_(task_ids),
+                Task.drone_id.isnot(None)
+            )]
+            session.query(Drone).filter(Drone.id.in_(drone_ids)).update(
+                {Drone.state: DroneState.FLYING},
+                synchronize_session=False
+            )
+            
+            session.commit()
+            for task_id in task_ids:
+                print(f"[OK] Task {task_id} execution started")
+        except Exception as e:
+            session.rollback()
+            print(f"Error starting tasks: {e}")
+            raise
+        finally:
+            self.db_manager.close_session(session)
+    
     def complete_task(self, task_id: str, hotspots_detected: int = 0, data_path: str = None):
         """Mark task as completed"""
         session = self.db_manager.get_session()
@@ -363,6 +427,7 @@ class MissionOrchestrator:
         finally:
             self.db_manager.close_session(session)
     
+    @_serialized
     def register_fire_detection(self, task_id: str, drone_id: str, 
                                 latitude: float, longitude: float,
                                 temperature_c: float, confidence: float,
@@ -410,8 +475,37 @@ class MissionOrchestrator:
             print(f"Error registering detection: {e}")
             raise
         finally:
+            # Dispatch is settled either way - release anyone waiting on it
+            self._settle_dispatch(task_id)
             self.db_manager.close_session(session)
     
+    def _settle_dispatch(self, task_id: str):
+        """Wake waiters for task_id, or remember the result for a later wait"""
+        with self._dispatch_events_lock:
+            event = self._dispatch_events.pop(task_id, None)
+            self._settled_dispatches[task_id] = None
+            self._settled_dispatches.move_to_end(task_id)
+            while len(self._settled_dispatches) > _SETTLED_DISPATCH_LIMIT:
+                self._settled_dispatches.popitem(last=False)
+        if event is not None:
+            event.set()
+    
+    def wait_for_fd_dispatch(self, task_id: str, timeout: float = 5.0) -> bool:
+        """Block until FD dispatch for a fire found by task_id is settled"""
+        with self._dispatch_events_lock:
+            if task_id in self._settled_dispatches:
+                return True
+            event = self._dispatch_events.setdefault(task_id, threading.Event())
+        
+        signaled = event.wait(timeout)
+        if not signaled:
+            with self._dispatch_events_lock:
+                # A settle racing the timeout may already have taken the entry
+                if self._dispatch_events.get(task_id) is event:
+                    del self._dispatch_events[task_id]
+        return signaled
+    
+    @_serialized
     def dispatch_firefighter_drone(self, detection_id: str) -> Optional[str]:
         """Dispatch a firefighter drone to a fire location"""
         session = self.db_manager.get_session()
@@ -588,7 +682,8 @@ class MissionOrchestrator:
             cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
             
             # Find stale executing tasks (with or without started_at timestamp)
-            stale_tasks = session.query(Task).filter(
+            # Drones are loaded with one IN query rather than one per task
+            stale_tasks = session.query(Task).options(selectinload(Task.drone)).filter(
                 Task.state == TaskState.EXECUTING,
                 (Task.started_at < cutoff_time) | (Task.started_at == None)
             ).all()
@@ -599,10 +694,8 @@ class MissionOrchestrator:
                 task.completed_at = datetime.now()
                 
                 # Return drone to IDLE
-                if task.drone_id:
-                    drone = session.query(Drone).get(task.drone_id)
-                    if drone:
-                        drone.state = DroneState.IDLE
+                if task.drone:
+                    task.drone.state = DroneState.IDLE
                 
                 count += 1
             
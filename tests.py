@@ -9,6 +9,7 @@ import sys
 import yaml
 import argparse
 import tempfile
+import time
 from datetime import datetime
 
 # Project directory
@@ -108,6 +109,17 @@ def test_controller():
         controller.arm()
         controller.takeoff(15.0)
         controller.goto_waypoint(33.226, -96.826, 15.0)
+        
+        # Flying to uploaded waypoints by hand doesn't advance the mission
+        waypoints = [{'lat': 33.226, 'lon': -96.826, 'alt': 15.0},
+                     {'lat': 33.227, 'lon': -96.825, 'alt': 15.0}]
+        controller.upload_mission(waypoints)
+        for wp in waypoints:
+            controller.goto_waypoint(wp['lat'], wp['lon'], wp['alt'])
+        if controller.get_mission_progress() != (0, 2):
+            print(f"  [FAIL] Mission progress {controller.get_mission_progress()}, expected (0, 2)")
+            return False
+        
         controller.land()
         controller.disarm()
         controller.disconnect()
@@ -119,6 +131,865 @@ def test_controller():
         return False
 
 
+def test_ruler_accuracy():
+    """Test DemoController distance/heading against the Haversine reference"""
+    print("\n[TEST] Ruler Accuracy")
+    print("-" * 40)
+    
+    try:
+        import math
+        from drone_control.demo_controller import DemoController, _TRIG_LAT_DECIMALS
+        from drone_control._geomath import haversine_m, bearing_deg
+        
+        ruler = DemoController("TEST-RULER", {'use_cheap_ruler': True})
+        sphere = DemoController("TEST-SPHERE", {'use_cheap_ruler': False})
+        
+        def angle_diff(a, b):
+            return abs((a - b + 180.0) % 360.0 - 180.0)
+        
+        # Hops of 50 m - 3 km in every direction at a few latitudes
+        worst_ruler = worst_sphere = (0.0, 0.0)
+        for lat in (0.0, 33.2265, 47.5, 60.0, -40.0):
+            for bearing in range(0, 360, 30):
+                for dist in (50.0, 500.0, 3000.0):
+                    lat2 = lat + dist * math.cos(math.radians(bearing)) / 111000
+                    lon2 = -96.8 + dist * math.sin(math.radians(bearing)) / (111000 * math.cos(math.radians(lat)))
+                    ref_dist = haversine_m(lat, -96.8, lat2, lon2)
+                    ref_heading = bearing_deg(lat, -96.8, lat2, lon2)
+                    
+                    d, h = ruler._calc_dist_and_heading(lat, -96.8, lat2, lon2)
+                    worst_ruler = (max(worst_ruler[0], abs(d - ref_dist) / ref_dist),
+                                   max(worst_ruler[1], angle_diff(h, ref_heading)))
+                    d, h = sphere._calc_dist_and_heading(lat, -96.8, lat2, lon2)
+                    worst_sphere = (max(worst_sphere[0], abs(d - ref_dist)),
+                                    max(worst_sphere[1], angle_diff(h, ref_heading)))
+        
+        # WGS84 ruler vs spherical Haversine: the ellipsoid alone is up to ~0.5%
+        if worst_ruler[0] > 0.01 or worst_ruler[1] > 0.25:
+            print(f"  [FAIL] Cheap ruler off by {worst_ruler[0]:.3%} / {worst_ruler[1]:.3f} deg")
+            return False
+        print(f"  [OK] Cheap ruler within {worst_ruler[0]:.3%} / {worst_ruler[1]:.3f} deg of Haversine")
+        
+        # Cached start-latitude trig must be exact, not an approximation
+        if worst_sphere[0] > 1e-6 or worst_sphere[1] > 1e-6:
+            print(f"  [FAIL] Cached-trig path off by {worst_sphere[0]:.2e} m / {worst_sphere[1]:.2e} deg")
+            return False
+        
+        # Either side of a cache bucket boundary, and the reuse within a bucket
+        half = 0.5 * 10 ** -_TRIG_LAT_DECIMALS
+        edge = 33.2265 + half
+        keys = []
+        for lat in (edge - 1e-7, edge - 2e-7, edge + 1e-7, 33.2265):
+            sin_lat, cos_lat = sphere._lat_trig(lat)
+            if abs(sin_lat - math.sin(math.radians(lat))) > 1e-12 or abs(cos_lat - math.cos(math.radians(lat))) > 1e-12:
+                print(f"  [FAIL] _lat_trig({lat}) = {sin_lat}, {cos_lat}")
+                return False
+            keys.append(sphere._trig_cache[0])
+        if keys[0] != keys[1] or keys[1] == keys[2]:
+            print(f"  [FAIL] Trig cache buckets {keys}")
+            return False
+        print(f"  [OK] Cached trig matches Haversine/bearing, including across a bucket boundary")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_geomath():
+    """Test the GPS math kernels, compiled and pure Python"""
+    print("\n[TEST] GPS Math Kernels")
+    print("-" * 40)
+    
+    try:
+        import math
+        import numpy as np
+        from drone_control import _geomath
+        from drone_control._geomath import (EARTH_R, NUMBA_AVAILABLE, haversine_m, haversine_m_trig,
+                                            bearing_deg, bearing_deg_trig, distance_bearing_trig)
+        
+        # Known answers: one degree of arc, and the four cardinal bearings
+        one_degree = EARTH_R * math.radians(1)
+        checks = [
+            (haversine_m(0.0, 0.0, 1.0, 0.0), one_degree),
+            (haversine_m(0.0, 0.0, 0.0, 1.0), one_degree),
+            (haversine_m(60.0, 10.0, 60.0, 10.0), 0.0),
+            (bearing_deg(0.0, 0.0, 1.0, 0.0), 0.0),
+            (bearing_deg(0.0, 0.0, 0.0, 1.0), 90.0),
+            (bearing_deg(0.0, 0.0, -1.0, 0.0), 180.0),
+            (bearing_deg(0.0, 0.0, 0.0, -1.0), 270.0),
+        ]
+        for got, want in checks:
+            if abs(got - want) > 1e-6:
+                print(f"  [FAIL] Got {got}, expected {want}")
+                return False
+        
+        # The *_trig variants and the combined kernel agree with the plain ones
+        points = [(33.2265, -96.8265, 33.2270, -96.8260), (-40.0, 170.0, -39.5, -179.5),
+                  (59.9, 10.7, 59.9, 10.8), (0.0, 0.0, 0.00001, -0.00001)]
+        for lat1, lon1, lat2, lon2 in points:
+            sin1, cos1 = math.sin(math.radians(lat1)), math.cos(math.radians(lat1))
+            dist, heading = haversine_m(lat1, lon1, lat2, lon2), bearing_deg(lat1, lon1, lat2, lon2)
+            variants = (haversine_m_trig(lat1, lon1, lat2, lon2, cos1), bearing_deg_trig(lon1, lat2, lon2, sin1, cos1),
+                        *distance_bearing_trig(lat1, lon1, lat2, lon2, sin1, cos1))
+            if max(abs(a - b) for a, b in zip(variants, (dist, heading, dist, heading))) > 1e-6:
+                print(f"  [FAIL] Kernels disagree for {(lat1, lon1, lat2, lon2)}: {variants} vs {(dist, heading)}")
+                return False
+        print(f"  [OK] Known distances/bearings and kernel variants agree")
+        
+        # With Numba the module names are compiled dispatchers; their .py_func
+        # is the pure-Python kernel, which must give the same answers
+        kernels = ('haversine_m', 'haversine_m_trig', 'bearing_deg', 'bearing_deg_trig', 'distance_bearing_trig')
+        if not NUMBA_AVAILABLE:
+            if any(hasattr(getattr(_geomath, name), 'py_func') for name in kernels):
+                print(f"  [FAIL] Compiled kernels without Numba")
+                return False
+            print(f"  [OK] Numba not installed - pure Python kernels in use")
+            return True
+        
+        for lat1, lon1, lat2, lon2 in points:
+            sin1, cos1 = math.sin(math.radians(lat1)), math.cos(math.radians(lat1))
+            kernel_args = {
+                'haversine_m': (lat1, lon1, lat2, lon2),
+                'haversine_m_trig': (lat1, lon1, lat2, lon2, cos1),
+                'bearing_deg': (lat1, lon1, lat2, lon2),
+                'bearing_deg_trig': (lon1, lat2, lon2, sin1, cos1),
+                'distance_bearing_trig': (lat1, lon1, lat2, lon2, sin1, cos1)
+            }
+            for name, args in kernel_args.items():
+                compiled = getattr(_geomath, name)
+                fast, slow = np.atleast_1d(compiled(*args)), np.atleast_1d(compiled.py_func(*args))
+                if np.abs(fast - slow).max() > 1e-6:
+                    print(f"  [FAIL] {name}: compiled {fast} vs Python {slow}")
+                    return False
+        print(f"  [OK] Numba kernels match their pure-Python versions")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_dashboard_map_updates():
+    """Test flight path simplification and the map's fixed trace slots"""
+    print("\n[TEST] Dashboard Map Updates")
+    print("-" * 40)
+    
+    try:
+        import numpy as np
+        from dash import Patch
+        from dashboard.app import MAP_LAYER_SLOTS, MAP_LAYER_BUILDERS, TASK_AREA_STATES, _simplify_path
+        
+        # Collinear points collapse to the end points
+        line = np.column_stack([np.linspace(0, 1, 100), np.linspace(0, 2, 100)])
+        if list(_simplify_path(line, 1e-9)) != [0, 99]:
+            print(f"  [FAIL] Straight line kept {list(_simplify_path(line, 1e-9))}")
+            return False
+        
+        # Random walk: every dropped point lies within epsilon of the chord
+        # between the kept points around it; a closed loop keeps its far side
+        walk = np.cumsum(np.random.default_rng(3).normal(size=(500, 2)), axis=0)
+        epsilon = 2.0
+        kept = _simplify_path(walk, epsilon)
+        for start, end in zip(kept, kept[1:]):
+            a, d = walk[start], walk[end] - walk[start]
+            inner = walk[start + 1:end] - a
+            dist = np.abs(d[0] * inner[:, 1] - d[1] * inner[:, 0]) / np.hypot(d[0], d[1])
+            if len(inner) and dist.max() > epsilon:
+                print(f"  [FAIL] Point {start + 1 + int(dist.argmax())} is {dist.max():.2f} from the path")
+                return False
+        loop = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [1.0, 0.1], [0.0, 0.0]])
+        if kept[0] != 0 or kept[-1] != 499 or not 2 < len(kept) < 500 or list(_simplify_path(loop, 0.5)) != [0, 2, 4]:
+            print(f"  [FAIL] Kept {len(kept)} of 500 walk points / loop {list(_simplify_path(loop, 0.5))}")
+            return False
+        print(f"  [OK] _simplify_path kept {len(kept)} of 500 points, all others within epsilon")
+        
+        # Layer slots are disjoint, contiguous from trace 0, and each builder
+        # fills exactly its slots whether or not there are rows
+        slots = sorted(index for layer_slots in MAP_LAYER_SLOTS.values() for index in layer_slots)
+        corners = [33.2265, -96.8265, 33.2270, -96.8265, 33.2270, -96.8260, 33.2265, -96.8260]
+        old_rows = {'drones': [('SD-001', 33.2265, -96.8265, 'idle')],
+                    'fires': [(33.2266, -96.8264, 65.0, 'detected')],
+                    'tasks': [('TASK-1', TASK_AREA_STATES[0], 'scout', *corners)]}
+        new_rows = {'drones': old_rows['drones'],
+                    'fires': [],
+                    'tasks': [('TASK-1', TASK_AREA_STATES[-1], 'scout', *corners),
+                              ('TASK-2', TASK_AREA_STATES[1], 'suppress', *corners)]}
+        if slots != list(range(len(slots))):
+            print(f"  [FAIL] Trace slots {slots}")
+            return False
+        for layer, builder in MAP_LAYER_BUILDERS.items():
+            for rows in ([], old_rows[layer], new_rows[layer]):
+                if len(builder(rows)) != len(MAP_LAYER_SLOTS[layer]):
+                    print(f"  [FAIL] {layer} builder fills {len(builder(rows))} of {len(MAP_LAYER_SLOTS[layer])} slots")
+                    return False
+        
+        def full_figure(layer_rows):
+            data = [{'name': f'trace {i}'} for i in range(len(slots) + 3)]
+            for layer, layer_slots in MAP_LAYER_SLOTS.items():
+                for index, update in zip(layer_slots, MAP_LAYER_BUILDERS[layer](layer_rows[layer])):
+                    data[index].update(update)
+            return {'data': data}
+        
+        # Patching only the changed layers (as the map-tick callback does) onto
+        # the old figure gives the same data as rebuilding it from scratch
+        patch = Patch()
+        for layer in ('fires', 'tasks'):
+            for index, update in zip(MAP_LAYER_SLOTS[layer], MAP_LAYER_BUILDERS[layer](new_rows[layer])):
+                patch['data'][index].update(update)
+        figure = full_figure(old_rows)
+        for operation in patch.to_plotly_json()['operations']:
+            if operation['operation'] != 'Merge':
+                print(f"  [FAIL] Unexpected patch operation {operation['operation']}")
+                return False
+            target = figure
+            for key in operation['location']:
+                target = target[key]
+            target.update(operation['params']['value'])
+        if figure != full_figure(new_rows):
+            print(f"  [FAIL] Patched figure differs from a full rebuild")
+            return False
+        
+        print(f"  [OK] Patching changed layers into {len(slots)} fixed slots matches a full rebuild")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def _temp_config(tmp_dir):
+    """Copy of dfs_config.yaml pointing at a throwaway database in tmp_dir"""
+    with open('config/dfs_config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    
+    config['database']['path'] = os.path.join(tmp_dir, 'dfs.db')
+    config_path = os.path.join(tmp_dir, 'dfs_config.yaml')
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f, default_flow_style=False)
+    return config_path
+
+
+def test_config_cache():
+    """Test the mission areas cache codecs and load_config's mtime cache"""
+    print("\n[TEST] Config Caches")
+    print("-" * 40)
+    
+    try:
+        import json
+        import pickle
+        from datetime import date
+        from pathlib import Path
+        from types import SimpleNamespace
+        import batch_mission
+        from batch_mission import BatchMissionPlanner, _cache_codec
+        from utils.config import load_config
+        
+        config = {'execution': {'mode': 'parallel', 'parallel_max_workers': 3},
+                  'mission_areas': [{'name': 'Area', 'priority': 1, 'altitude_m': 15.24,
+                                     'corners': {'corner_a': {'latitude': 33.2265, 'longitude': -96.8265}}}]}
+        
+        # Every codec round-trips the config; JSON bytes stay plain JSON even through orjson
+        expected_suffix = {'json': '.cache.json', 'pickle': '.cache.pkl',
+                           'msgpack': '.cache.msgpack' if batch_mission.MSGPACK_AVAILABLE else '.cache.json'}
+        for cache_format, suffix in expected_suffix.items():
+            codec_suffix, loads, dumps = _cache_codec(cache_format)
+            if codec_suffix != suffix or loads(dumps(config)) != config:
+                print(f"  [FAIL] {cache_format} codec ({codec_suffix}) doesn't round-trip")
+                return False
+        if json.loads(_cache_codec('json')[2](config)) != config:
+            print(f"  [FAIL] JSON cache isn't readable by the json module")
+            return False
+        print(f"  [OK] Codecs round-trip (orjson: {batch_mission.ORJSON_AVAILABLE}, msgpack: {batch_mission.MSGPACK_AVAILABLE})")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = Path(tmp_dir) / 'areas.yaml'
+            yaml_path.write_text(yaml.dump(config))
+            
+            for cache_format in ('json', 'pickle'):
+                planner = SimpleNamespace(orchestrator=SimpleNamespace(
+                    config={'mission_planning': {'execution': {'cache_format': cache_format}}}))
+                suffix, loads, dumps = _cache_codec(cache_format)
+                cache_path = yaml_path.with_suffix('.yaml' + suffix)
+                past = time.time_ns() - 60 * 10**9
+                os.utime(yaml_path, ns=(past, past))
+                
+                # First load parses and writes the sidecar cache
+                first = BatchMissionPlanner._load_yaml_cached(planner, yaml_path)
+                if first != config or loads(cache_path.read_bytes()) != config:
+                    print(f"  [FAIL] {cache_format}: first load / sidecar cache wrong")
+                    return False
+                
+                # A fresh cache is used as-is...
+                cache_path.write_bytes(dumps(dict(config, marker=cache_format)))
+                if BatchMissionPlanner._load_yaml_cached(planner, yaml_path).get('marker') != cache_format:
+                    print(f"  [FAIL] {cache_format}: fresh cache not used")
+                    return False
+                
+                # ...a stale or corrupt one is ignored and rewritten
+                mtime = cache_path.stat().st_mtime_ns
+                os.utime(yaml_path, ns=(mtime + 10**9, mtime + 10**9))
+                stale = BatchMissionPlanner._load_yaml_cached(planner, yaml_path)
+                cache_path.write_bytes(b'\x00not a cache')
+                os.utime(cache_path, ns=(mtime + 2 * 10**9, mtime + 2 * 10**9))
+                corrupt = BatchMissionPlanner._load_yaml_cached(planner, yaml_path)
+                if stale != config or corrupt != config or loads(cache_path.read_bytes()) != config:
+                    print(f"  [FAIL] {cache_format}: stale or corrupt cache was trusted")
+                    return False
+            
+            # Values JSON can't hold (YAML dates) skip the cache instead of failing
+            dated = dict(config, mission_areas=[dict(config['mission_areas'][0], surveyed=date(2025, 12, 13))])
+            yaml_path.write_text(yaml.dump(dated))
+            json_cache = yaml_path.with_suffix('.yaml.cache.json')
+            json_cache.unlink()
+            planner = SimpleNamespace(orchestrator=SimpleNamespace(config={}))
+            if BatchMissionPlanner._load_yaml_cached(planner, yaml_path) != dated or json_cache.exists():
+                print(f"  [FAIL] Unencodable config was cached or not loaded")
+                return False
+            print(f"  [OK] Sidecar cache used when fresh; stale, corrupt and unencodable caches fall back to YAML")
+            
+            # load_config: parsed once per file version, re-parsed when the mtime changes
+            config_path = os.path.join(tmp_dir, 'dfs.yaml')
+            with open(config_path, 'w') as f:
+                yaml.dump({'version': 1}, f)
+            first = load_config(config_path)
+            if load_config(config_path) is not first:
+                print(f"  [FAIL] load_config re-parsed an unchanged file")
+                return False
+            with open(config_path, 'w') as f:
+                yaml.dump({'version': 2}, f)
+            mtime = os.stat(config_path).st_mtime_ns
+            os.utime(config_path, ns=(mtime + 10**9, mtime + 10**9))
+            if load_config(config_path) != {'version': 2}:
+                print(f"  [FAIL] load_config kept a stale parse after the file changed")
+                return False
+        
+        print(f"  [OK] load_config caches per file and re-parses on mtime change")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_database_batching():
+    """Test session_scope rollback, bulk telemetry inserts and drone pool setup"""
+    print("\n[TEST] Database Batching")
+    print("-" * 40)
+    
+    try:
+        from database import DatabaseManager, Drone, DroneType, DroneState, Telemetry
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = _temp_config(tmp_dir)
+            db = DatabaseManager(config_path)
+            with open(config_path, 'r') as f:
+                pool = yaml.safe_load(f)['drone_pool']
+            
+            # init_drone_pool: one row per configured drone, and idempotent
+            db.init_drone_pool(config_path)
+            db.init_drone_pool(config_path)
+            with db.session_scope() as session:
+                drones = {d.drone_id: (d.drone_type, d.state, d.payload_capacity_kg, d.cruise_altitude_m)
+                          for d in session.query(Drone)}
+            sd, fd = pool['scouter_drones'], pool['firefighter_drones']
+            expected = {f"{sd['prefix']}-{i:03d}": (DroneType.SCOUTER, DroneState.IDLE, None, sd['cruise_altitude_m'])
+                        for i in range(1, sd['count'] + 1)}
+            expected.update({f"{fd['prefix']}-{i:03d}": (DroneType.FIREFIGHTER, DroneState.IDLE,
+                                                         fd['payload_capacity_kg'], fd['cruise_altitude_m'])
+                             for i in range(1, fd['count'] + 1)})
+            if drones != expected:
+                print(f"  [FAIL] Drone pool {sorted(drones)} doesn't match the config")
+                return False
+            print(f"  [OK] init_drone_pool created {sd['count']} SD + {fd['count']} FD drones once")
+            
+            # session_scope: an exception rolls everything in the block back
+            try:
+                with db.session_scope() as session:
+                    session.query(Drone).update({Drone.state: DroneState.MAINTENANCE})
+                    session.add(Drone(drone_id='SD-999', drone_type=DroneType.SCOUTER))
+                    session.flush()
+                    raise RuntimeError('abort')
+            except RuntimeError:
+                pass
+            with db.session_scope() as session:
+                states = {state for (state,) in session.query(Drone.state)}
+                count = session.query(Drone).count()
+            if states != {DroneState.IDLE} or count != len(expected):
+                print(f"  [FAIL] Rolled-back changes persisted: {count} drones, states {states}")
+                return False
+            print(f"  [OK] session_scope rolls back on error")
+            
+            # bulk_add_telemetry: one batch, every row stored; empty batch is a no-op
+            start = datetime(2025, 12, 13, 14, 0, 0)
+            rows = [{'drone_id': 1, 'timestamp': start.replace(second=i), 'latitude': 33.2265 + i * 1e-5,
+                     'longitude': -96.8265, 'altitude': 15.0, 'battery_percent': 100.0 - i}
+                    for i in range(50)]
+            db.bulk_add_telemetry(rows)
+            db.bulk_add_telemetry([])
+            with db.session_scope() as session:
+                stored = session.query(Telemetry.timestamp, Telemetry.latitude, Telemetry.battery_percent) \
+                    .order_by(Telemetry.timestamp).all()
+            if [tuple(r) for r in stored] != [(r['timestamp'], r['latitude'], r['battery_percent']) for r in rows]:
+                print(f"  [FAIL] bulk_add_telemetry stored {len(stored)} of {len(rows)} rows")
+                return False
+            
+            db.engine.dispose()
+        
+        print(f"  [OK] bulk_add_telemetry stored all {len(rows)} rows")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_concurrent_assignment():
+    """Test concurrent task creation/assignment gives distinct tasks and drones"""
+    print("\n[TEST] Concurrent Assignment")
+    print("-" * 40)
+    
+    try:
+        import threading
+        from database import Drone, DroneState
+        from mission_control.orchestrator import MissionOrchestrator
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = _temp_config(tmp_dir)
+            orchestrator = MissionOrchestrator(config_path)
+            db = orchestrator.db_manager
+            db.init_drone_pool(config_path)
+            
+            scouts = orchestrator.config['drone_pool']['scouter_drones']['count']
+            area = {corner: {'latitude': 33.2265, 'longitude': -96.8265}
+                    for corner in ('corner_a', 'corner_b', 'corner_c', 'corner_d')}
+            
+            # Same create -> assign sequence batch_mission runs per mission,
+            # one thread per scouter, all released at once
+            for round_num in range(3):
+                start = threading.Barrier(scouts)
+                results = []
+                
+                def run_mission():
+                    start.wait()
+                    task = orchestrator.create_scout_task(area)
+                    drone = orchestrator.assign_task_to_drone(task['task_id'])
+                    results.append((task['task_id'], drone['drone_id'] if drone else None))
+                
+                threads = [threading.Thread(target=run_mission) for _ in range(scouts)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                
+                task_ids = [task_id for task_id, _ in results]
+                drone_ids = [drone_id for _, drone_id in results]
+                if len(results) != scouts or len(set(task_ids)) != scouts:
+                    print(f"  [FAIL] Round {round_num + 1}: task ids {sorted(task_ids)}")
+                    return False
+                if None in drone_ids or len(set(drone_ids)) != scouts:
+                    print(f"  [FAIL] Round {round_num + 1}: drones {sorted(map(str, drone_ids))}")
+                    return False
+                
+                # Free the fleet for the next round
+                with db.session_scope() as session:
+                    session.query(Drone).update({Drone.state: DroneState.IDLE})
+            
+            db.engine.dispose()
+        
+        print(f"  [OK] {scouts} concurrent missions x 3 rounds: distinct task ids and drones")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_concurrent_dispatch():
+    """Test concurrent fire detections dispatch each firefighter at most once"""
+    print("\n[TEST] Concurrent Dispatch")
+    print("-" * 40)
+    
+    try:
+        import threading
+        from database import Drone, DroneType, FireDetection
+        from mission_control.orchestrator import MissionOrchestrator
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = _temp_config(tmp_dir)
+            orchestrator = MissionOrchestrator(config_path)
+            db = orchestrator.db_manager
+            db.init_drone_pool(config_path)
+            
+            firefighters = orchestrator.config['drone_pool']['firefighter_drones']['count']
+            area = {corner: {'latitude': 33.2265, 'longitude': -96.8265}
+                    for corner in ('corner_a', 'corner_b', 'corner_c', 'corner_d')}
+            scout_tasks = [orchestrator.create_scout_task(area)['task_id'] for _ in range(firefighters + 1)]
+            
+            # One more fire than there are firefighters, all reported at once
+            start = threading.Barrier(len(scout_tasks))
+            
+            def detect(task_id):
+                start.wait()
+                orchestrator.register_fire_detection(task_id, 'SD-001', 33.2266, -96.8264, 65.0, 0.9)
+            
+            threads = [threading.Thread(target=detect, args=(task_id,)) for task_id in scout_tasks]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            with db.session_scope() as session:
+                detections = [detection_id for (detection_id,) in session.query(FireDetection.detection_id)]
+                dispatched = [fd for (fd,) in session.query(FireDetection.dispatched_fd_id)
+                              .filter(FireDetection.status == 'dispatched')]
+                waiting = session.query(FireDetection).filter(FireDetection.status == 'detected').count()
+                fd_ids = {drone.id for drone in session.query(Drone).filter(Drone.drone_type == DroneType.FIREFIGHTER)}
+            db.engine.dispose()
+        
+        if len(set(detections)) != len(scout_tasks):
+            print(f"  [FAIL] Detection ids {sorted(detections)}")
+            return False
+        if sorted(dispatched) != sorted(fd_ids) or waiting != 1:
+            print(f"  [FAIL] Dispatched FDs {sorted(dispatched)}, {waiting} waiting")
+            return False
+        
+        print(f"  [OK] {len(scout_tasks)} simultaneous fires: each of {firefighters} FDs dispatched once, 1 waiting")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_dispatch_wait():
+    """Test FD dispatch waits settle without leaving per-task events behind"""
+    print("\n[TEST] FD Dispatch Wait")
+    print("-" * 40)
+    
+    try:
+        import threading
+        from mission_control.orchestrator import MissionOrchestrator
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = _temp_config(tmp_dir)
+            orchestrator = MissionOrchestrator(config_path)
+            orchestrator.db_manager.init_drone_pool(config_path)
+            area = {corner: {'latitude': 33.2265, 'longitude': -96.8265}
+                    for corner in ('corner_a', 'corner_b', 'corner_c', 'corner_d')}
+            
+            def detect(task_id):
+                orchestrator.register_fire_detection(task_id, 'SD-001', 33.2266, -96.8264, 65.0, 0.9)
+            
+            # Waiter first: woken by the detection, entry removed
+            waited_task = orchestrator.create_scout_task(area)['task_id']
+            results = []
+            waiter = threading.Thread(target=lambda: results.append(
+                orchestrator.wait_for_fd_dispatch(waited_task, timeout=10)))
+            waiter.start()
+            while waited_task not in orchestrator._dispatch_events:
+                time.sleep(0.01)
+            detect(waited_task)
+            waiter.join()
+            
+            # Detection first, nobody waiting: nothing left behind per task
+            unwaited_tasks = [orchestrator.create_scout_task(area)['task_id'] for _ in range(3)]
+            for task_id in unwaited_tasks:
+                detect(task_id)
+            late_wait = orchestrator.wait_for_fd_dispatch(unwaited_tasks[0], timeout=0)
+            
+            orchestrator.db_manager.engine.dispose()
+        
+        if results != [True] or not late_wait:
+            print(f"  [FAIL] Waits returned {results} / {late_wait}")
+            return False
+        if orchestrator._dispatch_events:
+            print(f"  [FAIL] Leftover dispatch events: {list(orchestrator._dispatch_events)}")
+            return False
+        
+        print(f"  [OK] Early and late waiters see the dispatch; no events left behind")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_mission_areas_parser():
+    """Test the fast mission areas YAML parser matches yaml.safe_load"""
+    print("\n[TEST] Mission Areas Parser")
+    print("-" * 40)
+    
+    try:
+        import glob
+        import io
+        from batch_mission import (_CONFIG_SECTIONS, _SchemaMismatch,
+                                   _load_mission_areas_yaml, _parse_mission_areas)
+        
+        def expected(text):
+            full = yaml.safe_load(text)
+            return {key: value for key, value in full.items() if key in _CONFIG_SECTIONS}
+        
+        # repr() so 1 / 1.0 / True and str / date mismatches aren't hidden by ==
+        fast = 0
+        config_files = sorted(glob.glob(os.path.join(PROJECT_DIR, 'config', '*.yaml')))
+        for path in config_files:
+            with open(path, 'r') as f:
+                text = f.read()
+            try:
+                parsed = _parse_mission_areas(io.StringIO(text))
+                fast += 1
+            except _SchemaMismatch:
+                parsed = None
+            loaded = _load_mission_areas_yaml(io.StringIO(text))
+            if repr(loaded) != repr(expected(text)) or parsed not in (None, loaded):
+                print(f"  [FAIL] {os.path.basename(path)} differs from yaml.safe_load")
+                return False
+        print(f"  [OK] {len(config_files)} config files match yaml.safe_load ({fast} on the fast path)")
+        
+        area = """
+  - name: Area
+    priority: 1
+    enabled: yes
+    altitude_m: 15.0
+    surveyed: 2024-06-01
+    notes: '0x10'
+    corners:
+      corner_a: {latitude: 33.2265, longitude: -96.8265}
+"""
+        # Inputs outside the known shape must leave the fast path and still
+        # come out exactly as yaml.safe_load sees them
+        fallbacks = {
+            'anchor': "execution: &exec {mode: parallel}\nother: *exec\nmission_areas:" + area,
+            'merge key': "mission_areas:\n  - &base {name: A, priority: 1}\n  - {<<: *base, name: B}\n",
+            'tag': "execution:\n  mode: !!str 1\nmission_areas:" + area,
+            'nested value': "mission_areas:\n  - name: A\n    tags: [a, b]\n",
+            'unknown section': "dashboard: {port: 8050}\nmission_areas:" + area,
+        }
+        for name, text in [('plain', "execution: {mode: parallel, parallel_max_workers: 2}\nmission_areas:" + area),
+                           *fallbacks.items()]:
+            try:
+                _parse_mission_areas(io.StringIO(text))
+                on_fast_path = True
+            except _SchemaMismatch:
+                on_fast_path = False
+            if on_fast_path != (name == 'plain'):
+                print(f"  [FAIL] {name}: fast path {'taken' if on_fast_path else 'skipped'}")
+                return False
+            if repr(_load_mission_areas_yaml(io.StringIO(text))) != repr(expected(text)):
+                print(f"  [FAIL] {name}: differs from yaml.safe_load")
+                return False
+        
+        # Multiple documents are an error for both loaders
+        try:
+            _load_mission_areas_yaml(io.StringIO("execution: {}\n---\nmission_areas: []\n"))
+            print(f"  [FAIL] Multi-document file was accepted")
+            return False
+        except yaml.YAMLError:
+            pass
+        
+        print(f"  [OK] Fallbacks ({', '.join(fallbacks)}, multiple documents) match yaml.safe_load")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def _sim_config(tmp_dir, name, hotspots=(), **simulation):
+    """Field-test simulation config (as the SD executor builds it) written to tmp_dir"""
+    config = {
+        'drone': {'cruise_altitude_m': 15.24},
+        'thermal_camera': {
+            'resolution': {'width': 32, 'height': 24},
+            'coverage_at_altitude': {'width_m': 34.8, 'height_m': 23.2},
+            'noise_c': 0.5
+        },
+        'hotspots': {'ambient_temperature_c': [15, 17], 'locations': list(hotspots)},
+        'environment': {
+            'dht22': {
+                'temperature_range_c': [11, 13], 'temperature_variation_c': 0.1,
+                'humidity_percent': [40, 50], 'humidity_variation': 0.15,
+                'accuracy_temp_c': 0.10, 'accuracy_humidity': 0.15
+            },
+            'bmp280': {
+                'pressure_hpa': 995.0, 'pressure_variation': 0.5, 'temperature_c': 34.0,
+                'accuracy_pressure': 0.12, 'accuracy_altitude': 1.0
+            }
+        },
+        'data_collection': {'thermal_interval_sec': 1, 'environment_interval_sec': 2},
+        'simulation': {
+            'add_thermal_noise': True,
+            'thermal_frame_skip_probability': 0.0,
+            'environment_read_error_probability': 0.0,
+            'random_seed': 7,
+            **simulation
+        }
+    }
+    
+    # One file per config - load_config caches by path and mtime
+    config_path = os.path.join(tmp_dir, f'{name}.yaml')
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f, default_flow_style=False)
+    return config_path
+
+
+def _synthetic_gps(seconds):
+    """GPS telemetry frame with one fix at each of the given second offsets"""
+    import pandas as pd
+    from datetime import timedelta
+    
+    start = datetime(2025, 12, 13, 14, 0, 0)
+    return pd.DataFrame({
+        'timestamp': [(start + timedelta(seconds=t)).isoformat() for t in seconds],
+        'latitude': [33.2265 + 1e-5 * i for i in range(len(seconds))],
+        'longitude': [-96.8265] * len(seconds),
+        'altitude': [15.0 + 0.1 * i for i in range(len(seconds))],
+        'heading': [0.0] * len(seconds)
+    })
+
+
+def test_environment_generator():
+    """Test environment capture rows and read-error handling on a fixed seed"""
+    print("\n[TEST] Environment Generator")
+    print("-" * 40)
+    
+    try:
+        from field_testing_simulated.environment_generator import EnvironmentGenerator
+        
+        # 1 Hz fixes with a GPS dropout from 10 s to 14 s
+        seconds = [t for t in range(30) if not 10 <= t <= 14]
+        gps = _synthetic_gps(seconds)
+        row_of = {ts: i for i, ts in enumerate(gps['timestamp'])}
+        interval = 2
+        values = ['temperature', 'humidity', 'pressure', 'baro_altitude', 'baro_temperature']
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            def generate(name, **simulation):
+                generator = EnvironmentGenerator(_sim_config(tmp_dir, name, **simulation))
+                return generator.generate_environment_data(gps, os.path.join(tmp_dir, f'{name}.csv'))
+            
+            # No read errors: every interval, resuming at the first fix after the dropout
+            clean = generate('clean')
+            captured = [seconds[row_of[ts]] for ts in clean['timestamp']]
+            if captured != [0, 2, 4, 6, 8, 15, 17, 19, 21, 23, 25, 27, 29] or (clean['mode'] != 'simulated').any():
+                print(f"  [FAIL] Clean captures at {captured}")
+                return False
+            print(f"  [OK] Captures every {interval}s, resuming after the GPS dropout")
+            
+            # Sub-second fixes: whole seconds come without a fraction in isoformat()
+            fast_gps = _synthetic_gps([k / 4 for k in range(20)])
+            fast = EnvironmentGenerator(_sim_config(tmp_dir, 'fast')).generate_environment_data(
+                fast_gps, os.path.join(tmp_dir, 'fast.csv'))
+            if list(fast['timestamp']) != ['2025-12-13T14:00:00', '2025-12-13T14:00:02', '2025-12-13T14:00:04']:
+                print(f"  [FAIL] 4 Hz captures at {list(fast['timestamp'])}")
+                return False
+            
+            # Only read errors: there is never a good reading to repeat
+            if len(generate('all_errors', environment_read_error_probability=1.0)):
+                print(f"  [FAIL] Read errors produced rows with no prior good reading")
+                return False
+            
+            noisy = generate('noisy', environment_read_error_probability=0.4)
+            again = generate('noisy_again', environment_read_error_probability=0.4)
+            if not noisy.equals(again):
+                print(f"  [FAIL] Same seed gave different readings")
+                return False
+            
+            rows = [row_of[ts] for ts in noisy['timestamp']]
+            errors = (noisy['mode'] == 'unknown').tolist()
+            if errors[0] or not any(errors):
+                print(f"  [FAIL] Unexpected error pattern {errors}")
+                return False
+            
+            for k in range(1, len(rows)):
+                prev_row, row = rows[k - 1], rows[k]
+                if errors[k - 1]:
+                    # A read error retries on the very next fix
+                    expected_row = prev_row + 1
+                else:
+                    expected_row = next(i for i, t in enumerate(seconds) if t >= seconds[prev_row] + interval)
+                if row != expected_row:
+                    print(f"  [FAIL] Capture {k} at fix {row}, expected {expected_row}")
+                    return False
+                if errors[k] and not (noisy.loc[k, values] == noisy.loc[k - 1, values]).all():
+                    print(f"  [FAIL] Read error at fix {row} doesn't repeat the last good reading")
+                    return False
+        
+        print(f"  [OK] {sum(errors)} read errors repeat the last good reading and retry on the next fix")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
+def test_thermal_generator():
+    """Test thermal frame capture timing and contents on a fixed seed"""
+    print("\n[TEST] Thermal Generator")
+    print("-" * 40)
+    
+    try:
+        import glob
+        import numpy as np
+        from field_testing_simulated.thermal_generator import ThermalGenerator
+        
+        # 10 Hz fixes (sub-second timestamps) with a dropout from 4 s to 6 s
+        seconds = [k / 10 for k in range(100) if not 40 <= k < 60]
+        gps = _synthetic_gps(seconds)
+        hotspot = {'latitude': float(gps['latitude'][0]), 'longitude': float(gps['longitude'][0]),
+                   'temperature_c': [300, 400], 'size_pixels': [3, 3], 'intensity': 0.9}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            def generate(name, **kwargs):
+                """(frames, capture offsets in seconds from the CSV headers, output dir)"""
+                generator = ThermalGenerator(_sim_config(tmp_dir, name, **kwargs))
+                out_dir = os.path.join(tmp_dir, name)
+                count = generator.generate_thermal_data(gps, out_dir, name)
+                frames = [np.load(path) for path in sorted(glob.glob(os.path.join(out_dir, '*.npy')))]
+                times = []
+                for path in sorted(glob.glob(os.path.join(out_dir, '*.csv'))):
+                    with open(path) as f:
+                        stamp = next(line for line in f if line.startswith('# Timestamp:,'))
+                    offset = datetime.fromisoformat(stamp.split(',', 1)[1].strip()) - datetime(2025, 12, 13, 14, 0, 0)
+                    times.append(round(offset.total_seconds(), 1))
+                if count != len(frames) or count != len(times):
+                    raise AssertionError(f"{count} frames reported, {len(frames)} NPY / {len(times)} CSV files")
+                return frames, times, out_dir
+            
+            # One frame per whole second, resuming on the first fix after the dropout
+            frames, times, out_dir = generate('clean', hotspots=[hotspot])
+            if times != [0.0, 1.0, 2.0, 3.0, 6.0, 7.0, 8.0, 9.0]:
+                print(f"  [FAIL] Frames at {times}")
+                return False
+            print(f"  [OK] {len(frames)} frames, one per second, resuming after the GPS dropout")
+            
+            # CSV copy holds the same 24x32 frame as the NPY one
+            csv_path = sorted(glob.glob(os.path.join(out_dir, '*.csv')))[0]
+            csv_frame = np.loadtxt(csv_path, delimiter=',', comments='#')
+            if frames[0].shape != (24, 32) or not np.allclose(csv_frame, frames[0], atol=0.005):
+                print(f"  [FAIL] Frame shape {frames[0].shape} / CSV mismatch")
+                return False
+            
+            # Hotspot under the first fix; background stays near ambient
+            if frames[0].max() < 50 or frames[-1].max() > 25:
+                print(f"  [FAIL] Max temps {frames[0].max():.1f} (hotspot) / {frames[-1].max():.1f} (background)")
+                return False
+            print(f"  [OK] Hotspot frame peaks at {frames[0].max():.1f}C, background at {frames[-1].max():.1f}C")
+            
+            repeat, _, _ = generate('clean_again', hotspots=[hotspot])
+            if len(repeat) != len(frames) or not all(np.array_equal(a, b) for a, b in zip(frames, repeat)):
+                print(f"  [FAIL] Same seed gave different frames")
+                return False
+            
+            if generate('all_skipped', thermal_frame_skip_probability=1.0)[0]:
+                print(f"  [FAIL] Frames captured with every frame skipped")
+                return False
+            
+            # A skipped frame is retried on the next fix, not a full interval later
+            _, skipped, _ = generate('skipped', thermal_frame_skip_probability=0.5)
+            gaps = [b - a for a, b in zip(skipped, skipped[1:])]
+            if not skipped or min(gaps) < 0.99 or all(t == int(t) for t in skipped):
+                print(f"  [FAIL] Frames with skips at {skipped}")
+                return False
+        
+        print(f"  [OK] Same seed reproduces frames; skipped frames retry on the next fix")
+        return True
+    except Exception as e:
+        print(f"  [FAIL] {e}")
+        return False
+
+
 def test_simulation():
     """Test full simulation with camera and ML"""
     print("\n[TEST] Simulation (SD + FD)")
@@ -339,6 +1210,17 @@ def main():
     results['config'] = test_config()
     results['database'] = test_database()
     results['controller'] = test_controller()
+    results['ruler_accuracy'] = test_ruler_accuracy()
+    results['geomath'] = test_geomath()
+    results['dashboard_map_updates'] = test_dashboard_map_updates()
+    results['config_cache'] = test_config_cache()
+    results['database_batching'] = test_database_batching()
+    results['concurrent_assignment'] = test_concurrent_assignment()
+    results['concurrent_dispatch'] = test_concurrent_dispatch()
+    results['dispatch_wait'] = test_dispatch_wait()
+    results['mission_areas_parser'] = test_mission_areas_parser()
+    results['environment_generator'] = test_environment_generator()
+    results['thermal_generator'] = test_thermal_generator()
     
     # Optional tests
     if args.simulation or args.all:
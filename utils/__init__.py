@@ -2,5 +2,6 @@
 Utility modules for DFS
 """
 from .logger import get_logger, setup_logging, DFSLogger
+from .config import load_config
 
-__all__ = ['get_logger', 'setup_logging', 'DFSLogger']
+__all__ = ['get_logger', 'setup_logging', 'DFSLogger', 'load_config']
@@ -0,0 +1,24 @@
+"""
+Shared config loading for DFS
+Each YAML config file is parsed once (until it changes) with the libyaml loader
+"""
+import os
+from functools import lru_cache
+
+import yaml
+
+# CSafeLoader needs PyYAML built against libyaml; fall back to pure Python
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def load_config(config_path):
+    """Return the parsed config for config_path (cached; treat as read-only)"""
+    # The mtime is part of the cache key, so an edited file is re-parsed
+    abs_path = os.path.abspath(config_path)
+    return _load_config(abs_path, os.stat(abs_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config(abs_path, mtime_ns):
+    with open(abs_path, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
@@ -2,9 +2,11 @@
 Centralized logging utility for DFS
 Provides consistent logging across all modules with configurable levels
 """
+import contextvars
 import logging
+import logging.handlers
+import queue
 import sys
-import threading
 from pathlib import Path
 from typing import Optional
 
@@ -12,16 +14,21 @@ from typing import Optional
 class ContextFilter(logging.Filter):
     """Add contextual information to log records"""
     def filter(self, record):
-        # Get context from thread-local storage
-        context = getattr(_context, 'data', {})
+        # Already stamped by the QueueHandler in the producing thread
+        if hasattr(record, 'task_id'):
+            return True
+        
+        # Get context for the current thread/task
+        context = _context.get()
         record.task_id = context.get('task_id', '')
         record.drone_id = context.get('drone_id', '')
         record.module = context.get('module', '')
         return True
 
 
-# Thread-local storage for context
-_context = threading.local()
+# Per-thread (and per-asyncio-task) logging context; values are never mutated
+# in place, so readers need no locking
+_context: contextvars.ContextVar[dict] = contextvars.ContextVar('dfs_log_context', default={})
 
 
 class DFSLogger:
@@ -29,6 +36,7 @@ class DFSLogger:
     
     _instance = None
     _initialized = False
+    _listener = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -95,22 +103,64 @@ class DFSLogger:
         file_handler.setFormatter(formatter)
         self.logger.addHandler(file_handler)
     
-    def set_context(self, task_id: str = None, drone_id: str = None, module: str = None):
-        """Set logging context for current thread"""
-        if not hasattr(_context, 'data'):
-            _context.data = {}
+    def start_queue_listener(self):
+        """
+        Route records through a queue drained by a background thread
+        
+        Callers only enqueue, so worker threads never block on handler
+        locks or stdout while a listener is running.
+        """
+        if self._listener is not None:
+            return
+        
+        handlers = list(self.logger.handlers)
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        # Stamp context here, in the caller's thread, before the record is queued
+        queue_handler.addFilter(ContextFilter())
+        
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(queue_handler)
+        
+        DFSLogger._listener = logging.handlers.QueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        DFSLogger._listener.start()
+    
+    def stop_queue_listener(self):
+        """Flush queued records and restore direct handlers"""
+        listener = self._listener
+        if listener is None:
+            return
+        
+        listener.stop()
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.logger.removeHandler(handler)
+        for handler in listener.handlers:
+            self.logger.addHandler(handler)
+        DFSLogger._listener = None
+    
+    def set_context(self, task_id: str = None, drone_id: str = None, module: str = None) -> contextvars.Token:
+        """Set logging context for current thread; returns a token for reset_context()"""
+        data = dict(_context.get())
         
         if task_id is not None:
-            _context.data['task_id'] = f"[{task_id}]" if task_id else ''
+            data['task_id'] = f"[{task_id}]" if task_id else ''
         if drone_id is not None:
-            _context.data['drone_id'] = f"[{drone_id}]" if drone_id else ''
+            data['drone_id'] = f"[{drone_id}]" if drone_id else ''
         if module is not None:
-            _context.data['module'] = f"[{module}]" if module else ''
+            data['module'] = f"[{module}]" if module else ''
+        
+        return _context.set(data)
+    
+    def reset_context(self, token: contextvars.Token):
+        """Restore the context that was active before the matching set_context()"""
+        _context.reset(token)
     
     def clear_context(self):
         """Clear logging context for current thread"""
-        if hasattr(_context, 'data'):
-            _context.data = {}
+        _context.set({})
     
     def debug(self, msg: str, task_id: str = None, drone_id: str = None, module: str = None):
         """Log debug message"""